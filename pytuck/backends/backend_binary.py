@@ -31,6 +31,12 @@ from ..common.crypto import (
 )
 
 
+# 数据区记录编码使用的预编译结构
+_UINT16 = struct.Struct('<H')
+_UINT32 = struct.Struct('<I')
+_FIELD_HEAD = struct.Struct('<HB')  # 列索引 + 类型码
+
+
 # ============== 索引值反序列化函数 ==============
 
 def _deserialize_short_str(data: bytes) -> str:
@@ -345,11 +351,35 @@ class BinaryBackend(StorageBackend):
         self._current_lsn: int = 0
         self._file_handle: Optional[BinaryIO] = None
 
+        # 最近一次派生的密钥 (password, salt, level, key)，随后端实例释放
+        self._derived_key: Optional[Tuple[str, bytes, str, bytes]] = None
+
         # WAL 缓冲（减少 I/O 次数）
         self._wal_buffer: List[WALEntry] = []
         self._wal_buffer_size: int = 0  # 缓冲区字节大小
         self._wal_flush_threshold: int = 32 * 1024  # 32KB 阈值
 
+    def _derive_key(self, password: str, salt: bytes, level: str) -> bytes:
+        """
+        派生密钥，复用本实例最近一次的派生结果
+
+        保存时盐随机生成，同一实例随后重新加载该文件时无需重复迭代哈希。
+
+        Args:
+            password: 用户密码
+            salt: 随机盐（16字节）
+            level: 加密等级
+
+        Returns:
+            32字节密钥
+        """
+        cached = self._derived_key
+        if cached is not None and cached[:3] == (password, salt, level):
+            return cached[3]
+        key = CryptoProvider.derive_key(password, salt, level)
+        self._derived_key = (password, salt, level, key)
+        return key
+
     def save(self, tables: Dict[str, 'Table']) -> None:
         """保存所有表数据到二进制文件（v4 格式：双Header + 增量写入支持）"""
         # 清空 WAL 缓冲区（checkpoint 会包含所有数据）
@@ -389,7 +419,7 @@ class BinaryBackend(StorageBackend):
 
             # 生成随机盐并派生密钥
             salt = os.urandom(16)
-            key = CryptoProvider.derive_key(self.options.password, salt, encryption_level)
+            key = self._derive_key(self.options.password, salt, encryption_level)
             key_check = CryptoProvider.compute_key_check(key)
             cipher = get_cipher(encryption_level, key)
 
@@ -558,9 +588,7 @@ class BinaryBackend(StorageBackend):
                 raise EncryptionError("无法识别加密等级")
 
             # 派生密钥
-            key = CryptoProvider.derive_key(
-                self.options.password, header.salt, encryption_level
-            )
+            key = self._derive_key(self.options.password, header.salt, encryption_level)
 
             # 验证密钥
             if not CryptoProvider.verify_key(key, header.key_check):
@@ -611,10 +639,11 @@ class BinaryBackend(StorageBackend):
                     table = self._read_table_data(data_stream, schema, index_data)
                     tables[table.name] = table
             else:
-                # 完整加载模式
+                # 完整加载模式：整个数据区一次读入内存再逐条解析，避免逐条记录读文件
                 f.seek(header.data_offset)
+                data_stream = io.BytesIO(f.read(header.data_size))
                 for schema in tables_schema:
-                    table = self._read_table_data(f, schema, index_data)
+                    table = self._read_table_data(data_stream, schema, index_data)
                     tables[table.name] = table
 
         return tables
@@ -1137,65 +1166,58 @@ class BinaryBackend(StorageBackend):
         pk_offsets: Dict[Any, int] = {}
 
         # Record Count
-        f.write(struct.pack('<I', len(table.data)))
+        f.write(_UINT32.pack(len(table.data)))
 
-        # 预先构建列名到索引的映射和编解码器缓存
-        col_idx_map = {name: idx for idx, name in enumerate(table.columns.keys())}
-
-        # 缓存编解码器（避免重复查找）
-        codec_cache: Dict[str, tuple] = {}
+        # 每列预先打包好的字段头：NULL 为 列索引 + 0xFF 00，非 NULL 为 列索引 + 类型码，
+        # 后接编解码器（避免逐字段查找与打包）
+        field_cache: Dict[str, Tuple[bytes, bytes, Any]] = {}
         pk_codec = None
-        for col in table.columns.values():
+        for col_idx, col in enumerate(table.columns.values()):
             assert col.name is not None, "Column name must be set"
             type_code, codec = TypeRegistry.get_codec(col.col_type)
-            codec_cache[col.name] = (type_code, codec)
+            field_cache[col.name] = (
+                _UINT16.pack(col_idx) + b'\xff\x00',
+                _FIELD_HEAD.pack(col_idx, type_code),
+                codec,
+            )
             if col.primary_key:
                 pk_codec = codec
 
-        # 批量写入缓冲区
+        # 批量写入缓冲区：记录直接写入，记录长度先占位、写完后回填
         buf = bytearray()
         base_offset = f.tell()
-        buf_offset = 0
 
         # Records（使用批量缓冲）
         for pk, record in table.data.items():
-            pk_offsets[pk] = base_offset + buf_offset
-
-            # 构建单条记录
-            record_data = bytearray()
+            start = len(buf)
+            pk_offsets[pk] = base_offset + start
+            buf += b'\x00\x00\x00\x00'
 
             # Primary Key
             if pk_codec:
-                pk_bytes = pk_codec.encode(pk)
-                record_data.extend(pk_bytes)
+                buf += pk_codec.encode(pk)
 
             # Field Count
-            record_data.extend(struct.pack('<H', len(record)))
+            buf += _UINT16.pack(len(record))
 
             # Fields
             for col_name, value in record.items():
-                col_idx = col_idx_map[col_name]
-                record_data.extend(struct.pack('<H', col_idx))
-
+                null_head, value_head, codec = field_cache[col_name]
                 if value is None:
-                    record_data.extend(b'\xff\x00')  # NULL: type=0xFF, len=0
+                    buf += null_head  # NULL: type=0xFF, len=0
                 else:
-                    type_code, codec = codec_cache[col_name]
                     value_bytes = codec.encode(value)
-                    record_data.extend(struct.pack('<BI', type_code, len(value_bytes)))
-                    record_data.extend(value_bytes)
+                    buf += value_head
+                    buf += _UINT32.pack(len(value_bytes))
+                    buf += value_bytes
 
-            # 添加到缓冲区
-            record_len = len(record_data)
-            buf.extend(struct.pack('<I', record_len))
-            buf.extend(record_data)
-            buf_offset += 4 + record_len
+            # 回填记录长度
+            _UINT32.pack_into(buf, start, len(buf) - start - 4)
 
             # 缓冲区超过 1MB 时刷新
             if len(buf) > 1024 * 1024:
                 f.write(buf)
                 base_offset = f.tell()
-                buf_offset = 0
                 buf.clear()
 
         # 写入剩余数据
@@ -1247,14 +1269,14 @@ class BinaryBackend(StorageBackend):
         record_count_bytes = f.read(4)
         if len(record_count_bytes) < 4:
             raise SerializationError(f"读取表 {table_name} 的记录数失败：文件意外结束")
-        record_count = struct.unpack('<I', record_count_bytes)[0]
+        record_count = _UINT32.unpack(record_count_bytes)[0]
 
         for _ in range(record_count):
             # Record Length
             rec_len_bytes = f.read(4)
             if len(rec_len_bytes) < 4:
                 raise SerializationError(f"读取表 {table_name} 的记录长度失败：文件意外结束")
-            record_len = struct.unpack('<I', rec_len_bytes)[0]
+            record_len = _UINT32.unpack(rec_len_bytes)[0]
 
             # Record Data
             record_data = f.read(record_len)
@@ -1270,15 +1292,15 @@ class BinaryBackend(StorageBackend):
                 pk, consumed = pk_codec.decode(record_data[pos:])
                 pos += consumed
 
-            # Field Count
-            field_count = struct.unpack('<H', record_data[pos:pos+2])[0]
+            # Field Count（unpack_from 直接按偏移读取，不切片复制）
+            field_count = _UINT16.unpack_from(record_data, pos)[0]
             pos += 2
 
             # Fields
             record: Dict[str, Any] = {}
             for _ in range(field_count):
                 # Column Index
-                col_idx = struct.unpack('<H', record_data[pos:pos+2])[0]
+                col_idx = _UINT16.unpack_from(record_data, pos)[0]
                 pos += 2
 
                 # Type Code
@@ -1291,7 +1313,7 @@ class BinaryBackend(StorageBackend):
                     value = None
                 else:
                     # Value Length
-                    value_len = struct.unpack('<I', record_data[pos:pos+4])[0]
+                    value_len = _UINT32.unpack_from(record_data, pos)[0]
                     pos += 4
                     value_bytes = record_data[pos:pos+value_len]
                     pos += value_len
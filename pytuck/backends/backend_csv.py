@@ -27,6 +27,11 @@ if TYPE_CHECKING:
 _CSV_FIELD_SIZE_LOCK = threading.Lock()
 
 
+def _is_encrypted(zf: zipfile.ZipFile) -> bool:
+    """ZIP 中是否有成员设置了加密标志位"""
+    return any(info.flag_bits & 0x1 for info in zf.infolist())
+
+
 class CSVBackend(StorageBackend):
     """CSV format storage engine (ZIP-based, Excel compatible)"""
 
@@ -120,7 +125,7 @@ class CSVBackend(StorageBackend):
         try:
             with zipfile.ZipFile(str(self.file_path), 'r') as zf:
                 # 检测是否加密
-                encrypted = any((info.flag_bits & 0x1) != 0 for info in zf.infolist())
+                encrypted = _is_encrypted(zf)
 
                 if encrypted:
                     if not self.options.password:
@@ -128,12 +133,16 @@ class CSVBackend(StorageBackend):
                             "CSV archive is encrypted. Please provide password in CsvBackendOptions."
                         )
                     pwd = self.options.password.encode('utf-8')
+                    self._verify_password(zf, pwd)
                 else:
                     pwd = None
 
+                # 中央目录在打开 ZipFile 时已解析，成员名列表只构建一次
+                names = zf.namelist()
+
                 # 读取元数据
                 metadata: Dict[str, Any] = {}
-                if '_metadata.json' in zf.namelist():
+                if '_metadata.json' in names:
                     with zf.open('_metadata.json', pwd=pwd) as f:
                         metadata = json.load(f)
 
@@ -142,7 +151,7 @@ class CSVBackend(StorageBackend):
 
                 # 找到所有CSV文件
                 tables = {}
-                csv_files = [name for name in zf.namelist() if name.endswith('.csv') and not name.startswith('_')]
+                csv_files = [name for name in names if name.endswith('.csv') and not name.startswith('_')]
 
                 for csv_file in csv_files:
                     table_name = csv_file[:-4]  # 移除 .csv
@@ -162,6 +171,24 @@ class CSVBackend(StorageBackend):
         except Exception as e:
             raise SerializationError(f"Failed to load CSV archive: {e}")
 
+    @staticmethod
+    def _verify_password(zf: zipfile.ZipFile, pwd: bytes) -> None:
+        """
+        在解压任何数据前校验密码
+
+        zipfile 打开 ZipCrypto 成员时只解密 12 字节加密头并比对校验字节，
+        不读取也不解压数据体。逐个成员校验，误判概率随成员数按 1/256 递减。
+
+        Raises:
+            EncryptionError: 密码错误时
+        """
+        for info in zf.infolist():
+            if info.flag_bits & 0x1:
+                try:
+                    zf.open(info, pwd=pwd).close()
+                except RuntimeError:
+                    raise EncryptionError("Incorrect password for CSV archive.")
+
     def exists(self) -> bool:
         """检查文件是否存在"""
         return self.file_path.exists()
@@ -272,21 +299,50 @@ class CSVBackend(StorageBackend):
         table: 'Table',
         pwd: Optional[bytes]
     ) -> None:
-        """实际执行 CSV 读取并填充表数据"""
+        """
+        实际执行 CSV 读取并填充表数据
+
+        成员以流方式解密解压并逐行解析，不会把整个 CSV 读入内存。
+        newline='' 把换行交给 csv 模块处理，保留字段内的 \r\n 和 \r。
+        """
         with zf.open(csv_file, pwd=pwd) as f:
             encoding = self.options.encoding
-            text_stream = io.TextIOWrapper(f, encoding=encoding)
-            reader = csv.DictReader(text_stream, delimiter=self.options.delimiter)
+            text_stream = io.TextIOWrapper(f, encoding=encoding, newline='')
+            reader = csv.reader(text_stream, delimiter=self.options.delimiter)
+            fieldnames = next(reader, None)
+            if fieldnames is None:
+                return
 
             # 检查主键列是否存在于 CSV header 中（仅当有主键时）
-            if table.primary_key and reader.fieldnames and table.primary_key not in reader.fieldnames:
+            if table.primary_key and fieldnames and table.primary_key not in fieldnames:
                 raise SerializationError(
                     f"CSV 文件 '{csv_file}' 缺少主键列 '{table.primary_key}'，"
-                    f"可用列: {reader.fieldnames}"
+                    f"可用列: {fieldnames}"
                 )
 
-            for idx, row_data in enumerate(reader):
-                record = self._deserialize_record(row_data, table.columns)
+            # 每列的反序列化函数只解析一次，逐行按位置取值
+            fields = [
+                (i, name, TypeRegistry.get_text_deserializer(table.columns[name].col_type))
+                for i, name in enumerate(fieldnames)
+                if name in table.columns
+            ]
+
+            idx = 0
+            for row in reader:
+                if not row:
+                    continue
+                width = len(row)
+                record: Dict[str, Any] = {}
+                for i, name, deserializer in fields:
+                    # 行比表头短时缺失的列视为空值
+                    value = row[i] if i < width else ''
+                    if value == '':
+                        record[name] = None
+                    elif deserializer is None:
+                        record[name] = value
+                    else:
+                        record[name] = deserializer(value)
+
                 # 确定主键或使用内部索引
                 if table.primary_key:
                     pk = record[table.primary_key]
@@ -297,6 +353,7 @@ class CSVBackend(StorageBackend):
                     if pk >= table.next_id:
                         table.next_id = pk + 1
                 table.data[pk] = record
+                idx += 1
 
     @staticmethod
     def _serialize_record(record: Dict[str, Any], columns: Dict[str, 'Column']) -> Dict[str, str]:
@@ -319,25 +376,6 @@ class CSVBackend(StorageBackend):
                 result[key] = str(serialized) if serialized is not None else ''
         return result
 
-    @staticmethod
-    def _deserialize_record(record_data: Dict[str, str], columns: Dict[str, 'Column']) -> Dict[str, Any]:
-        """反序列化记录"""
-        result: Dict[str, Any] = {}
-        for key, value in record_data.items():
-            if key not in columns:
-                continue
-
-            column = columns[key]
-
-            # 处理空值
-            if value == '' or value is None:
-                result[key] = None
-            else:
-                # 使用 TypeRegistry 统一反序列化
-                result[key] = TypeRegistry.deserialize_from_text(value, column.col_type)
-
-        return result
-
     def get_metadata(self) -> Dict[str, Any]:
         """获取元数据"""
         if not self.exists():
@@ -350,7 +388,7 @@ class CSVBackend(StorageBackend):
 
             with zipfile.ZipFile(str(self.file_path), 'r') as zf:
                 # 检测是否加密
-                encrypted = any((info.flag_bits & 0x1) != 0 for info in zf.infolist())
+                encrypted = _is_encrypted(zf)
 
                 if encrypted:
                     if self.options.password:
@@ -419,70 +457,70 @@ class CSVBackend(StorageBackend):
             if file_size == 0:
                 return False, {'error': 'empty_file'}
 
-            # 检查是否为有效的 ZIP 文件
-            if not zipfile.is_zipfile(file_path):
-                return False, None
-
-            # 检查 ZIP 内容
+            # 检查 ZIP 内容（is_zipfile 与 ZipFile 复用同一个文件句柄，只打开一次）
             try:
-                with zipfile.ZipFile(str(file_path), 'r') as zf:
-                    namelist = zf.namelist()
-
-                    # 检查是否包含 _metadata.json 文件
-                    if '_metadata.json' not in namelist:
+                with file_path.open('rb') as fp:
+                    if not zipfile.is_zipfile(fp):
                         return False, None
 
-                    # 检测是否加密
-                    encrypted = any((info.flag_bits & 0x1) != 0 for info in zf.infolist())
+                    with zipfile.ZipFile(fp, 'r') as zf:
+                        namelist = zf.namelist()
 
-                    if encrypted:
-                        # 加密的 ZIP 无法直接读取 metadata，但可以识别格式
-                        csv_files = [name for name in namelist if name.endswith('.csv') and not name.startswith('_')]
-                        return True, {
-                            'engine': 'csv',
-                            'encrypted': True,
-                            'requires_password': True,
-                            'csv_file_count': len(csv_files),
-                            'file_size': file_size,
-                            'modified': file_stat.st_mtime,
-                            'confidence': 'medium'
-                        }
+                        # 检查是否包含 _metadata.json 文件
+                        if '_metadata.json' not in namelist:
+                            return False, None
 
-                    # 尝试读取 metadata（未加密情况）
-                    try:
-                        with zf.open('_metadata.json') as f:
-                            metadata = json.load(f)
+                        # 检测是否加密
+                        encrypted = _is_encrypted(zf)
 
-                        # 检查是否为 Pytuck CSV 格式
-                        if not isinstance(metadata, dict):
-                            return False, None
+                        if encrypted:
+                            # 加密的 ZIP 无法直接读取 metadata，但可以识别格式
+                            csv_files = [name for name in namelist if name.endswith('.csv') and not name.startswith('_')]
+                            return True, {
+                                'engine': 'csv',
+                                'encrypted': True,
+                                'requires_password': True,
+                                'csv_file_count': len(csv_files),
+                                'file_size': file_size,
+                                'modified': file_stat.st_mtime,
+                                'confidence': 'medium'
+                            }
 
-                        # 检查必要的字段
-                        if 'tables' not in metadata:
-                            return False, None
+                        # 尝试读取 metadata（未加密情况）
+                        try:
+                            with zf.open('_metadata.json') as f:
+                                metadata = json.load(f)
 
-                        # 获取元数据信息
-                        format_version = metadata.get('format_version')
-                        table_count = len(metadata.get('tables', {}))
-                        timestamp = metadata.get('timestamp')
+                            # 检查是否为 Pytuck CSV 格式
+                            if not isinstance(metadata, dict):
+                                return False, None
 
-                        # 检查是否有 CSV 文件
-                        csv_files = [name for name in namelist if name.endswith('.csv') and not name.startswith('_')]
+                            # 检查必要的字段
+                            if 'tables' not in metadata:
+                                return False, None
 
-                        # 成功识别为 CSV 格式
-                        return True, {
-                            'engine': 'csv',
-                            'format_version': format_version,
-                            'table_count': table_count,
-                            'csv_file_count': len(csv_files),
-                            'file_size': file_size,
-                            'modified': file_stat.st_mtime,
-                            'timestamp': timestamp,
-                            'confidence': 'high'
-                        }
+                            # 获取元数据信息
+                            format_version = metadata.get('format_version')
+                            table_count = len(metadata.get('tables', {}))
+                            timestamp = metadata.get('timestamp')
+
+                            # 检查是否有 CSV 文件
+                            csv_files = [name for name in namelist if name.endswith('.csv') and not name.startswith('_')]
+
+                            # 成功识别为 CSV 格式
+                            return True, {
+                                'engine': 'csv',
+                                'format_version': format_version,
+                                'table_count': table_count,
+                                'csv_file_count': len(csv_files),
+                                'file_size': file_size,
+                                'modified': file_stat.st_mtime,
+                                'timestamp': timestamp,
+                                'confidence': 'high'
+                            }
 
-                    except (json.JSONDecodeError, KeyError):
-                        return False, {'error': 'invalid_metadata_format'}
+                        except (json.JSONDecodeError, KeyError):
+                            return False, {'error': 'invalid_metadata_format'}
 
             except zipfile.BadZipFile:
                 return False, {'error': 'corrupted_zip'}
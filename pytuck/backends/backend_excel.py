@@ -7,7 +7,7 @@ Pytuck Excel存储引擎
 import json
 import base64
 from pathlib import Path
-from typing import Any, Dict, List, Union, TYPE_CHECKING, Tuple, Optional
+from typing import Any, Dict, Iterator, List, Union, TYPE_CHECKING, Tuple, Optional
 from datetime import datetime
 from .base import StorageBackend
 from ..common.exceptions import SerializationError
@@ -52,10 +52,8 @@ class ExcelBackend(StorageBackend):
 
         temp_path = self.file_path.parent / (self.file_path.name + '.tmp')
         try:
-            wb = Workbook()
-            # 删除默认工作表
-            if 'Sheet' in wb.sheetnames:
-                wb.remove(wb['Sheet'])
+            # write_only 模式逐行流式写出，不在内存中构建单元格对象（也不会创建默认工作表）
+            wb = Workbook(write_only=True)
 
             # 创建元数据工作表
             metadata_sheet = wb.create_sheet('_metadata', 0)
@@ -116,38 +114,49 @@ class ExcelBackend(StorageBackend):
             raise SerializationError("openpyxl is required for Excel backend. Install with: pip install pytuck[excel]")
 
         try:
+            # 数据会全部复制到 Table 中，工作簿本身用完即弃，
+            # 因此总是使用 read_only 流式解析（不构建完整单元格对象），
+            # 与 options.read_only 无关（该选项只限制是否允许保存）
             wb = load_workbook(
-                filename=str(self.file_path), read_only=self.options.read_only, data_only=True, keep_links=False
+                filename=str(self.file_path), read_only=True, data_only=True, keep_links=False
             )
-
-            # 从 _pytuck_tables 工作表读取所有表的 schema
-            tables_schema: Dict[str, Dict[str, Any]] = {}
-            if '_pytuck_tables' in wb.sheetnames:
-                tables_sheet = wb['_pytuck_tables']
-                rows = list(tables_sheet.iter_rows(min_row=2, values_only=True))
-                for row in rows:
-                    if row[0]:  # table_name 不为空
-                        table_name = row[0]
-                        tables_schema[table_name] = {
-                            'primary_key': row[1],
-                            'next_id': int(row[2]) if row[2] else 1,
-                            'comment': row[3] if row[3] else None,
-                            'columns': json.loads(row[4]) if row[4] else []
-                        }
-
-            # 获取所有数据表名（排除元数据表）
-            table_names = [
-                name for name in wb.sheetnames
-                if not name.startswith('_')
-            ]
-
-            tables = {}
-            for table_name in table_names:
-                schema = tables_schema.get(table_name, {})
-                table = self._load_table_from_workbook(wb, table_name, schema)
-                tables[table_name] = table
-
-            return tables
+            try:
+                # read_only 模式按工作表记录的 <dimension> 决定读取范围，
+                # 其他工具生成的文件可能记录错误或缺失，需重置后按实际内容读取
+                for ws in wb.worksheets:
+                    ws.reset_dimensions()
+
+                # 从 _pytuck_tables 工作表读取所有表的 schema
+                tables_schema: Dict[str, Dict[str, Any]] = {}
+                if '_pytuck_tables' in wb.sheetnames:
+                    tables_sheet = wb['_pytuck_tables']
+                    rows = list(tables_sheet.iter_rows(min_row=2, values_only=True))
+                    for row in rows:
+                        if row[0]:  # table_name 不为空
+                            table_name = row[0]
+                            tables_schema[table_name] = {
+                                'primary_key': row[1],
+                                'next_id': int(row[2]) if row[2] else 1,
+                                'comment': row[3] if row[3] else None,
+                                'columns': json.loads(row[4]) if row[4] else []
+                            }
+
+                # 获取所有数据表名（排除元数据表）
+                table_names = [
+                    name for name in wb.sheetnames
+                    if not name.startswith('_')
+                ]
+
+                tables = {}
+                for table_name in table_names:
+                    schema = tables_schema.get(table_name, {})
+                    table = self._load_table_from_workbook(wb, table_name, schema)
+                    tables[table_name] = table
+
+                return tables
+            finally:
+                # read_only 模式会保持文件句柄打开，需显式关闭
+                wb.close()
 
         except Exception as e:
             raise SerializationError(f"Failed to load Excel file: {e}")
@@ -175,21 +184,26 @@ class ExcelBackend(StorageBackend):
 
         data_sheet.append(columns)
 
+        # 每列的类型只查找一次
+        col_types = [
+            table.columns[col_name].col_type if col_name in table.columns else None
+            for col_name in columns
+        ]
+
         # 写入数据行
         for record in table.data.values():
             row: List[Any] = []
-            for col_name in columns:
+            for col_name, col_type in zip(columns, col_types):
                 value = record.get(col_name)
-                column = table.columns.get(col_name)
 
                 if value is None:
                     row.append('')
-                elif column and column.col_type == bool:
+                elif col_type is bool:
                     # Excel 特殊处理：bool 转字符串 'TRUE'/'FALSE'
                     row.append('TRUE' if value else 'FALSE')
-                elif column:
+                elif col_type is not None:
                     # 使用 TypeRegistry 统一序列化
-                    row.append(TypeRegistry.serialize_for_text(value, column.col_type))
+                    row.append(TypeRegistry.serialize_for_text(value, col_type))
                 else:
                     row.append(value)
             data_sheet.append(row)
@@ -238,17 +252,17 @@ class ExcelBackend(StorageBackend):
         table = Table(table_name, columns, primary_key, comment=table_comment)
         table.next_id = next_id
 
-        # 读取数据
+        # 读取数据（逐行流式读取，不一次性生成全部行）
         data_sheet = wb[table_name]
-        rows = list(data_sheet.iter_rows(values_only=True))
+        row_iter: Iterator[Any] = data_sheet.iter_rows(values_only=True)
+        header_row = next(row_iter, None)
 
         max_int_pk = 0  # 用于更新 next_id
 
-        if len(rows) > 1:
-            headers = rows[0]
-            for row_data in rows[1:]:
+        if header_row is not None:
+            for row_data in row_iter:
                 record: Dict[str, Any] = {}
-                for col_name, value in zip(headers, row_data):
+                for col_name, value in zip(header_row, row_data):
                     if col_name not in table.columns:
                         continue
 
@@ -108,8 +108,10 @@ class JSONBackend(StorageBackend):
         import json
 
         def dumps_func(obj: Any) -> str:
+            # 保存的数据每次由表记录新建，不会出现循环引用，跳过逐容器的循环检测
             return json.dumps(
-                obj, indent=self.options.indent, ensure_ascii=self.options.ensure_ascii
+                obj, indent=self.options.indent, ensure_ascii=self.options.ensure_ascii,
+                check_circular=False
             )
 
         self._dumps_func = dumps_func
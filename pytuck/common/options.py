@@ -37,6 +37,8 @@ class SqliteConnectorOptions:
     check_same_thread: bool = True  # 检查同一线程
     timeout: Optional[float] = None  # 连接超时时间
     isolation_level: Optional[str] = None  # 事务隔离级别
+    journal_mode: Optional[str] = None  # PRAGMA journal_mode：DELETE/TRUNCATE/PERSIST/MEMORY/WAL/OFF，None 使用 SQLite 默认
+    synchronous: Optional[str] = None  # PRAGMA synchronous：OFF/NORMAL/FULL/EXTRA，None 使用 SQLite 默认
 
 
 # Connector 选项联合类型
@@ -79,7 +81,7 @@ class SqliteBackendOptions(SqliteConnectorOptions):
 @dataclass
 class ExcelBackendOptions:
     """Excel 后端配置选项"""
-    read_only: bool = False  # 只读，只读情况下显著提升读取性能，但不可修改数据
+    read_only: bool = False  # 只读，禁止保存（加载始终使用 openpyxl 流式只读解析）
     hide_metadata_sheets: bool = True  # 是否隐藏元数据工作表（_metadata 和 _pytuck_tables），默认隐藏
 
 
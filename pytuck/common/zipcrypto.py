@@ -46,6 +46,38 @@ def _crc32_byte(crc: int, byte: int) -> int:
     return _CRC_TABLE[(crc ^ byte) & 0xFF] ^ (crc >> 8)
 
 
+def _process_bytes(keys: List[int], data: bytes, decrypt: bool) -> bytearray:
+    """
+    对整段数据执行 ZipCrypto 加密/解密，并就地推进 keys
+
+    每个字节先与由 key 状态生成的密钥流字节异或，再用明文字节更新 key。
+    keys、CRC 表放在局部变量中、内联 key 更新并预分配输出缓冲区，
+    省去每字节的方法调用和列表读写。
+
+    Args:
+        keys: 三个 32 位 key 组成的状态列表（处理完成后写回）
+        data: 输入数据
+        decrypt: True 为解密，False 为加密
+
+    Returns:
+        处理后的数据
+    """
+    crc_table = _CRC_TABLE
+    k0, k1, k2 = keys
+    out = bytearray(len(data))
+    for i, byte in enumerate(data):
+        temp = (k2 | 2) & 0xFFFF
+        result = byte ^ (((temp * (temp ^ 1)) >> 8) & 0xFF)
+        out[i] = result
+        # key 始终用明文字节更新：加密时为输入，解密时为输出
+        plain = result if decrypt else byte
+        k0 = crc_table[(k0 ^ plain) & 0xFF] ^ (k0 >> 8)
+        k1 = ((k1 + (k0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+        k2 = crc_table[(k2 ^ (k1 >> 24)) & 0xFF] ^ (k2 >> 8)
+    keys[0], keys[1], keys[2] = k0, k1, k2
+    return out
+
+
 class ZipCryptoEncryptor:
     """
     ZipCrypto 加密器
@@ -80,31 +112,6 @@ class ZipCryptoEncryptor:
         self._keys[1] = ((self._keys[1] + (self._keys[0] & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
         self._keys[2] = _crc32_byte(self._keys[2], (self._keys[1] >> 24) & 0xFF)
 
-    def _stream_byte(self) -> int:
-        """
-        生成一个伪随机密钥流字节
-
-        Returns:
-            密钥流字节（0-255）
-        """
-        temp = (self._keys[2] | 2) & 0xFFFF
-        return ((temp * (temp ^ 1)) >> 8) & 0xFF
-
-    def _encrypt_byte(self, plaintext_byte: int) -> int:
-        """
-        加密单个字节
-
-        Args:
-            plaintext_byte: 明文字节
-
-        Returns:
-            密文字节
-        """
-        stream = self._stream_byte()
-        ciphertext_byte = plaintext_byte ^ stream
-        self._update_keys(plaintext_byte)
-        return ciphertext_byte
-
     def encrypt(self, plaintext: bytes, crc32: int) -> bytes:
         """
         加密数据（包含 12 字节加密头）
@@ -121,17 +128,8 @@ class ZipCryptoEncryptor:
         header = bytearray(os.urandom(11))
         header.append((crc32 >> 24) & 0xFF)
 
-        # 加密头
-        encrypted_header = bytearray()
-        for byte in header:
-            encrypted_header.append(self._encrypt_byte(byte))
-
-        # 加密数据
-        encrypted_data = bytearray()
-        for byte in plaintext:
-            encrypted_data.append(self._encrypt_byte(byte))
-
-        return bytes(encrypted_header) + bytes(encrypted_data)
+        # 加密头与数据共用同一密钥流，一次处理
+        return bytes(_process_bytes(self._keys, bytes(header) + plaintext, decrypt=False))
 
 
 class ZipCryptoDecryptor:
@@ -160,26 +158,6 @@ class ZipCryptoDecryptor:
         self._keys[1] = ((self._keys[1] + (self._keys[0] & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
         self._keys[2] = _crc32_byte(self._keys[2], (self._keys[1] >> 24) & 0xFF)
 
-    def _stream_byte(self) -> int:
-        """生成一个伪随机密钥流字节"""
-        temp = (self._keys[2] | 2) & 0xFFFF
-        return ((temp * (temp ^ 1)) >> 8) & 0xFF
-
-    def _decrypt_byte(self, ciphertext_byte: int) -> int:
-        """
-        解密单个字节
-
-        Args:
-            ciphertext_byte: 密文字节
-
-        Returns:
-            明文字节
-        """
-        stream = self._stream_byte()
-        plaintext_byte = ciphertext_byte ^ stream
-        self._update_keys(plaintext_byte)
-        return plaintext_byte
-
     def decrypt(self, ciphertext: bytes) -> Tuple[bytes, int]:
         """
         解密数据（包含 12 字节加密头）
@@ -193,17 +171,10 @@ class ZipCryptoDecryptor:
         if len(ciphertext) < 12:
             raise ValueError("Ciphertext too short (missing encryption header)")
 
-        # 解密 12 字节头
-        header = bytearray()
-        for byte in ciphertext[:12]:
-            header.append(self._decrypt_byte(byte))
-
-        # 最后一个字节是 CRC 校验
-        crc_check = header[11]
+        # 加密头与数据共用同一密钥流，一次处理
+        decrypted = _process_bytes(self._keys, ciphertext, decrypt=True)
 
-        # 解密数据
-        plaintext = bytearray()
-        for byte in ciphertext[12:]:
-            plaintext.append(self._decrypt_byte(byte))
+        # 加密头最后一个字节是 CRC 校验
+        crc_check = decrypted[11]
 
-        return bytes(plaintext), crc_check
+        return bytes(decrypted[12:]), crc_check
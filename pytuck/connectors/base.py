@@ -268,6 +268,31 @@ class DatabaseConnector(ABC):
             details={"connector": self.__class__.__name__}
         )
 
+    def insert_rows(
+        self,
+        table_name: str,
+        columns: List[str],
+        rows: List[Dict[str, Any]]
+    ) -> int:
+        """
+        以同一组列批量插入多行数据
+
+        Args:
+            table_name: 表名
+            columns: 列名列表（所有行共用）
+            rows: 列名到值的映射列表（缺少的列写入 NULL）
+
+        Returns:
+            表中当前最大的 rowid（无记录时为 0）
+
+        Raises:
+            UnsupportedOperationError: 如果连接器不支持直接 CRUD
+        """
+        raise UnsupportedOperationError(
+            message="Direct CRUD not supported",
+            details={"connector": self.__class__.__name__}
+        )
+
     def update_row(
         self,
         table_name: str,
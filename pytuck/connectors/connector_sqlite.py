@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Tuple, Optional, Type
 
 from .base import DatabaseConnector
 from ..common.options import SqliteConnectorOptions
-from ..common.exceptions import DatabaseConnectionError, TableNotFoundError
+from ..common.exceptions import ConfigurationError, DatabaseConnectionError, TableNotFoundError
 from ..common.typing import ColumnTypes
 from ..core.types import TypeRegistry
 
@@ -52,6 +52,10 @@ class SQLiteConnector(DatabaseConnector):
         dict: 'TEXT',        # JSON 字符串存储
     }
 
+    # 连接选项允许的 PRAGMA 取值
+    JOURNAL_MODES = ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF')
+    SYNCHRONOUS_MODES = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
     SQL_TO_TYPE: Dict[str, ColumnTypes] = {
         # 整数类型
         'INTEGER': int,
@@ -110,6 +114,22 @@ class SQLiteConnector(DatabaseConnector):
 
         conn = sqlite3.connect(self.db_path, **connect_kwargs)
         conn.row_factory = sqlite3.Row
+
+        # PRAGMA 值不能参数化，只接受白名单内的取值
+        for pragma, value, allowed in (
+            ('journal_mode', self.options.journal_mode, self.JOURNAL_MODES),
+            ('synchronous', self.options.synchronous, self.SYNCHRONOUS_MODES),
+        ):
+            if value is None:
+                continue
+            if value.upper() not in allowed:
+                conn.close()
+                raise ConfigurationError(
+                    f"Invalid SQLite {pragma}: {value}. Must be one of {allowed}",
+                    details={pragma: value, 'valid_values': allowed}
+                )
+            conn.execute(f'PRAGMA {pragma}={value.upper()}')
+
         self.conn = conn
 
     def close(self) -> None:
@@ -350,6 +370,40 @@ class SQLiteConnector(DatabaseConnector):
             return data[pk_column]
         return cursor.lastrowid
 
+    def insert_rows(
+        self,
+        table_name: str,
+        columns: List[str],
+        rows: List[Dict[str, Any]]
+    ) -> int:
+        """
+        以同一组列批量插入多行数据
+
+        INSERT 语句只构建一次，通过 executemany 复用于所有行。
+
+        Args:
+            table_name: 表名
+            columns: 列名列表（所有行共用）
+            rows: 列名到值的映射列表（缺少的列写入 NULL）
+
+        Returns:
+            表中当前最大的 rowid（无记录时为 0）
+        """
+        if self.conn is None:
+            raise DatabaseConnectionError("数据库未连接，请先调用 connect()")
+
+        col_names = ', '.join([f'`{c}`' for c in columns])
+        placeholders = ', '.join(['?' for _ in columns])
+        sql = f'INSERT INTO `{table_name}` ({col_names}) VALUES ({placeholders})'
+
+        serialize = self._serialize_value
+        self.conn.executemany(sql, [tuple(serialize(row.get(c)) for c in columns) for row in rows])
+
+        # executemany 不更新 lastrowid，改为查询当前最大 rowid
+        cursor = self.conn.execute(f'SELECT MAX(rowid) FROM `{table_name}`')
+        max_rowid = cursor.fetchone()[0]
+        return max_rowid if max_rowid is not None else 0
+
     def update_row(
         self,
         table_name: str,
@@ -48,6 +48,14 @@ STORAGE_EVENTS: Set[str] = {
 ALL_EVENTS: Set[str] = MODEL_EVENTS | STORAGE_EVENTS
 
 
+def _without(
+    listeners: Tuple[Callable[..., Any], ...], fn: Callable[..., Any]
+) -> Tuple[Callable[..., Any], ...]:
+    """返回移除 fn 首次出现后的新监听器元组"""
+    i = listeners.index(fn)
+    return listeners[:i] + listeners[i + 1:]
+
+
 class EventManager:
     """
     事件管理器
@@ -56,10 +64,12 @@ class EventManager:
     """
 
     def __init__(self) -> None:
-        # Model 级: {(model_class, event_name): [callbacks]}
-        self._model_listeners: Dict[Tuple[type, str], List[Callable[..., Any]]] = {}
-        # Storage 级: {(id(storage), event_name): [callbacks]}
-        self._storage_listeners: Dict[Tuple[int, str], List[Callable[..., Any]]] = {}
+        # 监听器以元组保存，注册/移除时整体替换（写时复制），
+        # 分发时直接遍历，回调中增删监听器不影响本次分发
+        # Model 级: {(model_class, event_name): (callbacks)}
+        self._model_listeners: Dict[Tuple[type, str], Tuple[Callable[..., Any], ...]] = {}
+        # Storage 级: {(id(storage), event_name): (callbacks)}
+        self._storage_listeners: Dict[Tuple[int, str], Tuple[Callable[..., Any], ...]] = {}
         # 保存 storage 引用，防止 id 复用
         self._storage_refs: Dict[int, Any] = {}
 
@@ -80,10 +90,10 @@ class EventManager:
 
         if event_name in MODEL_EVENTS:
             key = (target, event_name)
-            self._model_listeners.setdefault(key, []).append(fn)
+            self._model_listeners[key] = self._model_listeners.get(key, ()) + (fn,)
         else:
             key = (id(target), event_name)
-            self._storage_listeners.setdefault(key, []).append(fn)
+            self._storage_listeners[key] = self._storage_listeners.get(key, ()) + (fn,)
             self._storage_refs[id(target)] = target
 
     def listens_for(self, target: Any, event_name: str) -> Callable[..., Any]:
@@ -113,14 +123,14 @@ class EventManager:
         """
         if event_name in MODEL_EVENTS:
             key = (target, event_name)
-            listeners = self._model_listeners.get(key, [])
+            listeners = self._model_listeners.get(key, ())
             if fn in listeners:
-                listeners.remove(fn)
+                self._model_listeners[key] = _without(listeners, fn)
         else:
             key = (id(target), event_name)
-            listeners = self._storage_listeners.get(key, [])
+            listeners = self._storage_listeners.get(key, ())
             if fn in listeners:
-                listeners.remove(fn)
+                self._storage_listeners[key] = _without(listeners, fn)
 
     def dispatch_model(self, model_class: type, event_name: str, instance: Any) -> None:
         """
@@ -132,20 +142,22 @@ class EventManager:
             instance: 模型实例
         """
         key = (model_class, event_name)
-        for fn in self._model_listeners.get(key, []):
+        for fn in self._model_listeners.get(key, ()):
             fn(instance)
 
     def dispatch_model_bulk(self, model_class: type, event_name: str, instances: List[Any]) -> None:
         """
         分发 Model 级批量事件
 
+        instances 原列表直接传给每个监听器，不做复制。
+
         Args:
             model_class: 模型类
             event_name: 事件名称（如 'before_bulk_insert'）
             instances: 模型实例列表
         """
         key = (model_class, event_name)
-        for fn in self._model_listeners.get(key, []):
+        for fn in self._model_listeners.get(key, ()):
             fn(instances)
 
     def dispatch_storage(self, storage: Any, event_name: str) -> None:
@@ -157,7 +169,7 @@ class EventManager:
             event_name: 事件名称
         """
         key = (id(storage), event_name)
-        for fn in self._storage_listeners.get(key, []):
+        for fn in self._storage_listeners.get(key, ()):
             fn(storage)
 
     def clear(self, target: Any = None) -> None:
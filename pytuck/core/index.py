@@ -5,8 +5,8 @@ Pytuck 索引实现
 """
 
 from abc import ABC, abstractmethod
-from bisect import bisect_left, bisect_right
-from typing import Any, Dict, List, Optional, Set
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 
 class BaseIndex(ABC):
@@ -32,6 +32,16 @@ class BaseIndex(ABC):
         """
         ...
 
+    def bulk_insert(self, entries: Iterable[Tuple[Any, Any]]) -> None:
+        """
+        批量插入索引条目（默认逐条调用 insert）
+
+        Args:
+            entries: (字段值, 主键值) 序列，None 值不会被索引
+        """
+        for value, pk in entries:
+            self.insert(value, pk)
+
     @abstractmethod
     def remove(self, value: Any, pk: Any) -> None:
         """
@@ -43,6 +53,16 @@ class BaseIndex(ABC):
         """
         ...
 
+    def bulk_remove(self, entries: Iterable[Tuple[Any, Any]]) -> None:
+        """
+        批量删除索引条目（默认逐条调用 remove）
+
+        Args:
+            entries: (字段值, 主键值) 序列
+        """
+        for value, pk in entries:
+            self.remove(value, pk)
+
     @abstractmethod
     def lookup(self, value: Any) -> Set[Any]:
         """
@@ -206,6 +226,35 @@ class SortedIndex(BaseIndex):
             # 值已存在，添加到集合
             self.value_to_pks[value].add(pk)
 
+    def bulk_insert(self, entries: Iterable[Tuple[Any, Any]]) -> None:
+        """
+        批量插入索引条目
+
+        先把主键归入各值的集合，新出现的值最后一次性并入有序列表并排序
+        （Timsort 对两段有序数据的合并为线性），避免逐条 list.insert 的 O(n) 移动。
+
+        Args:
+            entries: (字段值, 主键值) 序列，None 值不会被索引
+        """
+        value_to_pks = self.value_to_pks
+        new_values: List[Any] = []
+        for value, pk in entries:
+            if value is None:
+                continue
+            pk_set = value_to_pks.get(value)
+            if pk_set is None:
+                value_to_pks[value] = {pk}
+                new_values.append(value)
+            else:
+                pk_set.add(pk)
+
+        if len(new_values) == 1:
+            insort(self.sorted_values, new_values[0])
+        elif new_values:
+            new_values.sort()
+            self.sorted_values.extend(new_values)
+            self.sorted_values.sort()
+
     def remove(self, value: Any, pk: Any) -> None:
         """
         删除索引条目
@@ -224,6 +273,34 @@ class SortedIndex(BaseIndex):
             if idx < len(self.sorted_values) and self.sorted_values[idx] == value:
                 self.sorted_values.pop(idx)
 
+    def bulk_remove(self, entries: Iterable[Tuple[Any, Any]]) -> None:
+        """
+        批量删除索引条目
+
+        先从各值的集合中移除主键，变空的值最后一次性从有序列表中过滤掉，
+        避免逐条 list.pop 的 O(n) 移动。
+
+        Args:
+            entries: (字段值, 主键值) 序列
+        """
+        value_to_pks = self.value_to_pks
+        emptied: List[Any] = []
+        for value, pk in entries:
+            pk_set = value_to_pks.get(value)
+            if not pk_set:
+                continue
+            pk_set.discard(pk)
+            if not pk_set:
+                del value_to_pks[value]
+                emptied.append(value)
+
+        if len(emptied) == 1:
+            idx = bisect_left(self.sorted_values, emptied[0])
+            if idx < len(self.sorted_values) and self.sorted_values[idx] == emptied[0]:
+                self.sorted_values.pop(idx)
+        elif emptied:
+            self.sorted_values[:] = [v for v in self.sorted_values if v in value_to_pks]
+
     def lookup(self, value: Any) -> Set[Any]:
         """
         精确查找
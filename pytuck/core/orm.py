@@ -5,6 +5,8 @@ Pytuck ORM层
 - PureBaseModel: 纯模型定义，通过 Session 操作数据
 - CRUDBaseModel: Active Record 模式，模型自带 CRUD 方法
 """
+from __future__ import annotations
+
 import sys
 from typing import (
     Any, Callable, Dict, List, Optional, Tuple, Type, Union, TYPE_CHECKING,
@@ -14,18 +16,21 @@ from datetime import datetime, date, timedelta, timezone
 
 from ..common.exceptions import ValidationError, TypeConversionError, SchemaError
 from ..common.options import SyncOptions
-from ..common.typing import RelationshipT, ColumnTypes
+from ..common.typing import T, RelationshipT, ColumnTypes
 from .types import TypeRegistry
 
 if TYPE_CHECKING:
     from .storage import Storage
     from .session import Session
-    from ..query import Query, BinaryExpression
+    from ..query import Query
 
 
 # 无主键时使用的内部 rowid 保留键名
 PSEUDO_PK_NAME: str = '_pytuck_rowid'
 
+# 区分"属性不存在"与"属性值为 None"的哨兵对象
+_MISSING: Any = object()
+
 
 # ==================== 类型转换函数（模块级别） ====================
 
@@ -411,37 +416,30 @@ class Column:
 
     def __eq__(self, other: Any) -> 'BinaryExpression':  # type: ignore[override]
         """等于：Student.age == 20"""
-        from ..query import BinaryExpression
         return BinaryExpression(self, '=', other)
 
     def __ne__(self, other: Any) -> 'BinaryExpression':  # type: ignore[override]
         """不等于：Student.age != 20"""
-        from ..query import BinaryExpression
         return BinaryExpression(self, '!=', other)
 
     def __lt__(self, other: Any) -> 'BinaryExpression':
         """小于：Student.age < 20"""
-        from ..query import BinaryExpression
         return BinaryExpression(self, '<', other)
 
     def __le__(self, other: Any) -> 'BinaryExpression':
         """小于等于：Student.age <= 20"""
-        from ..query import BinaryExpression
         return BinaryExpression(self, '<=', other)
 
     def __gt__(self, other: Any) -> 'BinaryExpression':
         """大于：Student.age > 20"""
-        from ..query import BinaryExpression
         return BinaryExpression(self, '>', other)
 
     def __ge__(self, other: Any) -> 'BinaryExpression':
         """大于等于：Student.age >= 20"""
-        from ..query import BinaryExpression
         return BinaryExpression(self, '>=', other)
 
     def in_(self, values: list) -> 'BinaryExpression':
         """IN 操作：Student.age.in_([18, 19, 20])"""
-        from ..query import BinaryExpression
         return BinaryExpression(self, 'IN', values)
 
 
@@ -482,6 +480,9 @@ class PureBaseModel:
     __tablename__: Optional[str] = None
     __table_comment__: Optional[str] = None
     __columns__: Dict[str, Column] = {}
+    __column_names__: Dict[str, str] = {}  # 属性名 -> Column.name
+    __column_attrs__: Dict[str, str] = {}  # Column.name -> 属性名
+    __has_custom_column_names__: bool = False  # 是否存在与属性名不同的 Column.name
     __primary_key__: Optional[str] = None  # None 表示无主键，使用隐式 rowid
     __relationships__: Dict[str, 'Relationship'] = {}
 
@@ -498,20 +499,16 @@ class PureBaseModel:
         当设置 Column 属性时，自动将实例标记为 dirty，
         这样 session.flush()/commit() 就能检测到修改。
         """
-        old_value = None
-        session: Optional['Session'] = None
-
-        if (hasattr(self.__class__, name) and
-            isinstance(getattr(self.__class__, name), Column) and
-            hasattr(self, '_pytuck_session')
-        ):
-            old_value = self.__dict__.get(name)
-            session = getattr(self, '_pytuck_session')
+        # 先看实例是否已关联 Session（未关联时无需任何检查）
+        session: Optional['Session'] = self.__dict__.get('_pytuck_session')
+        if session is None or not isinstance(getattr(type(self), name, None), Column):
+            object.__setattr__(self, name, value)
+            return
 
+        old_value = self.__dict__.get(name)
         object.__setattr__(self, name, value)
-
-        if session is not None and old_value != value:
-            session._mark_dirty(self)
+        if old_value != value:
+            session._mark_dirty(self, name)
 
     # ==================== 列名映射辅助方法 ====================
 
@@ -526,8 +523,7 @@ class PureBaseModel:
         Returns:
             对应的 Column.name（如果存在），否则返回属性名本身
         """
-        column = cls.__columns__.get(attr_name)
-        return column.name if column and column.name else attr_name
+        return cls.__column_names__.get(attr_name, attr_name)
 
     @classmethod
     def _column_to_attr_name(cls, col_name: str) -> Optional[str]:
@@ -540,10 +536,68 @@ class PureBaseModel:
         Returns:
             对应的属性名，如果未找到返回 None
         """
-        for attr_name, column in cls.__columns__.items():
-            if column.name == col_name:
-                return attr_name
-        return None
+        return cls.__column_attrs__.get(col_name)
+
+    # ==================== Schema 反射 ====================
+
+    @classmethod
+    def reflect(cls: Type[T], table_name: str) -> Type[T]:
+        """
+        根据 Storage 中已持久化的表结构生成模型类
+
+        适用于重新打开数据库后无需再次手写模型定义的场景。若该表已注册了
+        继承自当前基类的模型类，则直接返回该类，不再重复构建。
+
+        反射出的模型属性名即存储列名。
+
+        Args:
+            table_name: 表名
+
+        Returns:
+            继承自当前基类的模型类
+
+        Raises:
+            SchemaError: 当前类未绑定 Storage
+            TableNotFoundError: 表不存在
+
+        Example:
+            db = Storage(file_path='mydb.db')
+            Base: Type[PureBaseModel] = declarative_base(db)
+            User = Base.reflect('users')
+            users = session.execute(select(User)).all()
+        """
+        storage = cls.__storage__
+        if storage is None:
+            raise SchemaError(
+                f"{cls.__name__} is not bound to a Storage, use declarative_base(storage) first",
+                table_name=table_name
+            )
+
+        existing = storage._get_model_by_table(table_name)
+        if existing is not None and issubclass(existing, cls):
+            return existing
+
+        table = storage.get_table(table_name)
+        attrs: Dict[str, Any] = {
+            '__tablename__': table_name,
+            '__table_comment__': table.comment,
+        }
+        for col_name, column in table.columns.items():
+            attrs[col_name] = Column(
+                column.col_type,
+                name=col_name,
+                nullable=column.nullable,
+                primary_key=column.primary_key,
+                index=column.index,
+                default=column.default,
+                foreign_key=column.foreign_key,
+                comment=column.comment,
+                strict=column.strict,
+            )
+
+        class_name = ''.join(part.capitalize() for part in table_name.split('_')) or table_name
+        # type() 创建子类时触发 __init_subclass__，完成列收集和模型注册
+        return cast(Type[T], type(class_name, (cls,), attrs))
 
     def to_dict(self, use_column_names: bool = False) -> Dict[str, Any]:
         """
@@ -662,6 +716,16 @@ class CRUDBaseModel(PureBaseModel):
         """
         raise NotImplementedError("This method should be overridden by declarative_base")
 
+    @classmethod
+    def bulk_create(cls, rows: List[Dict[str, Any]]) -> List['CRUDBaseModel']:
+        """
+        批量创建并保存记录（一次批量写入）
+
+        Example:
+            users = User.bulk_create([{'name': 'Alice'}, {'name': 'Bob'}])
+        """
+        raise NotImplementedError("This method should be overridden by declarative_base")
+
     @classmethod
     def get(cls, pk: Any) -> Optional['CRUDBaseModel']:
         """
@@ -785,8 +849,9 @@ class Relationship(Generic[RelationshipT]):
 
         # 检查缓存
         cache_key = f'_cached_{self.name}'
-        if hasattr(instance, cache_key):
-            return getattr(instance, cache_key)
+        cached = instance.__dict__.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
 
         # 延迟加载
         target_model = self._resolve_target_model(owner)
@@ -960,6 +1025,29 @@ def declarative_base(
         return _create_pure_base(storage, sync_schema, sync_options)
 
 
+def _build_column_name_maps(cls: Type[PureBaseModel]) -> None:
+    """
+    根据 __columns__ 计算模型的列名映射
+
+    设置 __column_names__（属性名 -> Column.name）、__column_attrs__（Column.name -> 属性名）
+    和 __has_custom_column_names__（是否存在与属性名不同的 Column.name）。
+
+    Args:
+        cls: 已收集 __columns__ 的模型类
+    """
+    column_names: Dict[str, str] = {}
+    column_attrs: Dict[str, str] = {}
+    for attr_name, column in cls.__columns__.items():
+        col_name = column.name if column.name else attr_name
+        column_names[attr_name] = col_name
+        column_attrs.setdefault(col_name, attr_name)
+    cls.__column_names__ = column_names
+    cls.__column_attrs__ = column_attrs
+    cls.__has_custom_column_names__ = any(
+        attr_name != col_name for attr_name, col_name in column_names.items()
+    )
+
+
 def _create_pure_base(
     storage: 'Storage',
     sync_schema: bool = False,
@@ -976,6 +1064,9 @@ def _create_pure_base(
         __tablename__: Optional[str] = None
         __table_comment__: Optional[str] = None
         __columns__: Dict[str, Column] = {}
+        __column_names__: Dict[str, str] = {}  # 属性名 -> Column.name
+        __column_attrs__: Dict[str, str] = {}  # Column.name -> 属性名
+        __has_custom_column_names__: bool = False  # 是否存在与属性名不同的 Column.name
         __primary_key__: Optional[str] = None  # None 表示无主键，使用隐式 rowid
         __relationships__: Dict[str, Relationship] = {}
 
@@ -1018,6 +1109,9 @@ def _create_pure_base(
             # 设置主键（None 表示无主键，使用隐式 rowid）
             cls.__primary_key__ = primary_keys[0] if primary_keys else None
 
+            # 预先计算属性名与 Column.name 的双向映射
+            _build_column_name_maps(cls)
+
             # 自动创建或同步表
             if cls.__columns__:
                 columns_list = list(cls.__columns__.values())
@@ -1044,14 +1138,18 @@ def _create_pure_base(
         def __init__(self, **kwargs: Any):
             """初始化模型实例"""
             super().__init__(**kwargs)
+            # 新实例尚未关联 Session，无需脏跟踪：验证一次后直接写入 __dict__，
+            # 不再经过 __setattr__ 与 Column.__set__ 的重复验证
+            values = self.__dict__
             for col_name, column in self.__columns__.items():
                 if col_name in kwargs:
-                    value = column.validate(kwargs[col_name])
-                    setattr(self, col_name, value)
+                    values[col_name] = column.validate(kwargs[col_name])
                 elif column.default is not None:
-                    setattr(self, col_name, column.default)
+                    # 默认值已是列类型时 validate 会原样返回，直接复用
+                    default = column.default
+                    values[col_name] = default if type(default) is column.col_type else column.validate(default)
                 elif column.nullable or column.primary_key:
-                    setattr(self, col_name, None)
+                    values[col_name] = None
                 else:
                     raise ValidationError(f"Missing required column '{col_name}'")
 
@@ -1077,6 +1175,9 @@ def _create_crud_base(
         __tablename__: Optional[str] = None
         __table_comment__: Optional[str] = None
         __columns__: Dict[str, Column] = {}
+        __column_names__: Dict[str, str] = {}  # 属性名 -> Column.name
+        __column_attrs__: Dict[str, str] = {}  # Column.name -> 属性名
+        __has_custom_column_names__: bool = False  # 是否存在与属性名不同的 Column.name
         __primary_key__: Optional[str] = None  # None 表示无主键，使用隐式 rowid
         __relationships__: Dict[str, Relationship] = {}
 
@@ -1119,6 +1220,9 @@ def _create_crud_base(
             # 设置主键（None 表示无主键，使用隐式 rowid）
             cls.__primary_key__ = primary_keys[0] if primary_keys else None
 
+            # 预先计算属性名与 Column.name 的双向映射
+            _build_column_name_maps(cls)
+
             # 自动创建或同步表
             if cls.__columns__:
                 columns_list = list(cls.__columns__.values())
@@ -1148,14 +1252,18 @@ def _create_crud_base(
             super().__init__(**kwargs)
             self._loaded_from_db = False
 
+            # 新实例尚未关联 Session，无需脏跟踪：验证一次后直接写入 __dict__，
+            # 不再经过 __setattr__ 与 Column.__set__ 的重复验证
+            values = self.__dict__
             for col_name, column in self.__columns__.items():
                 if col_name in kwargs:
-                    value = column.validate(kwargs[col_name])
-                    setattr(self, col_name, value)
+                    values[col_name] = column.validate(kwargs[col_name])
                 elif column.default is not None:
-                    setattr(self, col_name, column.default)
+                    # 默认值已是列类型时 validate 会原样返回，直接复用
+                    default = column.default
+                    values[col_name] = default if type(default) is column.col_type else column.validate(default)
                 elif column.nullable or column.primary_key:
-                    setattr(self, col_name, None)
+                    values[col_name] = None
                 else:
                     raise ValidationError(f"Missing required column '{col_name}'")
 
@@ -1262,6 +1370,24 @@ def _create_crud_base(
             instance.save()
             return instance
 
+        @classmethod
+        def bulk_create(cls, rows: List[Dict[str, Any]]) -> List['DeclarativeCRUDBase']:  # type: ignore[override]
+            """
+            批量创建并保存记录
+
+            每行构造一个实例（完成字段验证和默认值填充），再通过 bulk_insert
+            一次性写入 Storage，主键批量分配、脏标记只设置一次。
+
+            Args:
+                rows: 每行一个的 {属性名: 值} 字典列表
+
+            Returns:
+                已保存的实例列表（已设置主键）
+            """
+            instances = [cls(**row) for row in rows]
+            cls.bulk_insert(instances)
+            return instances
+
         @classmethod
         def bulk_insert(cls, instances: List['DeclarativeCRUDBase']) -> List[Any]:
             """
@@ -1279,15 +1405,15 @@ def _create_crud_base(
             # 触发 before_bulk_insert 事件
             event.dispatch_model_bulk(cls, 'before_bulk_insert', instances)
 
-            # 构建数据字典列表
-            records: List[Dict[str, Any]] = []
-            for instance in instances:
-                data: Dict[str, Any] = {}
-                for attr_name, column in cls.__columns__.items():
-                    value = getattr(instance, attr_name, None)
-                    db_col_name = column.name if column.name else attr_name
-                    data[db_col_name] = value
-                records.append(data)
+            # 构建数据字典列表（列名映射只解析一次，值直接从实例 __dict__ 读取）
+            col_keys = [
+                (attr_name, column.name if column.name else attr_name)
+                for attr_name, column in cls.__columns__.items()
+            ]
+            records = [
+                {db_col_name: instance.__dict__.get(attr_name) for attr_name, db_col_name in col_keys}
+                for instance in instances
+            ]
 
             table_name = cls.__tablename__
             assert table_name is not None, f"Model {cls.__name__} must have __tablename__ defined"
@@ -1295,15 +1421,12 @@ def _create_crud_base(
             # 批量插入到 Storage
             pks = storage.bulk_insert(table_name, records)
 
-            # 设置主键到实例
-            pk_name = cls.__primary_key__
-            for i, instance in enumerate(instances):
-                pk = pks[i]
-                if pk_name:
-                    setattr(instance, pk_name, pk)
-                else:
-                    setattr(instance, '_pytuck_rowid', pk)
-                instance._loaded_from_db = True
+            # 设置主键到实例（主键已由 Table 规范化，直接写入 __dict__）
+            pk_name = cls.__primary_key__ or '_pytuck_rowid'
+            for instance, pk in zip(instances, pks):
+                values = instance.__dict__
+                values[pk_name] = pk
+                values['_loaded_from_db'] = True
 
             # 触发 after_bulk_insert 事件
             event.dispatch_model_bulk(cls, 'after_bulk_insert', instances)
@@ -1331,7 +1454,11 @@ def _create_crud_base(
             assert table_name is not None, f"Model {cls.__name__} must have __tablename__ defined"
             pk_name = cls.__primary_key__
 
-            # 构建 (pk, data) 元组列表
+            # 构建 (pk, data) 元组列表（列名映射只解析一次）
+            col_keys = [
+                (attr_name, column.name if column.name else attr_name)
+                for attr_name, column in cls.__columns__.items()
+            ]
             updates: List[Tuple[Any, Dict[str, Any]]] = []
             for instance in instances:
                 if pk_name:
@@ -1344,12 +1471,8 @@ def _create_crud_base(
                         "Cannot bulk update instance without primary key or rowid"
                     )
 
-                data: Dict[str, Any] = {}
-                for attr_name, column in cls.__columns__.items():
-                    value = getattr(instance, attr_name, None)
-                    db_col_name = column.name if column.name else attr_name
-                    data[db_col_name] = value
-                updates.append((pk, data))
+                values = instance.__dict__
+                updates.append((pk, {db_col_name: values.get(attr_name) for attr_name, db_col_name in col_keys}))
 
             # 批量更新到 Storage
             count = storage.bulk_update(table_name, updates)
@@ -1375,12 +1498,17 @@ def _create_crud_base(
 
                 data = storage.select(table_name, pk)
                 # 将 Column.name 转换为属性名
-                attr_data = {}
-                for db_col_name, value in data.items():
-                    if db_col_name == PSEUDO_PK_NAME:
-                        continue
-                    attr_name = cls._column_to_attr_name(db_col_name) or db_col_name
-                    attr_data[attr_name] = value
+                if cls.__has_custom_column_names__:
+                    column_attrs = cls.__column_attrs__
+                    attr_data = {
+                        column_attrs.get(db_col_name, db_col_name): value
+                        for db_col_name, value in data.items()
+                        if db_col_name != PSEUDO_PK_NAME
+                    }
+                else:
+                    # 列名与属性名一致时无需转换
+                    attr_data = dict(data)
+                    attr_data.pop(PSEUDO_PK_NAME, None)
                 instance = cls(**attr_data)
                 instance._loaded_from_db = True
                 return instance
@@ -1434,3 +1562,8 @@ def _create_crud_base(
             return Query(cls).all()
 
     return DeclarativeCRUDBase  # type: ignore
+
+
+# query 模块导入时依赖本模块，放在末尾导入以避免循环导入；
+# Column 的比较运算符直接使用，无需每次调用时执行函数内 import
+from ..query.builder import BinaryExpression  # noqa: E402
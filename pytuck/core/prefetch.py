@@ -287,10 +287,16 @@ def _record_to_instance(
     Returns:
         模型实例
     """
-    mapped: Dict[str, Any] = {}
+    if not model_class.__has_custom_column_names__:
+        # 列名与属性名一致时无需转换
+        mapped = dict(record)
+        mapped.pop(PSEUDO_PK_NAME, None)
+        return model_class(**mapped)
+
+    column_attrs = model_class.__column_attrs__
+    mapped = {}
     for db_col_name, value in record.items():
         if db_col_name == PSEUDO_PK_NAME:
             continue
-        attr_name = model_class._column_to_attr_name(db_col_name) or db_col_name
-        mapped[attr_name] = value
+        mapped[column_attrs.get(db_col_name, db_col_name)] = value
     return model_class(**mapped)
@@ -4,7 +4,7 @@ Session - 会话管理器
 提供类似 SQLAlchemy 的 Session 模式，统一管理数据库操作。
 """
 
-from typing import Any, Dict, List, Optional, Type, Tuple, Union, Generator, overload
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Type, Tuple, Union, Generator, overload
 from contextlib import contextmanager
 
 from ..common.typing import T
@@ -226,7 +226,7 @@ class Session:
 
         # 清空待处理列表
         self._new_objects.clear()
-        self._dirty_objects.clear()
+        self._clear_dirty()
         self._deleted_objects.clear()
 
     def commit(self) -> None:
@@ -244,7 +244,7 @@ class Session:
         回滚事务（清空所有待处理修改）
         """
         self._new_objects.clear()
-        self._dirty_objects.clear()
+        self._clear_dirty()
         self._deleted_objects.clear()
         self._identity_map.clear()
 
@@ -287,14 +287,19 @@ class Session:
         # 触发 before_bulk_insert 事件
         event.dispatch_model_bulk(model_class, 'before_bulk_insert', instances)
 
-        # 构建数据字典列表
+        # 构建数据字典列表（列名映射只解析一次，值直接从实例 __dict__ 读取，
+        # 与 Column.__get__ 的取值方式一致）
+        col_keys = [
+            (attr_name, column.name if column.name else attr_name)
+            for attr_name, column in model_class.__columns__.items()
+        ]
         records: List[Dict[str, Any]] = []
         for instance in instances:
+            values = instance.__dict__
             data: Dict[str, Any] = {}
-            for attr_name, column in instance.__columns__.items():
-                value = getattr(instance, attr_name, None)
+            for attr_name, db_col_name in col_keys:
+                value = values.get(attr_name)
                 if value is not None:
-                    db_col_name = column.name if column.name else attr_name
                     data[db_col_name] = value
             records.append(data)
 
@@ -302,13 +307,10 @@ class Session:
         pks = self.storage.bulk_insert(table_name, records)
 
         # 设置主键到实例 + 注册到 identity map
-        pk_name = model_class.__primary_key__
-        for i, instance in enumerate(instances):
-            pk = pks[i]
-            if pk_name:
-                setattr(instance, pk_name, pk)
-            else:
-                setattr(instance, '_pytuck_rowid', pk)
+        # 主键已由 Table 规范化，直接写入 __dict__，不再经过 Column 验证
+        pk_name = model_class.__primary_key__ or '_pytuck_rowid'
+        for instance, pk in zip(instances, pks):
+            instance.__dict__[pk_name] = pk
             self._register_instance(instance)
 
         # 触发 after_bulk_insert 事件
@@ -318,11 +320,14 @@ class Session:
 
     def bulk_update(self, instances: List[PureBaseModel]) -> int:
         """
-        批量更新模型实例（立即写入内存，更新全部字段）
+        批量更新模型实例（立即写入内存）
 
         调用时直接写入 Storage 内存，commit() 仅负责 auto_flush 磁盘持久化。
         触发 before_bulk_update / after_bulk_update 事件，不触发逐条事件。
 
+        由本会话跟踪的实例只写入被修改过的字段及 list / dict 列（原地修改无法被跟踪），
+        其余实例写入全部字段；更新后的实例从待更新列表移除，commit() 时不再重复逐条更新。
+
         Args:
             instances: 模型实例列表（必须是同一模型类，且已有主键）
 
@@ -352,7 +357,16 @@ class Session:
         # 触发 before_bulk_update 事件
         event.dispatch_model_bulk(model_class, 'before_bulk_update', instances)
 
-        # 构建 (pk, data) 元组列表
+        # 构建 (pk, data) 元组列表（列名映射只解析一次）
+        col_keys = [
+            (attr_name, column.name or attr_name)
+            for attr_name, column in model_class.__columns__.items()
+        ]
+        # list / dict 列可能被原地修改而不经过 __setattr__，总是写入
+        mutable_attrs = {
+            attr_name for attr_name, column in model_class.__columns__.items()
+            if column.col_type in (list, dict)
+        }
         updates: List[Tuple[Any, Dict[str, Any]]] = []
         for instance in instances:
             if pk_name:
@@ -365,16 +379,37 @@ class Session:
                     "Cannot bulk update instance without primary key or rowid"
                 )
 
-            data: Dict[str, Any] = {}
-            for attr_name, column in instance.__columns__.items():
-                value = getattr(instance, attr_name, None)
-                db_col_name = column.name if column.name else attr_name
-                data[db_col_name] = value
+            values = instance.__dict__
+            dirty_fields: Optional[Set[str]] = None
+            if values.get('_pytuck_session') is self:
+                dirty_fields = values.get('_pytuck_dirty_fields')
+
+            if dirty_fields is None:
+                data = {db_col: values.get(attr) for attr, db_col in col_keys}
+            else:
+                data = {
+                    db_col: values.get(attr)
+                    for attr, db_col in col_keys
+                    if attr in dirty_fields or attr in mutable_attrs
+                }
             updates.append((pk, data))
 
         # 批量更新到 Storage
         count = self.storage.bulk_update(table_name, updates)
 
+        # 已写入的实例不再需要 flush 时逐条更新
+        removed = 0
+        for instance in instances:
+            values = instance.__dict__
+            if values.get('_pytuck_session') is self and \
+                    values.pop('_pytuck_dirty_fields', None) is not None:
+                removed += 1
+        if removed:
+            self._dirty_objects = [
+                obj for obj in self._dirty_objects
+                if '_pytuck_dirty_fields' in obj.__dict__
+            ]
+
         # 触发 after_bulk_update 事件
         event.dispatch_model_bulk(model_class, 'after_bulk_update', instances)
 
@@ -507,7 +542,9 @@ class Session:
     def execute(self, statement: Select[T]) -> Result[T]: ...
 
     @overload
-    def execute(self, statement: Insert[T]) -> CursorResult[T]: ...
+    def execute(
+        self, statement: Insert[T], params: Optional[Sequence[Mapping[str, Any]]] = None
+    ) -> CursorResult[T]: ...
 
     @overload
     def execute(self, statement: Update[T]) -> CursorResult[T]: ...
@@ -515,12 +552,15 @@ class Session:
     @overload
     def execute(self, statement: Delete[T]) -> CursorResult[T]: ...
 
-    def execute(self, statement: Statement) -> Union[Result, CursorResult]:
+    def execute(
+        self, statement: Statement, params: Optional[Sequence[Mapping[str, Any]]] = None
+    ) -> Union[Result, CursorResult]:
         """
         执行 statement（SQLAlchemy 2.0 风格）
 
         Args:
             statement: Statement 对象 (Select, Insert, Update, Delete)
+            params: 多行参数列表（仅 Insert 支持，executemany 语义）
 
         Returns:
             Result 对象
@@ -535,9 +575,21 @@ class Session:
             stmt = insert(User).values(name='Alice', age=20)
             result = session.execute(stmt)
             session.commit()
+
+            # 批量插入（语句只构建一次，逐行绑定参数）
+            result = session.execute(insert(User), [
+                {'name': 'Alice', 'age': 20},
+                {'name': 'Bob', 'age': 22},
+            ])
+            session.commit()
         """
-        from ..query.statements import Select, Insert, Update, Delete
-        from ..query.result import Result, CursorResult
+        if params is not None:
+            if not isinstance(statement, Insert):
+                raise QueryError(
+                    f"Multi-row params are only supported for Insert, got {type(statement).__name__}",
+                    details={'statement_type': type(statement).__name__}
+                )
+            return self._execute_insert_many(statement, params)
 
         # 原生 SQL 模式：使用编译器执行
         if self.storage.is_native_sql_mode:
@@ -571,6 +623,92 @@ class Session:
                 details={'statement_type': type(statement).__name__}
             )
 
+    def _execute_insert_many(
+        self, statement: Insert[T], params: Sequence[Mapping[str, Any]]
+    ) -> CursorResult[T]:
+        """
+        以多组参数执行 INSERT（executemany 语义）
+
+        Args:
+            statement: Insert 语句（values() 中的值作为每行的公共值）
+            params: 每行一个的 {属性名: 值} 字典列表
+
+        Returns:
+            CursorResult，rowcount 为插入行数；多行插入不提供 inserted_primary_key
+        """
+        if self.storage.is_native_sql_mode:
+            self._execute_native_insert_many(statement, params)
+        else:
+            statement._execute_many(self.storage, params)
+
+        return CursorResult(len(params), statement.model_class, 'insert')
+
+    def _execute_native_insert_many(
+        self, statement: Insert[T], params: Sequence[Mapping[str, Any]]
+    ) -> None:
+        """
+        原生 SQL 模式下以多组参数执行 INSERT
+
+        所有行先完成验证，任一行验证失败时不会插入任何行；验证通过后以各行列名的并集
+        构建一条 INSERT 语句，按给定顺序通过 executemany 执行，行中缺少的列写入 NULL。
+        执行阶段的数据库错误（如约束冲突）不会撤销已插入的行。
+
+        Args:
+            statement: Insert 语句（values() 中的值作为每行的公共值）
+            params: 每行一个的 {属性名: 值} 字典列表
+        """
+        assert self.storage._connector is not None, "Connector must not be None in native SQL mode"
+        connector = self.storage._connector
+        model_class = statement.model_class
+        table_name = model_class.__tablename__
+        assert table_name is not None, f"Model {model_class.__name__} must have __tablename__ defined"
+        table = self.storage.get_table(table_name)
+
+        rows: List[Dict[str, Any]] = []
+        columns: Dict[str, None] = {}  # 各行列名的并集（保持首次出现的顺序）
+        for row in params:
+            values = dict(statement._values)
+            values.update(row)
+            validated_data = self._validate_native_values(model_class, table.columns, values)
+            columns.update(dict.fromkeys(validated_data))
+            rows.append(validated_data)
+        if not rows:
+            return
+
+        # 所有行共用一条 INSERT 语句，保持插入顺序与给定顺序一致
+        max_rowid = connector.insert_rows(table_name, list(columns), rows)
+
+        # 更新 next_id（仅整数主键或无主键时 rowid 与主键一致）
+        pk_attr_name = model_class.__primary_key__
+        if pk_attr_name is None or model_class.__columns__[pk_attr_name].col_type is int:
+            if max_rowid >= table.next_id:
+                table.next_id = max_rowid + 1
+                self.storage._dirty = True
+
+    @staticmethod
+    def _validate_native_values(
+        model_class: Type[PureBaseModel], columns: Dict[str, Column], values: Mapping[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        原生 SQL 模式下验证值，并将属性名转换为 Column.name
+
+        Args:
+            model_class: 模型类
+            columns: 表的列定义（以 Column.name 为键）
+            values: {属性名: 值} 字典
+
+        Returns:
+            {Column.name: 验证后的值} 字典
+        """
+        validated_data: Dict[str, Any] = {}
+        for attr_name, value in values.items():
+            if attr_name in model_class.__columns__:
+                model_column = model_class.__columns__[attr_name]
+                db_col_name = model_column.name if model_column.name else attr_name
+                if db_col_name in columns:
+                    validated_data[db_col_name] = columns[db_col_name].validate(value)
+        return validated_data
+
     def _execute_native_sql(self, statement: Statement) -> Union[Result, CursorResult]:
         """
         原生 SQL 模式下执行语句
@@ -583,9 +721,7 @@ class Session:
         Returns:
             Result 或 CursorResult
         """
-        from ..query.statements import Select, Insert, Update, Delete
         from ..query.compiler import QueryCompiler
-        from ..query.result import Result, CursorResult
 
         compiler = QueryCompiler()
 
@@ -642,15 +778,9 @@ class Session:
             table = self.storage.get_table(statement.model_class.__tablename__)
 
             # 验证和序列化值（使用 Column.name 作为存储键）
-            validated_data = {}
-            for attr_name, value in statement._values.items():
-                # 将属性名转换为 Column.name
-                if attr_name in statement.model_class.__columns__:
-                    model_column = statement.model_class.__columns__[attr_name]
-                    db_col_name = model_column.name if model_column.name else attr_name
-                    if db_col_name in table.columns:
-                        column = table.columns[db_col_name]
-                        validated_data[db_col_name] = column.validate(value)
+            validated_data = self._validate_native_values(
+                statement.model_class, table.columns, statement._values
+            )
 
             # 获取主键的 Column.name
             pk_attr_name = statement.model_class.__primary_key__
@@ -684,15 +814,9 @@ class Session:
                 pk_col_name = pk_column.name if pk_column.name else pk_attr_name
 
             # 验证值（使用 Column.name 作为存储键）
-            validated_data = {}
-            for attr_name, value in statement._values.items():
-                # 将属性名转换为 Column.name
-                if attr_name in statement.model_class.__columns__:
-                    model_column = statement.model_class.__columns__[attr_name]
-                    db_col_name = model_column.name if model_column.name else attr_name
-                    if db_col_name in table.columns:
-                        column = table.columns[db_col_name]
-                        validated_data[db_col_name] = column.validate(value)
+            validated_data = self._validate_native_values(
+                statement.model_class, table.columns, statement._values
+            )
 
             # 优化：主键直接更新（仅对简单 BinaryExpression 生效）
             pk_value = None
@@ -797,22 +921,24 @@ class Session:
         Args:
             instance: 模型实例
         """
+        values = instance.__dict__
         pk_name = instance.__primary_key__
         if pk_name:
-            pk = getattr(instance, pk_name, None)
+            pk = values.get(pk_name)
             if pk is not None:
                 key = (instance.__class__, pk)
                 self._identity_map[key] = instance
         else:
             # 无主键：使用隐式 rowid
-            rowid = getattr(instance, '_pytuck_rowid', None)
+            rowid = values.get('_pytuck_rowid')
             if rowid is not None:
                 key = (instance.__class__, (PSEUDO_PK_NAME, rowid))
                 self._identity_map[key] = instance
 
         # 设置实例的 session 引用，用于脏跟踪
-        instance._pytuck_session = self
-        instance._pytuck_state = 'persistent'
+        # （内部属性不是 Column，直接写入 __dict__，不经过 __setattr__ 的脏跟踪判断）
+        values['_pytuck_session'] = self
+        values['_pytuck_state'] = 'persistent'
 
     def _get_from_identity_map(self, model_class: Type[T], pk: Any) -> Optional[T]:
         """
@@ -828,15 +954,32 @@ class Session:
         key = (model_class, pk)
         return self._identity_map.get(key)  # type: ignore
 
-    def _mark_dirty(self, instance: PureBaseModel) -> None:
+    def _mark_dirty(self, instance: PureBaseModel, attr_name: Optional[str] = None) -> None:
         """
-        标记实例为 dirty（需要更新）
+        标记实例为 dirty（需要更新），并记录被修改的列属性名
+
+        被修改的属性名记录在实例的 _pytuck_dirty_fields 集合中，
+        该集合同时作为"已在 _dirty_objects 中"的标记，避免线性查找列表。
 
         Args:
             instance: 模型实例
+            attr_name: 被修改的列属性名
         """
-        if instance not in self._dirty_objects and instance not in self._new_objects:
+        dirty_fields: Optional[Set[str]] = instance.__dict__.get('_pytuck_dirty_fields')
+        if dirty_fields is None:
+            if instance in self._new_objects:
+                return
+            dirty_fields = set()
+            instance.__dict__['_pytuck_dirty_fields'] = dirty_fields
             self._dirty_objects.append(instance)
+        if attr_name is not None:
+            dirty_fields.add(attr_name)
+
+    def _clear_dirty(self) -> None:
+        """清空待更新列表及各实例记录的修改字段"""
+        for instance in self._dirty_objects:
+            instance.__dict__.pop('_pytuck_dirty_fields', None)
+        self._dirty_objects.clear()
 
     def merge(self, instance: PureBaseModel) -> PureBaseModel:
         """
@@ -889,10 +1032,9 @@ class Session:
         if existing is not None:
             # 已存在，更新其属性
             for col_name, column in model_class.__columns__.items():
-                if hasattr(instance, col_name):
-                    value = getattr(instance, col_name)
-                    if getattr(existing, col_name) != value:
-                        setattr(existing, col_name, value)
+                value = getattr(instance, col_name)
+                if getattr(existing, col_name) != value:
+                    setattr(existing, col_name, value)
             return existing
 
         # 不存在于 identity map
@@ -903,10 +1045,9 @@ class Session:
             if existing is not None:
                 # 从数据库加载成功，更新属性
                 for col_name, column in model_class.__columns__.items():
-                    if hasattr(instance, col_name):
-                        value = getattr(instance, col_name)
-                        if getattr(existing, col_name) != value:
-                            setattr(existing, col_name, value)
+                    value = getattr(instance, col_name)
+                    if getattr(existing, col_name) != value:
+                        setattr(existing, col_name, value)
                 return existing
 
         # 数据库中也不存在（或无主键模型），作为新对象处理
@@ -5,11 +5,12 @@ Pytuck 存储引擎
 """
 
 import copy
+import itertools
 import json
 import sqlite3
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Iterator, Tuple, Optional, Generator, Type, Union, TYPE_CHECKING, Sequence
+from typing import Any, Callable, Dict, List, Iterator, Tuple, Optional, Generator, Type, Union, TYPE_CHECKING, Sequence, Set
 from contextlib import contextmanager
 
 from ..common.options import BackendOptions, SyncOptions, SyncResult
@@ -287,77 +288,76 @@ class Table:
         if not records:
             return []
 
-        pks: List[Any] = []
-
         # 第一阶段：批量分配主键
-        has_user_pk = self.primary_key and self.primary_key in self.columns
-        if has_user_pk:
-            pk_column = self.columns[self.primary_key]  # type: ignore[index]
-            auto_count = 0
-            # 先统计需要自动分配主键的数量
-            for record in records:
-                pk = record.get(self.primary_key)  # type: ignore[arg-type]
-                if pk is None:
-                    if pk_column.col_type == int:
-                        auto_count += 1
-                    else:
-                        raise ValidationError(
-                            f"Primary key '{self.primary_key}' must be provided",
-                            table_name=self.name,
-                            column_name=self.primary_key
-                        )
-            # 一次性预留主键范围
-            start_id = self.next_id
-            self.next_id += auto_count
-            auto_idx = 0
-
-            for record in records:
-                pk = record.get(self.primary_key)  # type: ignore[arg-type]
-                pk = self._normalize_pk(pk)
-                if pk is None:
-                    pk = start_id + auto_idx
-                    auto_idx += 1
-                    record[self.primary_key] = pk  # type: ignore[index]
-                else:
-                    record[self.primary_key] = pk  # type: ignore[index]
-                    if pk in self.data:
+        pks: List[Any]
+        pk_name = self.primary_key
+        if pk_name and pk_name in self.columns:
+            pk_column = self.columns[pk_name]
+            pks = [pk_column.validate(record.get(pk_name)) for record in records]
+
+            # 手动指定的主键：批次内不可重复，也不可与已有记录冲突
+            auto_count = pks.count(None)
+            manual_pks = {pk for pk in pks if pk is not None}
+            if len(manual_pks) != len(pks) - auto_count:
+                seen: Set[Any] = set()
+                for pk in pks:
+                    if pk in seen:
                         raise DuplicateKeyError(self.name, pk)
-                # 检查已分配的主键是否与前面的冲突
-                if pk in self.data:
-                    raise DuplicateKeyError(self.name, pk)
-                pks.append(pk)
+                    if pk is not None:
+                        seen.add(pk)
+            collision = self.data.keys() & manual_pks
+            if collision:
+                raise DuplicateKeyError(self.name, next(pk for pk in pks if pk in collision))
+
+            # 缺少主键的行从 next_id 起连续分配，跳过本批手动指定的主键和已有记录
+            if auto_count:
+                if pk_column.col_type != int:
+                    raise ValidationError(
+                        f"Primary key '{pk_name}' must be provided",
+                        table_name=self.name,
+                        column_name=pk_name
+                    )
+                data = self.data
+                auto_range = range(self.next_id, self.next_id + auto_count)
+                if not manual_pks and data.keys().isdisjoint(auto_range):
+                    # 常见情况：整批都未指定主键，直接取连续区间
+                    pks = list(auto_range)
+                else:
+                    auto_pks = (
+                        pk for pk in itertools.count(self.next_id)
+                        if pk not in manual_pks and pk not in data
+                    )
+                    pks = [next(auto_pks) if pk is None else pk for pk in pks]
+
+            for record, pk in zip(records, pks):
+                record[pk_name] = pk
         else:
             # 无用户主键：批量分配 rowid
-            start_id = self.next_id
-            self.next_id += len(records)
-            for i in range(len(records)):
-                pks.append(start_id + i)
-
-        # 检查批次内主键无重复
-        if len(set(pks)) != len(pks):
-            # 找出重复的主键
-            seen: Dict[Any, int] = {}
-            for pk in pks:
-                if pk in seen:
-                    raise DuplicateKeyError(self.name, pk)
-                seen[pk] = 1
-
-        # 第二阶段：批量验证字段并存储记录
-        for i, record in enumerate(records):
-            pk = pks[i]
-            validated_record: Dict[str, Any] = {}
-            for col_name, column in self.columns.items():
-                value = record.get(col_name)
-                validated_value = column.validate(value)
-                validated_record[col_name] = validated_value
-            self.data[pk] = validated_record
+            pks = list(range(self.next_id, self.next_id + len(records)))
+
+        # 第二阶段：批量验证字段（验证器只查找一次），全部通过后再存储记录。
+        # 整列值的类型与列类型完全一致（可空列允许 None）时 validate 会原样返回，
+        # 先按列扫描类型，命中的列直接取值，不再逐个调用 validate
+        validators: List[Tuple[str, Optional[Callable[[Any], Any]]]] = []
+        for col_name, column in self.columns.items():
+            allowed = {column.col_type, type(None)} if column.nullable else {column.col_type}
+            value_types = {type(record.get(col_name)) for record in records}
+            validators.append((col_name, None if value_types <= allowed else column.validate))
+        validated_records = [
+            {
+                col_name: record.get(col_name) if validate is None else validate(record.get(col_name))
+                for col_name, validate in validators
+            }
+            for record in records
+        ]
+        self.data.update(zip(pks, validated_records))
 
         # 第三阶段：批量更新索引
         for col_name, index in self.indexes.items():
-            for i, pk in enumerate(pks):
-                value = self.data[pk].get(col_name)
-                if value is not None:
-                    index.insert(value, pk)
+            index.bulk_insert(
+                (validated_record.get(col_name), pk)
+                for pk, validated_record in zip(pks, validated_records)
+            )
 
         # 更新 next_id（处理手动指定的大主键）
         for pk in pks:
@@ -383,38 +383,49 @@ class Table:
         if not updates:
             return 0
 
-        count = 0
-
+        # 第一阶段：验证全部行（主键存在、字段合法），全部通过后再写入；
+        # 同一主键出现多次时在前一次的结果上继续更新
+        data = self.data
+        columns = self.columns
+        old_records: Dict[Any, Dict[str, Any]] = {}
+        new_records: Dict[Any, Dict[str, Any]] = {}
         for pk, record in updates:
             pk = self._normalize_pk(pk)
-            if pk not in self.data:
-                raise RecordNotFoundError(self.name, pk)
+            current = new_records.get(pk)
+            if current is None:
+                if pk not in data:
+                    raise RecordNotFoundError(self.name, pk)
+                current = old_records[pk] = data[pk]
 
-            old_record = self.data[pk]
-
-            # 验证和处理字段
-            validated_record = old_record.copy()
+            validated_record = current.copy()
             for col_name, value in record.items():
-                if col_name in self.columns:
-                    column = self.columns[col_name]
+                column = columns.get(col_name)
+                if column is not None:
                     validated_record[col_name] = column.validate(value)
+            new_records[pk] = validated_record
+
+        # 第二阶段：一次性存储记录
+        data.update(new_records)
 
-            # 更新索引（先删除旧值，再插入新值）
-            for col_name, index in self.indexes.items():
-                old_value = old_record.get(col_name)
+        # 第三阶段：按列收集值发生变化的条目，批量删除旧值后批量插入新值
+        for col_name, index in self.indexes.items():
+            removed: List[Tuple[Any, Any]] = []
+            added: List[Tuple[Any, Any]] = []
+            for pk, validated_record in new_records.items():
+                old_value = old_records[pk].get(col_name)
                 new_value = validated_record.get(col_name)
 
                 if old_value != new_value:
                     if old_value is not None:
-                        index.remove(old_value, pk)
+                        removed.append((old_value, pk))
                     if new_value is not None:
-                        index.insert(new_value, pk)
+                        added.append((new_value, pk))
+            if removed:
+                index.bulk_remove(removed)
+            if added:
+                index.bulk_insert(added)
 
-            # 存储记录
-            self.data[pk] = validated_record
-            count += 1
-
-        return count
+        return len(updates)
 
     def get(self, pk: Any) -> Dict[str, Any]:
         """
@@ -521,10 +532,7 @@ class Table:
             index = HashIndex(column_name)
 
         # 为现有数据建立索引
-        for pk, record in self.data.items():
-            value = record.get(column_name)
-            if value is not None:
-                index.insert(value, pk)
+        index.bulk_insert((record.get(column_name), pk) for pk, record in self.data.items())
 
         self.indexes[column_name] = index
 
@@ -1535,34 +1543,25 @@ class Storage:
 
         return result
 
-    def query(self,
-              table_name: str,
-              conditions: Sequence[ConditionType],
-              limit: Optional[int] = None,
-              offset: int = 0,
-              order_by: Optional[str] = None,
-              order_desc: bool = False) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _resolve_candidates(
+        table: Table,
+        conditions: Sequence[ConditionType]
+    ) -> Tuple[Set[Any], List[ConditionType]]:
         """
-        查询多条记录
+        根据条件计算候选主键集合（内存模式）
+
+        对简单条件优先使用索引缩小候选集，无法走索引的条件留给调用方逐条过滤。
+        剩余条件合并为一个过滤列表：简单条件按估计选择性排序（等值优先），
+        复合条件放在最后，逐条评估时可尽早短路。
 
         Args:
-            table_name: 表名
-            conditions: 查询条件列表（支持 Condition 和 CompositeCondition）
-            limit: 限制返回记录数（None 表示无限制）
-            offset: 跳过的记录数
-            order_by: 排序字段名
-            order_desc: 是否降序排列
+            table: Table 对象
+            conditions: 查询条件列表
 
         Returns:
-            记录字典列表
+            (候选主键集合, 按评估顺序排列的剩余条件)
         """
-        table = self.get_table(table_name)
-
-        # 原生 SQL 模式：直接执行 SQL
-        if self._native_sql_mode and self._connector:
-            return self._query_native_sql(table_name, table, conditions, limit, offset, order_by, order_desc)
-
-        # 内存模式
         # 分离简单条件和复合条件
         simple_conditions: List[Condition] = []
         composite_conditions: List[CompositeCondition] = []
@@ -1621,6 +1620,44 @@ class Storage:
             candidate_pks = set(table.data.keys())
             remaining_simple_conditions = simple_conditions
 
+        remaining_simple_conditions = sorted(
+            remaining_simple_conditions, key=Condition.estimated_selectivity
+        )
+        filters: List[ConditionType] = []
+        filters.extend(remaining_simple_conditions)
+        filters.extend(composite_conditions)
+        return candidate_pks, filters
+
+    def query(self,
+              table_name: str,
+              conditions: Sequence[ConditionType],
+              limit: Optional[int] = None,
+              offset: int = 0,
+              order_by: Optional[str] = None,
+              order_desc: bool = False) -> List[Dict[str, Any]]:
+        """
+        查询多条记录
+
+        Args:
+            table_name: 表名
+            conditions: 查询条件列表（支持 Condition 和 CompositeCondition）
+            limit: 限制返回记录数（None 表示无限制）
+            offset: 跳过的记录数
+            order_by: 排序字段名
+            order_desc: 是否降序排列
+
+        Returns:
+            记录字典列表
+        """
+        table = self.get_table(table_name)
+
+        # 原生 SQL 模式：直接执行 SQL
+        if self._native_sql_mode and self._connector:
+            return self._query_native_sql(table_name, table, conditions, limit, offset, order_by, order_desc)
+
+        # 内存模式
+        candidate_pks, filters = self._resolve_candidates(table, conditions)
+
         # 检查是否可以使用索引排序
         use_index_order = (
             order_by
@@ -1647,9 +1684,7 @@ class Storage:
                     if pk not in table.data:
                         continue
                     record = table.data[pk]
-                    if not all(cond.evaluate(record) for cond in remaining_simple_conditions):
-                        continue
-                    if not all(cond.evaluate(record) for cond in composite_conditions):
+                    if not all(cond.evaluate(record) for cond in filters):
                         continue
                     record_copy = record.copy()
                     if not table.primary_key:
@@ -1680,9 +1715,7 @@ class Storage:
                 if pk not in table.data:
                     continue
                 record = table.data[pk]
-                if not all(cond.evaluate(record) for cond in remaining_simple_conditions):
-                    continue
-                if not all(cond.evaluate(record) for cond in composite_conditions):
+                if not all(cond.evaluate(record) for cond in filters):
                     continue
 
                 record_copy = record.copy()
@@ -1705,11 +1738,8 @@ class Storage:
             for pk in candidate_pks:
                 if pk in table.data:
                     record = table.data[pk]
-                    # 评估简单条件
-                    if not all(cond.evaluate(record) for cond in remaining_simple_conditions):
-                        continue
-                    # 评估复合条件（OR/AND/NOT）
-                    if not all(cond.evaluate(record) for cond in composite_conditions):
+                    # 按选择性顺序评估剩余条件（任一不满足即短路）
+                    if not all(cond.evaluate(record) for cond in filters):
                         continue
 
                     record_copy = record.copy()
@@ -1748,6 +1778,61 @@ class Storage:
 
             return results
 
+    def count(self,
+              table_name: str,
+              conditions: Sequence[ConditionType],
+              limit: Optional[int] = None) -> int:
+        """
+        统计满足条件的记录数
+
+        只评估条件并计数，不复制记录。
+
+        Args:
+            table_name: 表名
+            conditions: 查询条件列表（支持 Condition 和 CompositeCondition）
+            limit: 计数上限，达到后提前停止（None 表示无限制）
+
+        Returns:
+            记录数（不超过 limit）
+        """
+        table = self.get_table(table_name)
+        if limit is not None and limit <= 0:
+            return 0
+
+        # 原生 SQL 模式：直接执行 COUNT 查询
+        if self._native_sql_mode and self._connector:
+            where_clause, params = self._compile_where_clause(conditions)
+            inner_sql = f'SELECT 1 FROM `{table_name}`'
+            if where_clause:
+                inner_sql += f' WHERE {where_clause}'
+            if limit is not None:
+                inner_sql += ' LIMIT ?'
+                params.append(limit)
+            cursor = self._connector.execute(
+                f'SELECT COUNT(*) FROM ({inner_sql})', tuple(params)
+            )
+            result = cursor.fetchone()
+            return int(result[0]) if result else 0
+
+        # 内存模式
+        if not conditions:
+            total = len(table.data)
+            return total if limit is None else min(total, limit)
+
+        candidate_pks, filters = self._resolve_candidates(table, conditions)
+
+        count = 0
+        for pk in candidate_pks:
+            record = table.data.get(pk)
+            if record is None:
+                continue
+            if not all(cond.evaluate(record) for cond in filters):
+                continue
+            count += 1
+            if limit is not None and count >= limit:
+                break
+        return count
+
     def _query_native_sql(
         self,
         table_name: str,
@@ -1777,22 +1862,7 @@ class Storage:
         connector = self._connector
 
         # 构建 WHERE 子句
-        where_parts: List[str] = []
-        params: List[Any] = []
-
-        for condition in conditions:
-            if isinstance(condition, CompositeCondition):
-                # 编译复合条件
-                sql_part, cond_params = self._compile_composite_condition(condition)
-                where_parts.append(f'({sql_part})')
-                params.extend(cond_params)
-            else:
-                # 简单条件
-                op = self._convert_operator(condition.operator)
-                where_parts.append(f'`{condition.field}` {op} ?')
-                params.append(condition.value)
-
-        where_clause = ' AND '.join(where_parts) if where_parts else None
+        where_clause, params = self._compile_where_clause(conditions)
 
         # 构建 ORDER BY 子句
         order_by_clause = None
@@ -1814,6 +1884,37 @@ class Storage:
         results = [self._deserialize_record(row, table.columns) for row in rows]
         return results
 
+    def _compile_where_clause(
+        self,
+        conditions: Sequence[ConditionType]
+    ) -> Tuple[Optional[str], List[Any]]:
+        """
+        编译条件列表为 WHERE 子句（不含 WHERE 关键字）
+
+        Args:
+            conditions: 查询条件列表（支持 Condition 和 CompositeCondition）
+
+        Returns:
+            (WHERE 子句或 None, 参数列表)
+        """
+        where_parts: List[str] = []
+        params: List[Any] = []
+
+        for condition in conditions:
+            if isinstance(condition, CompositeCondition):
+                # 编译复合条件
+                sql_part, cond_params = self._compile_composite_condition(condition)
+                where_parts.append(f'({sql_part})')
+                params.extend(cond_params)
+            else:
+                # 简单条件
+                op = self._convert_operator(condition.operator)
+                where_parts.append(f'`{condition.field}` {op} ?')
+                params.append(condition.value)
+
+        where_clause = ' AND '.join(where_parts) if where_parts else None
+        return where_clause, params
+
     def _compile_composite_condition(
         self,
         condition: CompositeCondition
@@ -2027,6 +2128,30 @@ class Storage:
             self._transaction_snapshot = None
             self._in_transaction = False
 
+    @contextmanager
+    def batch_schema(self) -> Generator['Storage', None, None]:
+        """
+        批量建表上下文管理器
+
+        auto_flush=True 时每声明一个模型（create_table）都会完整保存一次文件。
+        在块内连续声明多个模型时暂停 auto_flush，块正常结束后只写盘一次；
+        块内的其他写操作同样合并到这次写盘中。异常退出时不写盘。
+
+        Example:
+            with storage.batch_schema():
+                class User(Base): ...
+                class Order(Base): ...
+        """
+        old_auto_flush = self.auto_flush
+        self.auto_flush = False
+        try:
+            yield self
+        finally:
+            self.auto_flush = old_auto_flush
+
+        if old_auto_flush:
+            self.flush()
+
     def _init_wal_mode(self) -> None:
         """
         初始化 WAL 模式
@@ -2143,6 +2268,29 @@ class Storage:
                 self._init_wal_mode()
             event.dispatch_storage(self, 'after_flush')
 
+    def reload(self) -> None:
+        """
+        从磁盘重新加载所有表
+
+        丢弃内存中尚未 flush 的修改，用后端文件中的数据替换当前表。
+        已注册的模型类保持可用，无需重新声明。
+        原生 SQL 模式下数据始终直接读取数据库，此方法不做任何操作。
+
+        Raises:
+            TransactionError: 在事务中调用时
+        """
+        if self._in_transaction:
+            raise TransactionError("Cannot reload storage inside a transaction")
+        if self.backend is None or self._native_sql_mode:
+            return
+
+        self.tables = self.backend.load() if self.backend.exists() else {}
+        self._dirty = False
+        self._wal_entry_count = 0
+
+        if self.engine_name == 'binary':
+            self._init_wal_mode()
+
     def close(self) -> None:
         """关闭数据库"""
         self.flush()
@@ -6,7 +6,7 @@ Pytuck 类型系统
 
 from abc import ABC, abstractmethod
 from enum import IntEnum
-from typing import Any, Callable, Tuple, Dict, Type
+from typing import Any, Callable, Tuple, Dict, Optional, Type
 import struct
 import json
 import base64
@@ -559,3 +559,18 @@ class TypeRegistry:
             return deserializer(value)
         # str 或其他类型保持原样
         return value
+
+    @classmethod
+    def get_text_deserializer(cls, col_type: ColumnTypes) -> Optional[Callable[[Any], Any]]:
+        """获取文本反序列化函数
+
+        供按列批量反序列化的场景预先取出函数，避免逐值查表。
+        返回的函数只处理非空值，空值（None 或 ''）需由调用方处理。
+
+        Args:
+            col_type: 列的类型
+
+        Returns:
+            反序列化函数；str 等无需转换的类型返回 None
+        """
+        return _TEXT_DESERIALIZERS.get(col_type)
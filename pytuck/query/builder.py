@@ -4,6 +4,7 @@ Pytuck 查询构建器
 提供链式查询API
 """
 
+import operator
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Generic, TYPE_CHECKING, Union
 
 from ..common.typing import T
@@ -15,16 +16,27 @@ if TYPE_CHECKING:
     from ..core.storage import Storage
 
 
-_OPERATOR_EVAL: Dict[str, Callable[[Any, Any], bool]] = {
-    '=': lambda x, y: x == y,
-    '>': lambda x, y: x > y,
-    '<': lambda x, y: x < y,
-    '>=': lambda x, y: x >= y,
-    '<=': lambda x, y: x <= y,
-    '!=': lambda x, y: x != y,
+_OPERATOR_EVAL: Dict[str, Callable[[Any, Any], Any]] = {
+    '=': operator.eq,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '!=': operator.ne,
     'IN': lambda x, y: x in y
 }
 
+# 操作符选择性估计：值越小，通常过滤掉的记录越多，应越早评估
+_OPERATOR_SELECTIVITY: Dict[str, int] = {
+    '=': 0,
+    'IN': 1,
+    '>': 2,
+    '<': 2,
+    '>=': 2,
+    '<=': 2,
+    '!=': 3,
+}
+
 
 class Condition:
     """查询条件"""
@@ -41,11 +53,14 @@ class Condition:
         Raises:
             QueryError: 如果操作符不被支持
         """
-        if operator not in _OPERATOR_EVAL:
+        compare = _OPERATOR_EVAL.get(operator)
+        if compare is None:
             raise QueryError(f"Unsupported operator: {operator}")
         self.field = field
         self.operator = operator
         self.value = value
+        # 构造时绑定比较函数，evaluate 时无需再查表
+        self._compare = compare
 
     def evaluate(self, record: dict) -> bool:
         """
@@ -59,8 +74,18 @@ class Condition:
         """
         if self.field not in record:
             return False
-        field_value = record[self.field]
-        return bool(_OPERATOR_EVAL[self.operator](field_value, self.value))
+        return bool(self._compare(record[self.field], self.value))
+
+    def estimated_selectivity(self) -> int:
+        """
+        估计条件的选择性等级
+
+        等值 < IN < 范围 < 不等；AND 链中按此排序评估，可让最可能失败的条件先短路。
+
+        Returns:
+            选择性等级（越小越先评估）
+        """
+        return _OPERATOR_SELECTIVITY[self.operator]
 
     def __repr__(self) -> str:
         return f"Condition({self.field} {self.operator} {self.value})"
@@ -86,11 +111,18 @@ class BinaryExpression:
         self.column = column
         self.operator = operator
         self.value = value
+        self._condition: Optional[Condition] = None
 
     def to_condition(self) -> Condition:
-        """转换为 Condition 对象"""
-        assert self.column.name is not None, "Column name must be set"
-        return Condition(self.column.name, self.operator, self.value)
+        """
+        转换为 Condition 对象
+
+        转换结果缓存在表达式上，同一语句重复执行时复用已编译的条件。
+        """
+        if self._condition is None:
+            assert self.column.name is not None, "Column name must be set"
+            self._condition = Condition(self.column.name, self.operator, self.value)
+        return self._condition
 
     def __repr__(self) -> str:
         return f"BinaryExpression({self.column.name} {self.operator} {self.value})"
@@ -452,16 +484,20 @@ class Query(Generic[T]):
         records = self._execute()
 
         # 转换为模型实例
+        column_attrs = self.model_class.__column_attrs__
+        custom_names = self.model_class.__has_custom_column_names__
         instances = []
         for record in records:
-            # 将 Column.name 映射为模型属性名
-            mapped = {}
-            for db_col_name, value in record.items():
-                if db_col_name == PSEUDO_PK_NAME:
-                    continue  # 跳过内部 rowid
-                # 使用模型的 _column_to_attr_name 方法转换
-                attr_name = self.model_class._column_to_attr_name(db_col_name) or db_col_name
-                mapped[attr_name] = value
+            # 将 Column.name 映射为模型属性名（列名与属性名一致时直接复制）
+            if custom_names:
+                mapped = {
+                    column_attrs.get(db_col_name, db_col_name): value
+                    for db_col_name, value in record.items()
+                    if db_col_name != PSEUDO_PK_NAME
+                }
+            else:
+                mapped = dict(record)
+                mapped.pop(PSEUDO_PK_NAME, None)  # 跳过内部 rowid
 
             instance = self.model_class(**mapped)
 
@@ -473,22 +509,80 @@ class Query(Generic[T]):
 
         return instances
 
+    def pluck(self, field: str) -> List[Any]:
+        """
+        返回满足条件的记录中单个字段的值列表
+
+        直接从记录字典中取值，不创建模型实例。
+
+        Args:
+            field: 模型属性名
+
+        Returns:
+            字段值列表（顺序与 all() 一致）
+
+        Raises:
+            QueryError: 如果字段不存在
+
+        Example:
+            names = User.filter(User.age >= 18).order_by('name').pluck('name')
+        """
+        columns = getattr(self.model_class, '__columns__', {})
+        if field not in columns:
+            raise QueryError(
+                f"Column '{field}' not found in {self.model_class.__name__}",
+                column_name=field
+            )
+        column = columns[field]
+        db_col_name = column.name if column.name else field
+        return [record.get(db_col_name) for record in self._execute()]
+
     def count(self) -> int:
         """
         返回满足条件的记录数
 
+        只计数不取回记录，不创建模型实例；offset/limit 按切片语义折算。
+
         Returns:
             记录数
         """
-        records = self._execute()
-        return len(records)
+        if self._limit_value is not None and self._limit_value < 0:
+            return len(self._execute())
 
-    def _execute(self) -> List[dict]:
+        storage, table_name = self._resolve_target()
+        # 与 _execute 一致：非正数 offset 不跳过记录
+        offset = max(self._offset_value, 0)
+        cap = None
+        if self._limit_value is not None:
+            cap = offset + self._limit_value
+        total = storage.count(table_name, self._conditions, limit=cap)
+        return max(total - offset, 0)
+
+    def exists(self) -> bool:
         """
-        执行查询（内部方法）
+        判断是否存在满足条件的记录
+
+        找到第一条匹配记录即停止。
 
         Returns:
-            记录字典列表
+            存在返回 True，否则 False
+        """
+        if self._limit_value is not None:
+            return self.count() > 0
+
+        storage, table_name = self._resolve_target()
+        offset = max(self._offset_value, 0)
+        return storage.count(table_name, self._conditions, limit=offset + 1) > offset
+
+    def _resolve_target(self) -> Tuple['Storage', str]:
+        """
+        获取查询目标的 Storage 实例和表名（内部方法）
+
+        Returns:
+            (Storage 实例, 表名)
+
+        Raises:
+            QueryError: 未配置数据库或未定义表名
         """
         # 获取 storage 实例（新 API 优先，兼容旧 API）
         storage: Optional['Storage'] = (
@@ -509,6 +603,17 @@ class Query(Generic[T]):
         if not table_name:
             raise QueryError(f"No table name defined for {self.model_class.__name__}")
 
+        return storage, table_name
+
+    def _execute(self) -> List[dict]:
+        """
+        执行查询（内部方法）
+
+        Returns:
+            记录字典列表
+        """
+        storage, table_name = self._resolve_target()
+
         # 从存储引擎查询
         if len(self._order_by_fields) == 1:
             # 单列排序：下推给 Storage.query（可利用 SortedIndex 优化）
@@ -29,15 +29,20 @@ class _ScalarResult(Generic[T]):
     def _create_instance(self, record: Dict[str, Any]) -> T:
         """创建模型实例并处理 identity map"""
         # 将 Column.name 映射为模型属性名
-        mapped: Dict[str, Any] = {}
-        rowid = None
-        for db_col_name, value in record.items():
-            if db_col_name == PSEUDO_PK_NAME:
-                rowid = value
-            else:
-                # 使用模型的 _column_to_attr_name 方法转换
-                attr_name = self._model_class._column_to_attr_name(db_col_name) or db_col_name
-                mapped[attr_name] = value
+        mapped: Dict[str, Any]
+        if self._model_class.__has_custom_column_names__:
+            column_attrs = self._model_class.__column_attrs__
+            mapped = {}
+            rowid = None
+            for db_col_name, value in record.items():
+                if db_col_name == PSEUDO_PK_NAME:
+                    rowid = value
+                else:
+                    mapped[column_attrs.get(db_col_name, db_col_name)] = value
+        else:
+            # 列名与属性名一致时直接复制记录
+            mapped = dict(record)
+            rowid = mapped.pop(PSEUDO_PK_NAME, None)
 
         pk_name = getattr(self._model_class, '__primary_key__', None)
 
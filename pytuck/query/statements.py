@@ -4,7 +4,7 @@ SQLAlchemy 2.0 风格的 Statement API
 提供 select, insert, update, delete 语句构建器
 """
 
-from typing import Any, Dict, List, Optional, Tuple, Type, Generic, TYPE_CHECKING
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type, Generic, TYPE_CHECKING
 from abc import ABC, abstractmethod
 
 from ..common.typing import T
@@ -261,24 +261,50 @@ class Insert(Statement[T]):
         self._values.update(kwargs)
         return self
 
-    def _execute(self, storage: 'Storage') -> Any:
-        """执行插入，返回插入的主键"""
-        table_name = self.model_class.__tablename__
-        assert table_name is not None, f"Model {self.model_class.__name__} must have __tablename__ defined"
-
-        # 验证和转换值（使用 Column.name 作为存储键）
+    def _build_record(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        """验证和转换值（使用 Column.name 作为存储键）"""
         validated_data: Dict[str, Any] = {}
         for attr_name, column in self.model_class.__columns__.items():
             db_col_name = column.name if column.name else attr_name
-            if attr_name in self._values:
-                validated_data[db_col_name] = column.validate(self._values[attr_name])
+            if attr_name in values:
+                validated_data[db_col_name] = column.validate(values[attr_name])
             elif column.default is not None:
                 validated_data[db_col_name] = column.default
+        return validated_data
+
+    def _execute(self, storage: 'Storage') -> Any:
+        """执行插入，返回插入的主键"""
+        table_name = self.model_class.__tablename__
+        assert table_name is not None, f"Model {self.model_class.__name__} must have __tablename__ defined"
 
         # 插入
-        pk = storage.insert(table_name, validated_data)
+        pk = storage.insert(table_name, self._build_record(self._values))
         return pk
 
+    def _execute_many(self, storage: 'Storage', params: Sequence[Mapping[str, Any]]) -> List[Any]:
+        """
+        以多组参数执行插入（executemany 语义），返回插入的主键列表
+
+        语句只构建一次，每组参数与 values() 中设置的值合并后插入，
+        参数中的同名字段优先。所有行先完成验证，再通过 Storage.bulk_insert()
+        一次写入，任一行验证失败时不会插入任何行。
+
+        Args:
+            storage: Storage 实例
+            params: 每行一个的 {属性名: 值} 字典列表
+        """
+        table_name = self.model_class.__tablename__
+        assert table_name is not None, f"Model {self.model_class.__name__} must have __tablename__ defined"
+
+        records: List[Dict[str, Any]] = []
+        for row in params:
+            values = self._values
+            if row:
+                values = dict(self._values)
+                values.update(row)
+            records.append(self._build_record(values))
+        return storage.bulk_insert(table_name, records)
+
 
 class Update(Statement[T]):
     """
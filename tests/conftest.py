@@ -6,13 +6,16 @@ Pytest 配置和共享 fixtures
 import sys
 import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import TYPE_CHECKING, Callable, Generator, Optional, Sequence, Tuple, Type
 
 import pytest
 
 # 确保可以导入 pytuck
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+if TYPE_CHECKING:
+    from pytuck import Storage, CRUDBaseModel
+
 
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
@@ -41,3 +44,100 @@ def temp_file(temp_dir: Path) -> Generator[Path, None, None]:
         临时文件的 Path 对象（文件本身不会被创建）
     """
     yield temp_dir / "test_db.db"
+
+
+ENCRYPTED_ZIP_PASSWORD = 'test_password'
+
+
+def _make_user_model(db: 'Storage') -> Type['CRUDBaseModel']:
+    """
+    返回绑定到 db 的 Active Record User 模型（users 表：id 主键, name）
+
+    同一个 Storage 上已注册过 users 模型时直接复用，不再重复声明类。
+    """
+    from pytuck import Column, CRUDBaseModel, declarative_base
+
+    existing = db._get_model_by_table('users')
+    if existing is not None and issubclass(existing, CRUDBaseModel):
+        return existing
+
+    Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
+
+    class User(Base):
+        __tablename__ = 'users'
+        id = Column(int, primary_key=True)
+        name = Column(str)
+
+    return User
+
+
+@pytest.fixture(scope='session')
+def make_user_model() -> Callable[['Storage'], Type['CRUDBaseModel']]:
+    """
+    提供 users(id, name) 模型工厂
+
+    Example:
+        def test_x(make_user_model):
+            User = make_user_model(db)
+            User.create(id=1, name='Alice')
+    """
+    return _make_user_model
+
+
+def _write_user_zip(
+    path: Path, password: Optional[str] = None, rows: Sequence[Tuple[int, str]] = ((1, 'Alice'),)
+) -> Path:
+    """
+    写入只含 users 表（id, name）的 CSV ZIP 文件
+
+    Args:
+        path: ZIP 文件路径
+        password: ZIP 密码，None 或空字符串表示不加密
+        rows: (id, name) 行数据，通过 bulk_create 一次插入
+
+    Returns:
+        写入的文件路径
+    """
+    from pytuck import Storage
+    from pytuck.common.options import CsvBackendOptions
+
+    db = Storage(
+        file_path=str(path), engine='csv',
+        backend_options=CsvBackendOptions(password=password)
+    )
+    _make_user_model(db).bulk_create([{'id': id_, 'name': name} for id_, name in rows])
+    db.close()  # close() 会先 flush
+    return path
+
+
+@pytest.fixture(scope='session')
+def write_user_zip() -> Callable[..., Path]:
+    """
+    提供 users 表 CSV ZIP 文件写入函数
+
+    Example:
+        def test_x(tmp_path, write_user_zip):
+            db_path = write_user_zip(tmp_path / 'users.zip', password='secret')
+    """
+    return _write_user_zip
+
+
+@pytest.fixture(scope='session')
+def encrypted_zip_password() -> str:
+    """encrypted_user_zip 使用的密码"""
+    return ENCRYPTED_ZIP_PASSWORD
+
+
+@pytest.fixture(scope='session')
+def encrypted_user_zip(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    带密码的 CSV ZIP 文件（整个测试会话只生成一次）
+
+    包含一张 users 表（id, name），一行 Alice。
+    只读测试应先复制到自己的 tmp_path 再使用，避免相互影响。
+
+    Returns:
+        共享加密 ZIP 文件的 Path 对象
+    """
+    db_path = tmp_path_factory.mktemp('shared') / 'encrypted.zip'
+    return _write_user_zip(db_path, password=ENCRYPTED_ZIP_PASSWORD)
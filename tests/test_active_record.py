@@ -10,59 +10,119 @@ Pytuck Active Record 模式测试
 
 import os
 import sys
-import unittest
-from typing import Type
+from typing import Any, Generator, Type
+
+import pytest
 
 # 添加项目根目录到路径
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pytuck import Storage, declarative_base, Column, CRUDBaseModel
+from pytuck.common.exceptions import QueryError
 
 
-class TestActiveRecordBasic(unittest.TestCase):
-    """Active Record 基础功能测试"""
+# ============== Fixtures ==============
+
+@pytest.fixture
+def db() -> Generator[Storage, None, None]:
+    """内存数据库（每个测试独立，测试结束后关闭）"""
+    storage = Storage(in_memory=True)
+    yield storage
+    storage.close()
+
+
+@pytest.fixture
+def User(db: Storage) -> Type[CRUDBaseModel]:
+    """可写测试使用的 User 模型"""
+    Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
+
+    class User(Base):
+        __tablename__ = 'users'
+        id = Column(int, primary_key=True)
+        name = Column(str, nullable=False)
+        age = Column(int)
+        email = Column(str, nullable=True)
+
+    return User
+
+
+@pytest.fixture(scope='class')
+def query_user() -> Generator[Type[CRUDBaseModel], None, None]:
+    """
+    只读查询测试共享的 User 模型
+
+    查询测试不修改数据，整个测试类共用一个 Storage 和一份测试数据。
+    """
+    storage = Storage(in_memory=True)
+    Base: Type[CRUDBaseModel] = declarative_base(storage, crud=True)
+
+    class User(Base):
+        __tablename__ = 'users'
+        id = Column(int, primary_key=True)
+        name = Column(str, nullable=False)
+        age = Column(int)
+        active = Column(bool)
+
+    # 插入测试数据
+    User.bulk_create([
+        {'name': 'Alice', 'age': 20, 'active': True},
+        {'name': 'Bob', 'age': 25, 'active': False},
+        {'name': 'Charlie', 'age': 19, 'active': True},
+        {'name': 'David', 'age': 30, 'active': True},
+    ])
 
-    def setUp(self) -> None:
-        """测试前设置"""
-        self.db = Storage(in_memory=True)
-        Base: Type[CRUDBaseModel] = declarative_base(self.db, crud=True)
+    yield User
+    storage.close()
 
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str, nullable=False)
-            age = Column(int)
-            email = Column(str, nullable=True)
 
-        self.User = User
+@pytest.fixture(scope='class')
+def compare_user() -> Generator[Type[CRUDBaseModel], None, None]:
+    """比较操作符测试共享的 User 模型（只读）"""
+    storage = Storage(in_memory=True)
+    Base: Type[CRUDBaseModel] = declarative_base(storage, crud=True)
 
-    def tearDown(self) -> None:
-        """测试后清理"""
-        self.db.close()
+    class User(Base):
+        __tablename__ = 'users'
+        id = Column(int, primary_key=True)
+        name = Column(str)
+        age = Column(int)
 
-    def test_create(self) -> None:
+    # 插入测试数据
+    User.bulk_create([
+        {'name': name, 'age': age}
+        for name, age in [('Alice', 20), ('Bob', 25), ('Charlie', 30)]
+    ])
+
+    yield User
+    storage.close()
+
+
+class TestActiveRecordBasic:
+    """Active Record 基础功能测试"""
+
+    def test_create(self, User: Any) -> None:
         """测试 create 方法"""
-        user = self.User.create(name='Alice', age=20, email='alice@example.com')
+        user = User.create(name='Alice', age=20, email='alice@example.com')
 
-        self.assertIsNotNone(user.id)
-        self.assertEqual(user.name, 'Alice')
-        self.assertEqual(user.age, 20)
-        self.assertEqual(user.email, 'alice@example.com')
+        assert user.id is not None
+        assert user.name == 'Alice'
+        assert user.age == 20
+        assert user.email == 'alice@example.com'
 
-    def test_save_new(self) -> None:
+    def test_save_new(self, User: Any) -> None:
         """测试 save 新记录"""
-        user = self.User(name='Bob', age=25)
+        user = User(name='Bob', age=25)
         user.save()
 
-        self.assertIsNotNone(user.id)
+        assert user.id is not None
 
         # 验证保存
-        loaded = self.User.get(user.id)
-        self.assertEqual(loaded.name, 'Bob')
+        loaded = User.get(user.id)
+        assert loaded.name == 'Bob'
 
-    def test_save_update(self) -> None:
+    def test_save_update(self, User: Any) -> None:
         """测试 save 更新记录"""
-        user = self.User.create(name='Alice', age=20)
+        user = User.create(name='Alice', age=20)
         original_id = user.id
 
         # 修改并保存
@@ -71,264 +131,246 @@ class TestActiveRecordBasic(unittest.TestCase):
         user.save()
 
         # 验证更新
-        self.assertEqual(user.id, original_id)
-        loaded = self.User.get(user.id)
-        self.assertEqual(loaded.age, 21)
-        self.assertEqual(loaded.email, 'alice@example.com')
+        assert user.id == original_id
+        loaded = User.get(user.id)
+        assert loaded.age == 21
+        assert loaded.email == 'alice@example.com'
 
-    def test_delete(self) -> None:
+    def test_delete(self, User: Any) -> None:
         """测试 delete 方法"""
-        user = self.User.create(name='Alice', age=20)
+        user = User.create(name='Alice', age=20)
         user_id = user.id
 
         # 删除
         user.delete()
 
         # 验证删除
-        loaded = self.User.get(user_id)
-        self.assertIsNone(loaded)
+        loaded = User.get(user_id)
+        assert loaded is None
 
-    def test_refresh(self) -> None:
+    def test_refresh(self, User: Any) -> None:
         """测试 refresh 方法"""
-        user = self.User.create(name='Alice', age=20)
+        user = User.create(name='Alice', age=20)
 
         # 通过另一个实例修改
-        user2 = self.User.get(user.id)
+        user2 = User.get(user.id)
         user2.age = 25
         user2.save()
 
         # 刷新原实例
         user.refresh()
-        self.assertEqual(user.age, 25)
+        assert user.age == 25
 
 
-class TestActiveRecordQuery(unittest.TestCase):
+class TestActiveRecordQuery:
     """Active Record 查询功能测试"""
 
-    def setUp(self) -> None:
-        """测试前设置"""
-        self.db = Storage(in_memory=True)
-        Base: Type[CRUDBaseModel] = declarative_base(self.db, crud=True)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str, nullable=False)
-            age = Column(int)
-            active = Column(bool)
-
-        self.User = User
-
-        # 插入测试数据
-        self.User.create(name='Alice', age=20, active=True)
-        self.User.create(name='Bob', age=25, active=False)
-        self.User.create(name='Charlie', age=19, active=True)
-        self.User.create(name='David', age=30, active=True)
-
-    def tearDown(self) -> None:
-        """测试后清理"""
-        self.db.close()
-
-    def test_get(self) -> None:
+    def test_get(self, query_user: Any) -> None:
         """测试 get 按主键查询"""
-        user = self.User.get(1)
+        user = query_user.get(1)
 
-        self.assertIsNotNone(user)
-        self.assertEqual(user.name, 'Alice')
-        self.assertEqual(user.id, 1)
+        assert user is not None
+        assert user.name == 'Alice'
+        assert user.id == 1
 
         # 不存在的记录
-        user = self.User.get(999)
-        self.assertIsNone(user)
+        user = query_user.get(999)
+        assert user is None
 
-    def test_all(self) -> None:
+    def test_all(self, query_user: Any) -> None:
         """测试 all 获取所有记录"""
-        users = self.User.all()
+        users = query_user.all()
 
-        self.assertEqual(len(users), 4)
-        self.assertEqual({u.name for u in users}, {'Alice', 'Bob', 'Charlie', 'David'})
+        assert len(users) == 4
+        assert {u.name for u in users} == {'Alice', 'Bob', 'Charlie', 'David'}
 
-    def test_filter(self) -> None:
+    def test_filter(self, query_user: Any) -> None:
         """测试 filter 条件查询"""
+        User = query_user
+
         # 单条件
-        users = self.User.filter(self.User.age >= 25).all()
-        self.assertEqual(len(users), 2)
-        self.assertEqual({u.name for u in users}, {'Bob', 'David'})
+        names = User.filter(User.age >= 25).pluck('name')
+        assert len(names) == 2
+        assert set(names) == {'Bob', 'David'}
 
         # 多条件（链式）
-        users = self.User.filter(self.User.age >= 20).filter(self.User.age < 30).all()
-        self.assertEqual(len(users), 2)
-        self.assertEqual({u.name for u in users}, {'Alice', 'Bob'})
+        names = User.filter(User.age >= 20).filter(User.age < 30).pluck('name')
+        assert len(names) == 2
+        assert set(names) == {'Alice', 'Bob'}
 
-    def test_filter_by(self) -> None:
+    def test_filter_by(self, query_user: Any) -> None:
         """测试 filter_by 等值查询"""
         # 单条件
-        users = self.User.filter_by(name='Alice').all()
-        self.assertEqual(len(users), 1)
-        self.assertEqual(users[0].name, 'Alice')
+        users = query_user.filter_by(name='Alice').all()
+        assert len(users) == 1
+        assert users[0].name == 'Alice'
 
         # 多条件
-        users = self.User.filter_by(active=True).all()
-        self.assertEqual(len(users), 3)
+        users = query_user.filter_by(active=True).all()
+        assert len(users) == 3
 
-    def test_first(self) -> None:
+    def test_first(self, query_user: Any) -> None:
         """测试 first 返回第一条"""
-        user = self.User.filter(self.User.age >= 0).first()
-        self.assertIsNotNone(user)
-        self.assertEqual(user.name, 'Alice')  # 第一条记录
+        User = query_user
+
+        user = User.filter(User.age >= 0).first()
+        assert user is not None
+        assert user.name == 'Alice'  # 第一条记录
 
         # 无结果
-        user = self.User.filter(self.User.age > 100).first()
-        self.assertIsNone(user)
+        user = User.filter(User.age > 100).first()
+        assert user is None
 
-    def test_count(self) -> None:
+    def test_count(self, query_user: Any) -> None:
         """测试 count 统计"""
-        count = self.User.filter(self.User.active == True).count()
-        self.assertEqual(count, 3)
+        User = query_user
+
+        count = User.filter(User.active == True).count()
+        assert count == 3
+
+        count = User.filter(User.age >= 25).count()
+        assert count == 2
+
+        # offset/limit 按切片语义折算
+        assert User.filter(User.age >= 0).offset(1).limit(2).count() == 2
+        assert User.filter(User.age >= 0).offset(3).limit(5).count() == 1
+        assert User.filter(User.age >= 0).limit(0).count() == 0
+
+    def test_exists(self, query_user: Any) -> None:
+        """测试 exists 判断"""
+        User = query_user
+
+        assert User.filter(User.name == 'Alice').exists() is True
+        assert User.filter(User.age > 100).exists() is False
+        assert User.filter(User.age >= 25).offset(1).exists() is True
+        assert User.filter(User.age >= 25).offset(2).exists() is False
 
-        count = self.User.filter(self.User.age >= 25).count()
-        self.assertEqual(count, 2)
+    def test_count_exists_negative_offset(self, query_user: Any) -> None:
+        """负数 offset 与 all() 一致，不跳过也不多计记录"""
+        User = query_user
 
-    def test_order_by(self) -> None:
+        matched = User.filter(User.age >= 25).offset(-2)
+        assert matched.count() == len(matched.all()) == 2
+        assert matched.exists() is True
+        assert matched.limit(1).count() == 1
+
+        empty = User.filter(User.age > 100).offset(-2)
+        assert empty.all() == []
+        assert empty.count() == 0
+        assert empty.exists() is False
+
+    def test_order_by(self, query_user: Any) -> None:
         """测试 order_by 排序"""
+        User = query_user
+
         # 升序
-        users = self.User.filter(self.User.age >= 0).order_by('age').all()
-        self.assertEqual([u.name for u in users], ['Charlie', 'Alice', 'Bob', 'David'])
+        names = User.filter(User.age >= 0).order_by('age').pluck('name')
+        assert names == ['Charlie', 'Alice', 'Bob', 'David']
 
         # 降序
-        users = self.User.filter(self.User.age >= 0).order_by('age', desc=True).all()
-        self.assertEqual([u.name for u in users], ['David', 'Bob', 'Alice', 'Charlie'])
+        names = User.filter(User.age >= 0).order_by('age', desc=True).pluck('name')
+        assert names == ['David', 'Bob', 'Alice', 'Charlie']
+
+    def test_pluck(self, query_user: Any) -> None:
+        """测试 pluck 直接返回单列值"""
+        User = query_user
+
+        assert User.filter(User.active == True).order_by('name').pluck('name') == [
+            'Alice', 'Charlie', 'David'
+        ]
+        assert User.filter(User.age > 100).pluck('name') == []
+
+        with pytest.raises(QueryError):
+            User.filter(User.age >= 0).pluck('nickname')
 
-    def test_limit(self) -> None:
+    def test_limit(self, query_user: Any) -> None:
         """测试 limit 限制数量"""
-        users = self.User.filter(self.User.age >= 0).limit(2).all()
-        self.assertEqual(len(users), 2)
+        users = query_user.filter(query_user.age >= 0).limit(2).all()
+        assert len(users) == 2
 
-    def test_offset(self) -> None:
+    def test_offset(self, query_user: Any) -> None:
         """测试 offset 偏移"""
-        users = self.User.filter(self.User.age >= 0).offset(2).all()
-        self.assertEqual(len(users), 2)
+        users = query_user.filter(query_user.age >= 0).offset(2).all()
+        assert len(users) == 2
 
-    def test_chain_query(self) -> None:
+    def test_chain_query(self, query_user: Any) -> None:
         """测试链式查询"""
-        users = (self.User
-                 .filter(self.User.active == True)
-                 .filter(self.User.age >= 20)
+        User = query_user
+        users = (User
+                 .filter(User.active == True)
+                 .filter(User.age >= 20)
                  .order_by('age')
                  .limit(2)
                  .all())
 
-        self.assertEqual(len(users), 2)
-        self.assertEqual(users[0].name, 'Alice')
-        self.assertEqual(users[1].name, 'David')
+        assert len(users) == 2
+        assert users[0].name == 'Alice'
+        assert users[1].name == 'David'
 
 
-class TestActiveRecordComparison(unittest.TestCase):
+class TestActiveRecordComparison:
     """Active Record 比较操作符测试"""
 
-    def setUp(self) -> None:
-        """测试前设置"""
-        self.db = Storage(in_memory=True)
-        Base: Type[CRUDBaseModel] = declarative_base(self.db, crud=True)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-            age = Column(int)
-
-        self.User = User
-
-        # 插入测试数据
-        for name, age in [('Alice', 20), ('Bob', 25), ('Charlie', 30)]:
-            self.User.create(name=name, age=age)
-
-    def tearDown(self) -> None:
-        """测试后清理"""
-        self.db.close()
-
-    def test_eq(self) -> None:
+    def test_eq(self, compare_user: Any) -> None:
         """测试 == 操作符"""
-        users = self.User.filter(self.User.age == 25).all()
-        self.assertEqual(len(users), 1)
-        self.assertEqual(users[0].name, 'Bob')
+        users = compare_user.filter(compare_user.age == 25).all()
+        assert len(users) == 1
+        assert users[0].name == 'Bob'
 
-    def test_ne(self) -> None:
+    def test_ne(self, compare_user: Any) -> None:
         """测试 != 操作符"""
-        users = self.User.filter(self.User.name != 'Alice').all()
-        self.assertEqual(len(users), 2)
-        self.assertEqual({u.name for u in users}, {'Bob', 'Charlie'})
+        names = compare_user.filter(compare_user.name != 'Alice').pluck('name')
+        assert len(names) == 2
+        assert set(names) == {'Bob', 'Charlie'}
 
-    def test_gt(self) -> None:
+    def test_gt(self, compare_user: Any) -> None:
         """测试 > 操作符"""
-        users = self.User.filter(self.User.age > 25).all()
-        self.assertEqual(len(users), 1)
-        self.assertEqual(users[0].name, 'Charlie')
+        users = compare_user.filter(compare_user.age > 25).all()
+        assert len(users) == 1
+        assert users[0].name == 'Charlie'
 
-    def test_ge(self) -> None:
+    def test_ge(self, compare_user: Any) -> None:
         """测试 >= 操作符"""
-        users = self.User.filter(self.User.age >= 25).all()
-        self.assertEqual(len(users), 2)
-        self.assertEqual({u.name for u in users}, {'Bob', 'Charlie'})
+        names = compare_user.filter(compare_user.age >= 25).pluck('name')
+        assert len(names) == 2
+        assert set(names) == {'Bob', 'Charlie'}
 
-    def test_lt(self) -> None:
+    def test_lt(self, compare_user: Any) -> None:
         """测试 < 操作符"""
-        users = self.User.filter(self.User.age < 25).all()
-        self.assertEqual(len(users), 1)
-        self.assertEqual(users[0].name, 'Alice')
+        users = compare_user.filter(compare_user.age < 25).all()
+        assert len(users) == 1
+        assert users[0].name == 'Alice'
 
-    def test_le(self) -> None:
+    def test_le(self, compare_user: Any) -> None:
         """测试 <= 操作符"""
-        users = self.User.filter(self.User.age <= 25).all()
-        self.assertEqual(len(users), 2)
-        self.assertEqual({u.name for u in users}, {'Alice', 'Bob'})
+        names = compare_user.filter(compare_user.age <= 25).pluck('name')
+        assert len(names) == 2
+        assert set(names) == {'Alice', 'Bob'}
 
-    def test_in(self) -> None:
+    def test_in(self, compare_user: Any) -> None:
         """测试 IN 操作符"""
-        users = self.User.filter(self.User.age.in_([20, 30])).all()
-        self.assertEqual(len(users), 2)
-        self.assertEqual({u.name for u in users}, {'Alice', 'Charlie'})
+        names = compare_user.filter(compare_user.age.in_([20, 30])).pluck('name')
+        assert len(names) == 2
+        assert set(names) == {'Alice', 'Charlie'}
 
 
-class TestActiveRecordToDict(unittest.TestCase):
+class TestActiveRecordToDict:
     """Active Record to_dict 方法测试"""
 
-    def setUp(self) -> None:
-        """测试前设置"""
-        self.db = Storage(in_memory=True)
-        Base: Type[CRUDBaseModel] = declarative_base(self.db, crud=True)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-            age = Column(int)
-            email = Column(str, nullable=True)
-
-        self.User = User
-
-    def tearDown(self) -> None:
-        """测试后清理"""
-        self.db.close()
-
-    def test_to_dict(self) -> None:
+    def test_to_dict(self, User: Any) -> None:
         """测试 to_dict 转换为字典"""
-        user = self.User.create(name='Alice', age=20, email='alice@example.com')
+        user = User.create(name='Alice', age=20, email='alice@example.com')
         user_dict = user.to_dict()
 
-        self.assertIsInstance(user_dict, dict)
-        self.assertEqual(user_dict['name'], 'Alice')
-        self.assertEqual(user_dict['age'], 20)
-        self.assertEqual(user_dict['email'], 'alice@example.com')
-        self.assertIn('id', user_dict)
+        assert isinstance(user_dict, dict)
+        assert user_dict['name'] == 'Alice'
+        assert user_dict['age'] == 20
+        assert user_dict['email'] == 'alice@example.com'
+        assert 'id' in user_dict
 
-    def test_to_dict_with_none(self) -> None:
+    def test_to_dict_with_none(self, User: Any) -> None:
         """测试 to_dict 包含 None 值"""
-        user = self.User.create(name='Bob', age=25, email=None)
+        user = User.create(name='Bob', age=25, email=None)
         user_dict = user.to_dict()
 
-        self.assertIsNone(user_dict['email'])
-
-
-if __name__ == '__main__':
-    unittest.main()
+        assert user_dict['email'] is None
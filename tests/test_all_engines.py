@@ -14,6 +14,7 @@ import sys
 import tempfile
 from datetime import datetime, date, timedelta, timezone
 from pathlib import Path
+from types import MappingProxyType
 from typing import Type
 
 import pytest
@@ -36,6 +37,15 @@ ALL_ENGINES = [
     ('xml', 'xml'),
 ]
 
+# CRUD 测试数据（只读，所有引擎共用）
+STUDENT_ROWS = (
+    MappingProxyType({'name': 'Alice', 'age': 20, 'email': 'alice@example.com', 'active': True, 'avatar': b'avatar_alice'}),
+    MappingProxyType({'name': 'Bob', 'age': 22, 'email': 'bob@example.com', 'active': False, 'avatar': b'avatar_bob'}),
+    MappingProxyType({'name': 'Charlie', 'age': 19, 'email': None, 'active': True, 'avatar': None}),
+    MappingProxyType({'name': 'David', 'age': 21, 'email': 'david@example.com', 'active': True, 'avatar': b'avatar_david'}),
+    MappingProxyType({'name': 'Eve', 'age': 23, 'email': 'eve@example.com', 'active': False, 'avatar': b'avatar_eve'}),
+)
+
 
 def is_engine_available(engine_name: str) -> bool:
     """检查引擎是否可用"""
@@ -94,18 +104,8 @@ class TestAllEngines:
 
         session = Session(db)
 
-        # 2. 插入测试数据
-        test_data = [
-            {'name': 'Alice', 'age': 20, 'email': 'alice@example.com', 'active': True, 'avatar': b'avatar_alice'},
-            {'name': 'Bob', 'age': 22, 'email': 'bob@example.com', 'active': False, 'avatar': b'avatar_bob'},
-            {'name': 'Charlie', 'age': 19, 'email': None, 'active': True, 'avatar': None},
-            {'name': 'David', 'age': 21, 'email': 'david@example.com', 'active': True, 'avatar': b'avatar_david'},
-            {'name': 'Eve', 'age': 23, 'email': 'eve@example.com', 'active': False, 'avatar': b'avatar_eve'},
-        ]
-
-        for data in test_data:
-            stmt = insert(Student).values(**data)
-            session.execute(stmt)
+        # 2. 插入测试数据（语句只构建一次，以多行参数执行）
+        session.execute(insert(Student), STUDENT_ROWS)
         session.commit()
 
         # 3. 查询测试
@@ -167,15 +167,8 @@ class TestAllEngines:
         # 7. 重新加载测试
         db2 = Storage(file_path=str(db_file), engine=engine_name)
         Base2: Type[PureBaseModel] = declarative_base(db2)
-
-        class Student2(Base2):
-            __tablename__ = 'students'
-            id = Column(int, primary_key=True)
-            name = Column(str, nullable=False, index=True)
-            age = Column(int)
-            email = Column(str, nullable=True)
-            active = Column(bool)
-            avatar = Column(bytes, nullable=True)
+        # 从已持久化的表结构反射模型，无需重复定义
+        Student2 = Base2.reflect('students')
 
         session2 = Session(db2)
 
@@ -378,16 +371,8 @@ class TestAllEngines:
         # 4. 重新加载测试
         db2 = Storage(file_path=str(db_file), engine=engine_name)
         Base2: Type[PureBaseModel] = declarative_base(db2)
-
-        class Task2(Base2):
-            __tablename__ = 'tasks'
-            id = Column(int, primary_key=True)
-            title = Column(str)
-            created_at = Column(datetime, nullable=True)
-            due_date = Column(date, nullable=True)
-            duration = Column(timedelta, nullable=True)
-            tags = Column(list, nullable=True)
-            options = Column(dict, nullable=True)
+        # 从已持久化的表结构反射模型，无需重复定义
+        Task2 = Base2.reflect('tasks')
 
         session2 = Session(db2)
 
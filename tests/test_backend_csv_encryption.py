@@ -15,10 +15,11 @@ CSV 后端 ZIP 加密功能测试
 - 向后兼容：无密码时行为不变
 """
 
+import shutil
 import pytest
 import zipfile
 from pathlib import Path
-from typing import Type
+from typing import Callable, Type
 
 from pytuck import (
     Storage, Session, Column, declarative_base,
@@ -29,6 +30,17 @@ from pytuck.common.options import CsvBackendOptions
 from pytuck.backends.backend_csv import CSVBackend
 
 
+# 大数据量测试的行数据（模块加载时构建一次）
+LARGE_USER_ROWS = tuple(
+    {
+        'id': i + 1,
+        'name': 'User_%d' % i,
+        'description': 'Description for user %d ' % i * 10,  # 较长的描述
+    }
+    for i in range(100)
+)
+
+
 class TestCsvEncryptionBasic:
     """CSV 加密基本功能测试"""
 
@@ -50,10 +62,11 @@ class TestCsvEncryptionBasic:
             age = Column(int, nullable=True)
 
         # 插入数据
-        User.create(id=1, name='Alice', age=25)
-        User.create(id=2, name='Bob', age=30)
-        db.flush()
-        db.close()
+        User.bulk_create([
+            {'id': 1, 'name': 'Alice', 'age': 25},
+            {'id': 2, 'name': 'Bob', 'age': 30},
+        ])
+        db.close()  # close() 会先 flush
 
         # 验证文件已加密
         with zipfile.ZipFile(str(db_path), 'r') as zf:
@@ -80,51 +93,28 @@ class TestCsvEncryptionBasic:
 
         db2.close()
 
-    def test_load_with_wrong_password(self, tmp_path: Path) -> None:
-        """错误密码应抛出 EncryptionError"""
+    def test_load_with_wrong_password(
+        self, tmp_path: Path, encrypted_user_zip: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """错误密码在读取任何表数据前抛出 EncryptionError"""
         db_path = tmp_path / "encrypted.zip"
-        correct_password = "correct_password"
+        shutil.copyfile(encrypted_user_zip, db_path)
         wrong_password = "wrong_password"
 
-        # 创建加密存储
-        options = CsvBackendOptions(password=correct_password)
-        db = Storage(file_path=str(db_path), engine='csv', backend_options=options)
-
-        Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
+        def fail_load_table(*args: object, **kwargs: object) -> None:
+            raise AssertionError("table data should not be decrypted with a wrong password")
 
-        User.create(id=1, name='Alice')
-        db.flush()
-        db.close()
+        monkeypatch.setattr(CSVBackend, '_load_table_from_zip', fail_load_table)
 
         # 使用错误密码读取 - Storage 构造时会触发 load()，所以异常在这里抛出
         options2 = CsvBackendOptions(password=wrong_password)
-        with pytest.raises((EncryptionError, SerializationError)):
+        with pytest.raises(EncryptionError):
             Storage(file_path=str(db_path), engine='csv', backend_options=options2)
 
-    def test_load_encrypted_without_password(self, tmp_path: Path) -> None:
+    def test_load_encrypted_without_password(self, tmp_path: Path, encrypted_user_zip: Path) -> None:
         """加密 ZIP 无密码时应抛出 EncryptionError"""
         db_path = tmp_path / "encrypted.zip"
-        password = "test_password"
-
-        # 创建加密存储
-        options = CsvBackendOptions(password=password)
-        db = Storage(file_path=str(db_path), engine='csv', backend_options=options)
-
-        Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-
-        User.create(id=1, name='Alice')
-        db.flush()
-        db.close()
+        shutil.copyfile(encrypted_user_zip, db_path)
 
         # 不提供密码读取 - Storage 构造时会触发 load()，所以异常在这里抛出
         options2 = CsvBackendOptions()  # 无密码
@@ -137,25 +127,10 @@ class TestCsvEncryptionBasic:
 class TestCsvEncryptionProbe:
     """CSV 加密 probe() 功能测试"""
 
-    def test_probe_encrypted_file(self, tmp_path: Path) -> None:
+    def test_probe_encrypted_file(self, tmp_path: Path, encrypted_user_zip: Path) -> None:
         """probe() 应检测到加密状态"""
         db_path = tmp_path / "encrypted.zip"
-        password = "test_password"
-
-        # 创建加密存储
-        options = CsvBackendOptions(password=password)
-        db = Storage(file_path=str(db_path), engine='csv', backend_options=options)
-
-        Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-
-        User.create(id=1, name='Alice')
-        db.flush()
-        db.close()
+        shutil.copyfile(encrypted_user_zip, db_path)
 
         # probe 检测
         is_csv, info = CSVBackend.probe(str(db_path))
@@ -165,24 +140,10 @@ class TestCsvEncryptionProbe:
         assert info.get('requires_password') is True
         assert info.get('engine') == 'csv'
 
-    def test_probe_unencrypted_file(self, tmp_path: Path) -> None:
+    def test_probe_unencrypted_file(self, tmp_path: Path, write_user_zip: Callable[..., Path]) -> None:
         """probe() 对未加密文件应返回 encrypted=False 或不包含该字段"""
-        db_path = tmp_path / "unencrypted.zip"
-
         # 创建未加密存储
-        options = CsvBackendOptions()
-        db = Storage(file_path=str(db_path), engine='csv', backend_options=options)
-
-        Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-
-        User.create(id=1, name='Alice')
-        db.flush()
-        db.close()
+        db_path = write_user_zip(tmp_path / "unencrypted.zip")
 
         # probe 检测
         is_csv, info = CSVBackend.probe(str(db_path))
@@ -194,53 +155,25 @@ class TestCsvEncryptionProbe:
 class TestCsvEncryptionMetadata:
     """CSV 加密 get_metadata() 功能测试"""
 
-    def test_get_metadata_encrypted_with_password(self, tmp_path: Path) -> None:
+    def test_get_metadata_encrypted_with_password(
+        self, tmp_path: Path, encrypted_user_zip: Path, encrypted_zip_password: str
+    ) -> None:
         """加密文件使用正确密码获取 metadata"""
         db_path = tmp_path / "encrypted.zip"
-        password = "test_password"
-
-        # 创建加密存储
-        options = CsvBackendOptions(password=password)
-        db = Storage(file_path=str(db_path), engine='csv', backend_options=options)
-
-        Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-
-        User.create(id=1, name='Alice')
-        db.flush()
-        db.close()
+        shutil.copyfile(encrypted_user_zip, db_path)
 
         # 使用密码获取 metadata
-        backend = CSVBackend(str(db_path), CsvBackendOptions(password=password))
+        backend = CSVBackend(str(db_path), CsvBackendOptions(password=encrypted_zip_password))
         metadata = backend.get_metadata()
 
         assert metadata.get('engine') == 'csv'
         assert metadata.get('encrypted') is True
         assert 'tables' in metadata
 
-    def test_get_metadata_encrypted_without_password(self, tmp_path: Path) -> None:
+    def test_get_metadata_encrypted_without_password(self, tmp_path: Path, encrypted_user_zip: Path) -> None:
         """加密文件无密码时 get_metadata 返回有限信息"""
         db_path = tmp_path / "encrypted.zip"
-        password = "test_password"
-
-        # 创建加密存储
-        options = CsvBackendOptions(password=password)
-        db = Storage(file_path=str(db_path), engine='csv', backend_options=options)
-
-        Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-
-        User.create(id=1, name='Alice')
-        db.flush()
-        db.close()
+        shutil.copyfile(encrypted_user_zip, db_path)
 
         # 无密码获取 metadata
         backend = CSVBackend(str(db_path), CsvBackendOptions())
@@ -270,30 +203,23 @@ class TestCsvEncryptionBackwardCompatibility:
             name = Column(str)
             email = Column(str, nullable=True)
 
-        User.create(id=1, name='Alice', email='alice@example.com')
-        User.create(id=2, name='Bob', email='bob@example.com')
+        User.bulk_create([
+            {'id': 1, 'name': 'Alice', 'email': 'alice@example.com'},
+            {'id': 2, 'name': 'Bob', 'email': 'bob@example.com'},
+        ])
         db.flush()
-        db.close()
 
         # 验证文件未加密
         with zipfile.ZipFile(str(db_path), 'r') as zf:
             encrypted = any((info.flag_bits & 0x1) != 0 for info in zf.infolist())
             assert not encrypted, "ZIP file should not be encrypted"
 
-        # 读取未加密文件
-        db2 = Storage(file_path=str(db_path), engine='csv', backend_options=CsvBackendOptions())
-
-        Base2: Type[CRUDBaseModel] = declarative_base(db2, crud=True)
+        # 从文件重新读取未加密数据
+        db.reload()
 
-        class User2(Base2):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-            email = Column(str, nullable=True)
-
-        users = User2.all()
+        users = User.all()
         assert len(users) == 2
-        db2.close()
+        db.close()
 
 
 class TestCsvEncryptionMultiTable:
@@ -310,84 +236,56 @@ class TestCsvEncryptionMultiTable:
 
         Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
 
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
+        with db.batch_schema():
+            class User(Base):
+                __tablename__ = 'users'
+                id = Column(int, primary_key=True)
+                name = Column(str)
 
-        class Product(Base):
-            __tablename__ = 'products'
-            id = Column(int, primary_key=True)
-            title = Column(str)
-            price = Column(float)
+            class Product(Base):
+                __tablename__ = 'products'
+                id = Column(int, primary_key=True)
+                title = Column(str)
+                price = Column(float)
 
-        class Order(Base):
-            __tablename__ = 'orders'
-            id = Column(int, primary_key=True)
-            user_id = Column(int)
-            product_id = Column(int)
+            class Order(Base):
+                __tablename__ = 'orders'
+                id = Column(int, primary_key=True)
+                user_id = Column(int)
+                product_id = Column(int)
+
+        assert set(db.tables) == {'users', 'products', 'orders'}
 
         # 插入数据
-        User.create(id=1, name='Alice')
-        User.create(id=2, name='Bob')
-        Product.create(id=1, title='Book', price=19.99)
-        Product.create(id=2, title='Pen', price=2.99)
-        Order.create(id=1, user_id=1, product_id=1)
-        Order.create(id=2, user_id=2, product_id=2)
+        User.bulk_create([{'id': 1, 'name': 'Alice'}, {'id': 2, 'name': 'Bob'}])
+        Product.bulk_create([
+            {'id': 1, 'title': 'Book', 'price': 19.99},
+            {'id': 2, 'title': 'Pen', 'price': 2.99},
+        ])
+        Order.bulk_create([
+            {'id': 1, 'user_id': 1, 'product_id': 1},
+            {'id': 2, 'user_id': 2, 'product_id': 2},
+        ])
 
         db.flush()
-        db.close()
 
-        # 读取
-        db2 = Storage(file_path=str(db_path), engine='csv', backend_options=CsvBackendOptions(password=password))
+        # 从加密文件重新读取（复用已声明的模型）
+        db.reload()
 
-        Base2: Type[CRUDBaseModel] = declarative_base(db2, crud=True)
-
-        class User2(Base2):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-
-        class Product2(Base2):
-            __tablename__ = 'products'
-            id = Column(int, primary_key=True)
-            title = Column(str)
-            price = Column(float)
-
-        class Order2(Base2):
-            __tablename__ = 'orders'
-            id = Column(int, primary_key=True)
-            user_id = Column(int)
-            product_id = Column(int)
-
-        assert len(User2.all()) == 2
-        assert len(Product2.all()) == 2
-        assert len(Order2.all()) == 2
+        assert len(User.all()) == 2
+        assert len(Product.all()) == 2
+        assert len(Order.all()) == 2
 
-        db2.close()
+        db.close()
 
 
 class TestCsvEncryptionEdgeCases:
     """CSV 加密边界情况测试"""
 
-    def test_empty_password_is_no_encryption(self, tmp_path: Path) -> None:
+    def test_empty_password_is_no_encryption(self, tmp_path: Path, write_user_zip: Callable[..., Path]) -> None:
         """空字符串密码等同于无密码"""
-        db_path = tmp_path / "empty_password.zip"
-
         # 空字符串密码
-        options = CsvBackendOptions(password="")
-        db = Storage(file_path=str(db_path), engine='csv', backend_options=options)
-
-        Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-
-        User.create(id=1, name='Alice')
-        db.flush()
-        db.close()
+        db_path = write_user_zip(tmp_path / "empty_password.zip", password="")
 
         # 验证文件未加密（空字符串在布尔上下文中为 False）
         with zipfile.ZipFile(str(db_path), 'r') as zf:
@@ -420,7 +318,9 @@ class TestCsvEncryptionEdgeCases:
         with pytest.raises(ValidationError):
             CsvBackendOptions(password="test password")
 
-    def test_valid_special_characters(self, tmp_path: Path) -> None:
+    def test_valid_special_characters(
+        self, tmp_path: Path, make_user_model: Callable[[Storage], Type[CRUDBaseModel]]
+    ) -> None:
         """测试所有允许的特殊字符"""
         db_path = tmp_path / "special_chars.zip"
         # 包含各种允许的特殊字符
@@ -429,29 +329,18 @@ class TestCsvEncryptionEdgeCases:
         options = CsvBackendOptions(password=password)
         db = Storage(file_path=str(db_path), engine='csv', backend_options=options)
 
-        Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
+        User = make_user_model(db)
 
         User.create(id=1, name='Test')
         db.flush()
-        db.close()
 
-        # 验证能正常读取
-        db2 = Storage(file_path=str(db_path), engine='csv', backend_options=CsvBackendOptions(password=password))
-        Base2: Type[CRUDBaseModel] = declarative_base(db2, crud=True)
-
-        class User2(Base2):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
+        # 验证能正常读取（同一 Storage 上复用已注册的模型）
+        db.reload()
+        assert make_user_model(db) is User
 
-        users = User2.all()
+        users = User.all()
         assert len(users) == 1
-        db2.close()
+        db.close()
 
     def test_large_data_encrypted(self, tmp_path: Path) -> None:
         """大数据量加密"""
@@ -469,31 +358,40 @@ class TestCsvEncryptionEdgeCases:
             name = Column(str)
             description = Column(str, nullable=True)
 
-        # 插入大量数据
-        for i in range(100):
-            User.create(
-                id=i + 1,
-                name=f'User_{i}',
-                description=f'Description for user {i} ' * 10  # 较长的描述
-            )
+        # 插入大量数据（一次批量写入）
+        User.bulk_create(list(LARGE_USER_ROWS))
 
         db.flush()
-        db.close()
 
         # 读取验证
-        db2 = Storage(file_path=str(db_path), engine='csv', backend_options=CsvBackendOptions(password=password))
+        db.reload()
 
-        Base2: Type[CRUDBaseModel] = declarative_base(db2, crud=True)
-
-        class User2(Base2):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-            description = Column(str, nullable=True)
-
-        users = User2.all()
+        users = User.all()
         assert len(users) == 100
         assert users[0].name == 'User_0'
         assert users[99].name == 'User_99'
+        assert users[99].description == LARGE_USER_ROWS[99]['description']
 
-        db2.close()
+        db.close()
+
+    def test_multiline_values_encrypted(self, tmp_path: Path) -> None:
+        """字段内的 \\r\\n / \\r 经加密流式读取后保持不变"""
+        db_path = tmp_path / "multiline.zip"
+        password = "multiline_password"
+
+        db = Storage(file_path=str(db_path), engine='csv', backend_options=CsvBackendOptions(password=password))
+
+        Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
+
+        class Note(Base):
+            __tablename__ = 'notes'
+            id = Column(int, primary_key=True)
+            body = Column(str)
+
+        bodies = ['line1\r\nline2', 'cr\ronly', 'lf\nonly']
+        Note.bulk_create([{'body': body} for body in bodies])
+        db.flush()
+        db.reload()
+
+        assert [note.body for note in Note.all()] == bodies
+        db.close()
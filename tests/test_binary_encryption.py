@@ -12,12 +12,13 @@ Binary 引擎加密测试
 """
 
 from pathlib import Path
-from typing import Type
+from typing import List, Type
 
 import pytest
 
 from pytuck import Storage, declarative_base, Session, Column
 from pytuck import PureBaseModel, insert, select
+from pytuck.common.crypto import ChaCha20Cipher, CryptoProvider, LCGCipher, XORCipher
 from pytuck.common.exceptions import EncryptionError
 from pytuck.common.options import BinaryBackendOptions
 
@@ -25,227 +26,125 @@ from pytuck.common.options import BinaryBackendOptions
 # ---------- 各加密等级测试 ----------
 
 
-class TestBinaryEncryptionLow:
-    """low 等级（XOR 混淆）加密测试"""
+LEVEL_PASSWORDS = [
+    ('low', 'secret123'),
+    ('medium', 'mypass'),
+    ('high', 'strongpass!@#'),
+]
 
-    def test_save_and_load_low(self, temp_dir: Path) -> None:
-        """low 等级加密写入读取"""
-        db_path = temp_dir / 'enc_low.db'
-        db = Storage(
-            file_path=str(db_path),
-            engine='binary',
-            backend_options=BinaryBackendOptions(
-                encryption='low', password='secret123'
-            )
-        )
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-
-        session = Session(db)
-        session.execute(insert(User).values(name='Alice'))
-        session.execute(insert(User).values(name='Bob'))
-        session.commit()
-        db.flush()
-        db.close()
-
-        # 重新打开并读取
-        db2 = Storage(
-            file_path=str(db_path),
-            engine='binary',
-            backend_options=BinaryBackendOptions(
-                encryption='low', password='secret123'
-            )
-        )
-        table = db2.get_table('users')
-        assert len(table.data) == 2
-        names = {r['name'] for r in table.data.values()}
-        assert names == {'Alice', 'Bob'}
-        db2.close()
 
-    def test_wrong_password_low(self, temp_dir: Path) -> None:
-        """low 等级错误密码报错"""
-        db_path = temp_dir / 'enc_low_wrong.db'
-        db = Storage(
-            file_path=str(db_path),
-            engine='binary',
-            backend_options=BinaryBackendOptions(
-                encryption='low', password='correct'
-            )
-        )
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
+def _open_encrypted(db_path: Path, level: str, password: str) -> Storage:
+    """以指定加密等级和密码打开 binary 数据库"""
+    return Storage(
+        file_path=str(db_path),
+        engine='binary',
+        backend_options=BinaryBackendOptions(encryption=level, password=password)
+    )
 
-        session = Session(db)
-        session.execute(insert(User).values(name='Alice'))
-        session.commit()
-        db.flush()
-        db.close()
 
-        # 用错误密码打开
-        with pytest.raises(EncryptionError, match="密码错误"):
-            Storage(
-                file_path=str(db_path),
-                engine='binary',
-                backend_options=BinaryBackendOptions(
-                    encryption='low', password='wrong'
-                )
-            )
+def _write_encrypted_users(db_path: Path, level: str, password: str, names: List[str]) -> None:
+    """写入一个加密的 users 表后关闭"""
+    db = _open_encrypted(db_path, level, password)
+    Base: Type[PureBaseModel] = declarative_base(db)
 
+    class User(Base):
+        __tablename__ = 'users'
+        id = Column(int, primary_key=True)
+        name = Column(str)
+        age = Column(int, nullable=True)
 
-class TestBinaryEncryptionMedium:
-    """medium 等级（LCG 流密码）加密测试"""
+    session = Session(db)
+    session.execute(insert(User), [{'name': name, 'age': 30} for name in names])
+    session.commit()
+    db.flush()
+    db.close()
 
-    def test_save_and_load_medium(self, temp_dir: Path) -> None:
-        """medium 等级加密写入读取"""
-        db_path = temp_dir / 'enc_medium.db'
-        db = Storage(
-            file_path=str(db_path),
-            engine='binary',
-            backend_options=BinaryBackendOptions(
-                encryption='medium', password='mypass'
-            )
-        )
-        Base: Type[PureBaseModel] = declarative_base(db)
 
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-            age = Column(int, nullable=True)
+class TestBinaryEncryptionLevels:
+    """low（XOR 混淆）/ medium（LCG 流密码）/ high（ChaCha20）三个等级的读写测试"""
 
-        session = Session(db)
-        session.execute(insert(User).values(name='Charlie', age=30))
-        session.commit()
-        db.flush()
-        db.close()
+    @pytest.mark.parametrize('level,password', LEVEL_PASSWORDS)
+    def test_save_and_load(self, temp_dir: Path, level: str, password: str) -> None:
+        """加密写入后用相同密码读取"""
+        db_path = temp_dir / f'enc_{level}.db'
+        _write_encrypted_users(db_path, level, password, ['Alice', 'Bob', 'Charlie'])
 
-        db2 = Storage(
-            file_path=str(db_path),
-            engine='binary',
-            backend_options=BinaryBackendOptions(
-                encryption='medium', password='mypass'
-            )
-        )
+        db2 = _open_encrypted(db_path, level, password)
         table = db2.get_table('users')
-        assert len(table.data) == 1
-        record = list(table.data.values())[0]
-        assert record['name'] == 'Charlie'
+        assert len(table.data) == 3
+        assert {r['name'] for r in table.data.values()} == {'Alice', 'Bob', 'Charlie'}
+        record = table.data[1]  # 自增主键
+        assert record['name'] == 'Alice'
         assert record['age'] == 30
         db2.close()
 
-    def test_wrong_password_medium(self, temp_dir: Path) -> None:
-        """medium 等级错误密码报错"""
-        db_path = temp_dir / 'enc_medium_wrong.db'
-        db = Storage(
-            file_path=str(db_path),
-            engine='binary',
-            backend_options=BinaryBackendOptions(
-                encryption='medium', password='correct'
-            )
-        )
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-
-        session = Session(db)
-        session.execute(insert(User).values(name='Test'))
-        session.commit()
-        db.flush()
-        db.close()
+    @pytest.mark.parametrize('level', ['low', 'medium', 'high'])
+    def test_wrong_password(self, temp_dir: Path, level: str) -> None:
+        """错误密码报错"""
+        db_path = temp_dir / f'enc_{level}_wrong.db'
+        _write_encrypted_users(db_path, level, 'correct', ['Test'])
 
         with pytest.raises(EncryptionError, match="密码错误"):
-            Storage(
-                file_path=str(db_path),
-                engine='binary',
-                backend_options=BinaryBackendOptions(
-                    encryption='medium', password='wrong'
-                )
-            )
+            _open_encrypted(db_path, level, 'wrong')
 
 
-class TestBinaryEncryptionHigh:
-    """high 等级（ChaCha20）加密测试"""
+class TestCiphers:
+    """各等级加密算法的单元测试"""
 
-    def test_save_and_load_high(self, temp_dir: Path) -> None:
-        """high 等级加密写入读取"""
-        db_path = temp_dir / 'enc_high.db'
-        db = Storage(
-            file_path=str(db_path),
-            engine='binary',
-            backend_options=BinaryBackendOptions(
-                encryption='high', password='strongpass!@#'
-            )
+    def test_xor_cipher_tiles_keystream(self) -> None:
+        """XOR 混淆按 256 字节密钥流循环异或，加解密往返一致"""
+        cipher = XORCipher(b'secret')
+        data = bytes(range(256)) * 3 + b'tail'
+
+        encrypted = cipher.encrypt(data)
+        assert encrypted == bytes(
+            b ^ cipher.keystream[i % len(cipher.keystream)] for i, b in enumerate(data)
         )
-        Base: Type[PureBaseModel] = declarative_base(db)
+        assert cipher.decrypt(encrypted) == data
+        assert cipher.encrypt(b'') == b''
 
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
+    def test_lcg_stream_matches_recurrence(self) -> None:
+        """批量生成的 LCG 流与逐个递推的结果一致（跨越批边界）"""
+        cipher = LCGCipher(b'secret')
+        length = LCGCipher.BATCH_SIZE + 100
 
-        session = Session(db)
-        session.execute(insert(User).values(name='Dave'))
-        session.execute(insert(User).values(name='Eve'))
-        session.execute(insert(User).values(name='Frank'))
-        session.commit()
-        db.flush()
-        db.close()
+        expected = bytearray(length)
+        state = cipher.seed
+        for i in range(length):
+            state = (LCGCipher.A * state + LCGCipher.C) % LCGCipher.M
+            expected[i] = (state >> 16) & 0xFF
 
-        db2 = Storage(
-            file_path=str(db_path),
-            engine='binary',
-            backend_options=BinaryBackendOptions(
-                encryption='high', password='strongpass!@#'
-            )
-        )
-        table = db2.get_table('users')
-        assert len(table.data) == 3
-        names = {r['name'] for r in table.data.values()}
-        assert names == {'Dave', 'Eve', 'Frank'}
-        db2.close()
+        assert cipher._generate_stream(length, cipher.seed) == bytes(expected)
 
-    def test_wrong_password_high(self, temp_dir: Path) -> None:
-        """high 等级错误密码报错"""
-        db_path = temp_dir / 'enc_high_wrong.db'
-        db = Storage(
-            file_path=str(db_path),
-            engine='binary',
-            backend_options=BinaryBackendOptions(
-                encryption='high', password='correct'
-            )
-        )
-        Base: Type[PureBaseModel] = declarative_base(db)
+        data = bytes(range(256)) * 5
+        assert cipher.decrypt(cipher.encrypt(data)) == data
+        assert cipher.encrypt(b'') == b''
 
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            name = Column(str)
+    def test_chacha20_rfc7539_vectors(self) -> None:
+        """ChaCha20 密钥流与 RFC 7539 附录 A.1 测试向量一致"""
+        keystream = ChaCha20Cipher(b'\x00' * 32).encrypt(b'\x00' * 128)
 
-        session = Session(db)
-        session.execute(insert(User).values(name='Test'))
-        session.commit()
-        db.flush()
-        db.close()
+        assert keystream[:64].hex() == (
+            '76b8e0ada0f13d90405d6ae55386bd28bdd219b8a08ded1aa836efcc8b770dc7'
+            'da41597c5157488d7724e03fb8d84a376a43b8f41518a11cc387b669b2ee6586'
+        )
+        assert keystream[64:].hex() == (
+            '9f07e7be5551387a98ba977c732d080dcb0f29a048e3656912c6533e32ee7aed'
+            '29b721769ce64e43d57133b074d839d531ed1f28510afb45ace10a1f4b794d6f'
+        )
 
-        with pytest.raises(EncryptionError, match="密码错误"):
-            Storage(
-                file_path=str(db_path),
-                engine='binary',
-                backend_options=BinaryBackendOptions(
-                    encryption='high', password='wrong'
-                )
-            )
+    def test_chacha20_roundtrip_across_batches(self) -> None:
+        """跨越批量计算边界的数据加解密往返一致"""
+        cipher = ChaCha20Cipher(b'secret')
+        data = bytes(range(256)) * (ChaCha20Cipher.BATCH_BLOCKS // 4 + 1) + b'tail'
+
+        encrypted = cipher.encrypt(data)
+        assert encrypted != data
+        assert len(encrypted) == len(data)
+        assert cipher.decrypt(encrypted) == data
+        # 块与块之间互不影响：前缀的密文等于单独加密前缀
+        assert cipher.encrypt(data[:100]) == encrypted[:100]
+        assert cipher.encrypt(b'') == b''
 
 
 # ---------- 通用加密测试 ----------
@@ -337,15 +236,11 @@ class TestBinaryEncryptionCommon:
             flag = Column(bool, nullable=True)
 
         session = Session(db)
-        session.execute(insert(Record).values(
-            text='Hello World', number=42, decimal=3.14, flag=True
-        ))
-        session.execute(insert(Record).values(
-            text='中文测试', number=-100, decimal=0.0, flag=False
-        ))
-        session.execute(insert(Record).values(
-            text='', number=None, decimal=None, flag=None
-        ))
+        session.execute(insert(Record), [
+            {'text': 'Hello World', 'number': 42, 'decimal': 3.14, 'flag': True},
+            {'text': '中文测试', 'number': -100, 'decimal': 0.0, 'flag': False},
+            {'text': '', 'number': None, 'decimal': None, 'flag': None},
+        ])
         session.commit()
         db.flush()
         db.close()
@@ -405,11 +300,12 @@ class TestBinaryEncryptionCommon:
             price = Column(float, nullable=True)
 
         session = Session(db)
-        session.execute(insert(User).values(name='Alice'))
-        session.execute(insert(User).values(name='Bob'))
-        session.execute(insert(Product).values(title='Widget', price=9.99))
-        session.execute(insert(Product).values(title='Gadget', price=19.99))
-        session.execute(insert(Product).values(title='Free', price=0.0))
+        session.execute(insert(User), [{'name': 'Alice'}, {'name': 'Bob'}])
+        session.execute(insert(Product), [
+            {'title': 'Widget', 'price': 9.99},
+            {'title': 'Gadget', 'price': 19.99},
+            {'title': 'Free', 'price': 0.0},
+        ])
         session.commit()
         db.flush()
         db.close()
@@ -501,3 +397,43 @@ class TestBinaryEncryptionCommon:
             session.execute(insert(User).values(name='Test'))
             session.commit()
             db.flush()
+
+    def test_key_derivation_reused_on_reload(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """同一后端实例保存后重新加载时复用已派生的密钥，新实例重新派生"""
+        calls: List[bytes] = []
+        derive_key = CryptoProvider.derive_key
+
+        def counting_derive_key(password: str, salt: bytes, level: str) -> bytes:
+            calls.append(salt)
+            return derive_key(password, salt, level)
+
+        monkeypatch.setattr(CryptoProvider, 'derive_key', staticmethod(counting_derive_key))
+
+        db_path = temp_dir / 'enc_kdf_reuse.db'
+        options = BinaryBackendOptions(encryption='high', password='secret')
+        db = Storage(file_path=str(db_path), engine='binary', backend_options=options)
+        Base: Type[PureBaseModel] = declarative_base(db)
+
+        class User(Base):
+            __tablename__ = 'users'
+            id = Column(int, primary_key=True)
+            name = Column(str)
+
+        session = Session(db)
+        session.execute(insert(User).values(name='Alice'))
+        session.commit()
+        db.flush()
+        saved = len(calls)
+        assert saved >= 1
+
+        db.reload()
+        assert len(calls) == saved
+        assert db.count_rows('users') == 1
+        db.close()
+
+        db2 = Storage(file_path=str(db_path), engine='binary', backend_options=options)
+        assert len(calls) == saved + 1
+        assert db2.count_rows('users') == 1
+        db2.close()
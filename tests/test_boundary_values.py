@@ -6,414 +6,151 @@
 - 等价类法：有效等价类、无效等价类
 """
 
-import math
+import itertools
 from datetime import datetime, date, timedelta
-from pathlib import Path
-from typing import Type
+from typing import Any, Callable, Dict, Generator, Tuple, Type
 
 import pytest
 
 from pytuck import Storage, Session, Column, PureBaseModel, declarative_base
 from pytuck import select, insert
+from pytuck.query import Insert
 
 
-class TestStringBoundaryValues:
-    """字符串边界值"""
-
-    def test_empty_string(self, tmp_path: Path) -> None:
-        """空字符串"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, name=''))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.name == ''
-
-        session.close()
-        db.close()
-
-    def test_very_long_string(self, tmp_path: Path) -> None:
-        """超长字符串（10000+ 字符）"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            content = Column(str)
-
-        long_string = 'A' * 10000
+SharedDB = Tuple[Storage, Dict[type, Type[PureBaseModel]]]
+Roundtrip = Callable[[type, Any], Any]
 
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, content=long_string))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.content == long_string
-        assert len(item.content) == 10000
+# 各测试共用同一批表，主键从模块级计数器取，保证互不冲突
+_ids = itertools.count(1)
 
-        session.close()
-        db.close()
+# 较大的不可变测试数据在导入时构建一次
+LONG_STRING = 'A' * 10000
+ALL_BYTES = bytes(range(256))  # 所有可能的字节值
 
-    def test_unicode_emoji(self, tmp_path: Path) -> None:
-        """Unicode emoji 字符"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
+# 每个模型的 insert 语句只构建一次，行值通过 execute 的多行参数传入
+_insert_stmts: Dict[Type[PureBaseModel], Insert[Any]] = {}
 
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            text = Column(str)
 
-        emoji_text = '😀🎉🚀💯🔥✨🌟💡🎯🏆'
+@pytest.fixture(scope='module')
+def shared_db(tmp_path_factory: pytest.TempPathFactory) -> Generator[SharedDB, None, None]:
+    """
+    模块共用的 Storage 及按列类型区分的模型
 
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, text=emoji_text))
-        session.commit()
+    每种列类型一张表（id + 可空的 value 列），整个模块只打开一次数据库、
+    只声明一次模型。
+    """
+    db = Storage(file_path=str(tmp_path_factory.mktemp('bv') / 't.db'), engine='binary')
+    Base: Type[PureBaseModel] = declarative_base(db)
 
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.text == emoji_text
+    models: Dict[type, Type[PureBaseModel]] = {}
+    for col_type in (str, int, float, bool, bytes, list, dict, datetime, date, timedelta):
+        Item = type(f'Item_{col_type.__name__}', (Base,), {
+            '__tablename__': f'items_{col_type.__name__}',
+            'id': Column(int, primary_key=True),
+            'value': Column(col_type),
+        })
+        models[col_type] = Item
+        _insert_stmts[Item] = insert(Item)
 
-        session.close()
-        db.close()
+    yield db, models
+    db.close()
+    _insert_stmts.clear()
 
-    def test_unicode_non_bmp(self, tmp_path: Path) -> None:
-        """非 BMP Unicode 字符（如数学符号、古文字）"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
 
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            text = Column(str)
+@pytest.fixture(scope='class')
+def roundtrip(shared_db: SharedDB) -> Generator[Roundtrip, None, None]:
+    """
+    返回往返函数 roundtrip(col_type, value)
 
-        # 数学双线字体、音乐符号、古埃及象形文字等
-        non_bmp_text = '𝕳𝖊𝖑𝖑𝖔 𝄞𝄢 𓀀𓂋'
+    向对应列类型的表插入一条记录，再按主键读回 value 列。
+    execute 直接写入 Storage 内存，读回无需先 commit；同一测试类共用一个 Session，
+    类中测试全部结束（包括断言失败）后统一 commit 并关闭。
+    """
+    db, models = shared_db
+    session = Session(db)
 
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, text=non_bmp_text))
-        session.commit()
+    def _roundtrip(col_type: type, value: Any) -> Any:
+        Item = models[col_type]
+        pk = next(_ids)
+        session.execute(_insert_stmts[Item], [{'id': pk, 'value': value}])
 
-        item = session.get(Item, 1)
+        item = session.get(Item, pk)
         assert item is not None
-        assert item.text == non_bmp_text
-
-        session.close()
-        db.close()
-
-    def test_control_characters(self, tmp_path: Path) -> None:
-        """控制字符（\n, \t, \r）"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            text = Column(str)
-
-        control_text = 'Line1\nLine2\tTab\rCarriage'
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, text=control_text))
-        session.commit()
+        return item.value
 
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.text == control_text
-        assert '\n' in item.text
-        assert '\t' in item.text
-        assert '\r' in item.text
+    yield _roundtrip
+    session.commit()
+    session.close()
 
-        session.close()
-        db.close()
 
-    def test_mixed_unicode_ascii(self, tmp_path: Path) -> None:
-        """混合 Unicode 和 ASCII"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
+@pytest.fixture
+def item_session() -> Generator[Tuple[Session, Type[PureBaseModel]], None, None]:
+    """独立内存 Storage 上的空 items 表及其 Session，测试结束后关闭"""
+    db = Storage(in_memory=True)
+    Base: Type[PureBaseModel] = declarative_base(db)
 
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            text = Column(str)
+    class Item(Base):
+        __tablename__ = 'items'
+        id = Column(int, primary_key=True)
+        name = Column(str)
 
-        mixed_text = 'Hello 你好 Привет مرحبا 🌍'
+    session = Session(db)
+    yield session, Item
+    session.close()
+    db.close()
 
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, text=mixed_text))
-        session.commit()
 
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.text == mixed_text
+class TestStringBoundaryValues:
+    """字符串边界值"""
 
-        session.close()
-        db.close()
+    @pytest.mark.parametrize('value', [
+        '',
+        LONG_STRING,
+        '😀🎉🚀💯🔥✨🌟💡🎯🏆',
+        # 数学双线字体、音乐符号、古埃及象形文字等
+        '𝕳𝖊𝖑𝖑𝖔 𝄞𝄢 𓀀𓂋',
+        'Line1\nLine2\tTab\rCarriage',
+        'Hello 你好 Привет مرحبا 🌍',
+    ], ids=['empty', 'long', 'emoji', 'non_bmp', 'control_chars', 'mixed'])
+    def test_string_roundtrip(self, roundtrip: Roundtrip, value: str) -> None:
+        """空串、超长串、emoji、非 BMP 字符、控制字符、混合文字原样读回"""
+        assert roundtrip(str, value) == value
 
 
 class TestNumericBoundaryValues:
     """数值边界值"""
 
-    def test_int_zero(self, tmp_path: Path) -> None:
-        """整数零"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            value = Column(int)
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, value=0))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.value == 0
-
-        session.close()
-        db.close()
-
-    def test_int_large_value(self, tmp_path: Path) -> None:
-        """大整数值"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            value = Column(int)
-
-        large_int = 2**62  # 大整数
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, value=large_int))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.value == large_int
-
-        session.close()
-        db.close()
-
-    def test_int_negative(self, tmp_path: Path) -> None:
-        """负整数"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            value = Column(int)
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, value=-999999))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.value == -999999
-
-        session.close()
-        db.close()
-
-    def test_float_zero(self, tmp_path: Path) -> None:
-        """浮点零"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            value = Column(float)
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, value=0.0))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.value == 0.0
-
-        session.close()
-        db.close()
-
-    def test_float_very_small(self, tmp_path: Path) -> None:
-        """极小浮点数"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            value = Column(float)
-
-        tiny_float = 1e-300
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, value=tiny_float))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.value == tiny_float
-
-        session.close()
-        db.close()
-
-    def test_float_very_large(self, tmp_path: Path) -> None:
-        """极大浮点数"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            value = Column(float)
-
-        large_float = 1e300
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, value=large_float))
-        session.commit()
+    @pytest.mark.parametrize('value', [0, 2**62, -999999], ids=['zero', 'large', 'negative'])
+    def test_int_roundtrip(self, roundtrip: Roundtrip, value: int) -> None:
+        """零、大整数、负整数原样读回"""
+        assert roundtrip(int, value) == value
 
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.value == large_float
-
-        session.close()
-        db.close()
-
-    def test_float_negative(self, tmp_path: Path) -> None:
-        """负浮点数"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            value = Column(float)
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, value=-123.456))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.value == -123.456
-
-        session.close()
-        db.close()
+    @pytest.mark.parametrize(
+        'value', [0.0, 1e-300, 1e300, -123.456], ids=['zero', 'tiny', 'huge', 'negative']
+    )
+    def test_float_roundtrip(self, roundtrip: Roundtrip, value: float) -> None:
+        """零、极小、极大、负浮点数原样读回"""
+        assert roundtrip(float, value) == value
 
 
 class TestCollectionBoundaryValues:
     """集合类型边界值"""
 
-    def test_empty_list(self, tmp_path: Path) -> None:
+    def test_empty_list(self, roundtrip: Roundtrip) -> None:
         """空列表"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            tags = Column(list)
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, tags=[]))
-        session.commit()
+        assert roundtrip(list, []) == []
 
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.tags == []
-
-        session.close()
-        db.close()
-
-    def test_empty_dict(self, tmp_path: Path) -> None:
+    def test_empty_dict(self, roundtrip: Roundtrip) -> None:
         """空字典"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            metadata = Column(dict)
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, metadata={}))
-        session.commit()
+        assert roundtrip(dict, {}) == {}
 
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.metadata == {}
-
-        session.close()
-        db.close()
-
-    def test_nested_list(self, tmp_path: Path) -> None:
+    def test_nested_list(self, roundtrip: Roundtrip) -> None:
         """嵌套列表"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            matrix = Column(list)
-
         nested_list = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+        assert roundtrip(list, nested_list) == nested_list
 
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, matrix=nested_list))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.matrix == nested_list
-
-        session.close()
-        db.close()
-
-    def test_deeply_nested_structure(self, tmp_path: Path) -> None:
+    def test_deeply_nested_structure(self, roundtrip: Roundtrip) -> None:
         """深度嵌套结构"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            data = Column(dict)
-
         deep_structure = {
             'level1': {
                 'level2': {
@@ -426,303 +163,71 @@ class TestCollectionBoundaryValues:
             }
         }
 
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, data=deep_structure))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.data == deep_structure
-        assert item.data['level1']['level2']['level3']['level4']['value'] == 'deep'
+        data = roundtrip(dict, deep_structure)
+        assert data == deep_structure
+        assert data['level1']['level2']['level3']['level4']['value'] == 'deep'
 
-        session.close()
-        db.close()
-
-    def test_list_with_mixed_types(self, tmp_path: Path) -> None:
+    def test_list_with_mixed_types(self, roundtrip: Roundtrip) -> None:
         """混合类型列表"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            data = Column(list)
-
         mixed_list = [1, 'two', 3.0, True, None, {'key': 'value'}, [1, 2, 3]]
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, data=mixed_list))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.data == mixed_list
-
-        session.close()
-        db.close()
+        assert roundtrip(list, mixed_list) == mixed_list
 
 
 class TestDatetimeBoundaryValues:
     """日期时间边界值"""
 
-    def test_datetime_now(self, tmp_path: Path) -> None:
+    def test_datetime_now(self, roundtrip: Roundtrip) -> None:
         """当前时间"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            created_at = Column(datetime)
-
         now = datetime.now()
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, created_at=now))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
+        created_at = roundtrip(datetime, now)
         # 由于序列化可能丢失微秒精度，比较到秒
-        assert item.created_at.replace(microsecond=0) == now.replace(microsecond=0)
-
-        session.close()
-        db.close()
+        assert created_at.replace(microsecond=0) == now.replace(microsecond=0)
 
-    def test_date_only(self, tmp_path: Path) -> None:
+    def test_date_only(self, roundtrip: Roundtrip) -> None:
         """只有日期"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            birth_date = Column(date)
-
         today = date.today()
+        assert roundtrip(date, today) == today
 
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, birth_date=today))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.birth_date == today
-
-        session.close()
-        db.close()
-
-    def test_timedelta(self, tmp_path: Path) -> None:
+    def test_timedelta(self, roundtrip: Roundtrip) -> None:
         """时间间隔"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            duration = Column(timedelta)
-
         delta = timedelta(days=5, hours=3, minutes=30, seconds=15)
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, duration=delta))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.duration == delta
-
-        session.close()
-        db.close()
+        assert roundtrip(timedelta, delta) == delta
 
 
 class TestBooleanBoundaryValues:
     """布尔值边界值"""
 
-    def test_bool_true(self, tmp_path: Path) -> None:
-        """布尔真"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            active = Column(bool)
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, active=True))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.active is True
-
-        session.close()
-        db.close()
-
-    def test_bool_false(self, tmp_path: Path) -> None:
-        """布尔假"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            active = Column(bool)
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, active=False))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.active is False
-
-        session.close()
-        db.close()
+    def test_bool_roundtrip(self, roundtrip: Roundtrip) -> None:
+        """布尔真、假原样读回"""
+        assert roundtrip(bool, True) is True
+        assert roundtrip(bool, False) is False
 
 
 class TestBytesBoundaryValues:
     """字节类型边界值"""
 
-    def test_empty_bytes(self, tmp_path: Path) -> None:
-        """空字节"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            data = Column(bytes)
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, data=b''))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.data == b''
-
-        session.close()
-        db.close()
-
-    def test_binary_data(self, tmp_path: Path) -> None:
-        """二进制数据"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            data = Column(bytes)
-
-        binary_data = bytes(range(256))  # 所有可能的字节值
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, data=binary_data))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.data == binary_data
-
-        session.close()
-        db.close()
+    def test_bytes_roundtrip(self, roundtrip: Roundtrip) -> None:
+        """空字节、包含所有字节值的二进制数据原样读回"""
+        assert roundtrip(bytes, b'') == b''
+        assert roundtrip(bytes, ALL_BYTES) == ALL_BYTES
 
 
 class TestNullableBoundaryValues:
     """可空字段边界值"""
 
-    def test_nullable_string_none(self, tmp_path: Path) -> None:
-        """可空字符串设为 None"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            name = Column(str, nullable=True)
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, name=None))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.name is None
-
-        session.close()
-        db.close()
-
-    def test_nullable_int_none(self, tmp_path: Path) -> None:
-        """可空整数设为 None"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            count = Column(int, nullable=True)
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, count=None))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.count is None
-
-        session.close()
-        db.close()
-
-    def test_nullable_list_none(self, tmp_path: Path) -> None:
-        """可空列表设为 None"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            tags = Column(list, nullable=True)
-
-        session = Session(db)
-        session.execute(insert(Item).values(id=1, tags=None))
-        session.commit()
-
-        item = session.get(Item, 1)
-        assert item is not None
-        assert item.tags is None
-
-        session.close()
-        db.close()
+    def test_nullable_none(self, roundtrip: Roundtrip) -> None:
+        """可空的字符串、整数、列表列设为 None"""
+        assert roundtrip(str, None) is None
+        assert roundtrip(int, None) is None
+        assert roundtrip(list, None) is None
 
 
 class TestMultipleRecordsBoundaryValues:
     """多记录边界值"""
 
-    def test_single_record(self, tmp_path: Path) -> None:
+    def test_single_record(self, item_session: Tuple[Session, Any]) -> None:
         """单条记录"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-
-        session = Session(db)
+        session, Item = item_session
         session.execute(insert(Item).values(id=1, name='only'))
         session.commit()
 
@@ -730,52 +235,25 @@ class TestMultipleRecordsBoundaryValues:
         items = result.all()
         assert len(items) == 1
 
-        session.close()
-        db.close()
-
-    def test_many_records(self, tmp_path: Path) -> None:
+    def test_many_records(self, item_session: Tuple[Session, Any]) -> None:
         """大量记录（1000条）"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-
-        session = Session(db)
+        session, Item = item_session
 
-        # 插入 1000 条记录
-        for i in range(1, 1001):
-            session.execute(insert(Item).values(id=i, name=f'item_{i}'))
+        # 一次 execute 批量插入 1000 条记录
+        session.execute(insert(Item), [{'id': i, 'name': f'item_{i}'} for i in range(1, 1001)])
         session.commit()
 
-        # 验证总数
-        result = session.execute(select(Item))
-        items = result.all()
-        assert len(items) == 1000
+        # 验证总数（只计数，不实例化 1000 个对象）
+        assert session.storage.count_rows('items') == 1000
 
         # 验证能正确获取特定记录
         item = session.get(Item, 500)
         assert item is not None
         assert item.name == 'item_500'
 
-        session.close()
-        db.close()
-
-    def test_empty_table(self, tmp_path: Path) -> None:
+    def test_empty_table(self, item_session: Tuple[Session, Any]) -> None:
         """空表查询"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class Item(Base):
-            __tablename__ = 'items'
-            id = Column(int, primary_key=True)
-            name = Column(str)
-
-        session = Session(db)
+        session, Item = item_session
 
         # 查询空表
         result = session.execute(select(Item))
@@ -785,6 +263,3 @@ class TestMultipleRecordsBoundaryValues:
         # first() 应返回 None
         first_item = result.first()
         assert first_item is None
-
-        session.close()
-        db.close()
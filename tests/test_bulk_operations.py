@@ -5,6 +5,7 @@
 """
 
 import pytest
+from pathlib import Path
 from typing import Any, Dict, List, Type
 
 from pytuck import (
@@ -132,6 +133,20 @@ class TestSessionBulkInsert:
         assert isinstance(pks[1], int)  # 自动分配
         assert pks[2] == 10
 
+    def test_bulk_insert_auto_pk_skips_manual_pks(self, db: Storage, pure_base: Type[PureBaseModel]) -> None:
+        """自动分配的主键跳过同批次中手动指定的主键"""
+        class User(pure_base):  # type: ignore[valid-type]
+            __tablename__ = 'users'
+            id = Column(int, primary_key=True)
+            name = Column(str)
+
+        session = Session(db)
+        users = [User(id=2, name='Alice'), User(name='Bob'), User(name='Charlie'), User(id=1, name='Dave')]
+        pks = session.bulk_insert(users)
+
+        assert pks == [2, 3, 4, 1]
+        assert session.bulk_insert([User(name='Eve')]) == [5]
+
     def test_bulk_insert_empty_list(self, db: Storage, pure_base: Type[PureBaseModel]) -> None:
         """空列表返回空列表"""
         session = Session(db)
@@ -153,6 +168,13 @@ class TestSessionBulkInsert:
         with pytest.raises(DuplicateKeyError):
             session.bulk_insert([User(id=1, name='Bob')])
 
+        # 与已有记录冲突时报告批次中第一个冲突的主键，且整批不写入
+        session.bulk_insert([User(id=5, name='Eve')])
+        with pytest.raises(DuplicateKeyError) as exc_info:
+            session.bulk_insert([User(id=3, name='Carol'), User(id=5, name='Eve2'), User(id=1, name='Bob')])
+        assert exc_info.value.pk == 5
+        assert db.count_rows('users') == 2
+
     def test_bulk_insert_different_model_raises(self, db: Storage, pure_base: Type[PureBaseModel]) -> None:
         """不同模型类报错"""
         class User(pure_base):  # type: ignore[valid-type]
@@ -185,6 +207,37 @@ class TestSessionBulkInsert:
         result = session.execute(select(User)).all()
         assert result[0].age == 25  # 应被转换为 int
 
+    def test_storage_bulk_insert_validates_before_storing(
+        self, db: Storage, pure_base: Type[PureBaseModel]
+    ) -> None:
+        """Storage.bulk_insert 先验证全部行，任一行失败时不写入记录和索引"""
+        class User(pure_base):  # type: ignore[valid-type]
+            __tablename__ = 'users'
+            id = Column(int, primary_key=True)
+            name = Column(str, nullable=False, index=True)
+
+        with pytest.raises(ValidationError):
+            db.bulk_insert('users', [{'name': 'Alice'}, {'name': None}])
+
+        assert db.count_rows('users') == 0
+        assert Session(db).execute(select(User).where(User.name == 'Alice')).all() == []
+
+    def test_storage_bulk_insert_mixed_types_still_validated(
+        self, db: Storage, pure_base: Type[PureBaseModel]
+    ) -> None:
+        """整列类型一致时跳过逐值验证，但列中任一值类型不符时整列照常验证"""
+        class User(pure_base):  # type: ignore[valid-type]
+            __tablename__ = 'users'
+            id = Column(int, primary_key=True)
+            age = Column(int)
+            email = Column(str, nullable=True)
+
+        with pytest.raises(ValidationError):
+            db.bulk_insert('users', [{'age': 1}, {'age': True}])
+
+        db.bulk_insert('users', [{'age': 1, 'email': None}, {'age': '2', 'email': 'b@x'}])
+        assert [r['age'] for r in db.query('users', [])] == [1, 2]
+
     def test_bulk_insert_with_default_values(self, db: Storage, pure_base: Type[PureBaseModel]) -> None:
         """默认值正常填充"""
         class User(pure_base):  # type: ignore[valid-type]
@@ -331,6 +384,30 @@ class TestSessionBulkUpdate:
         result = session.execute(select(User)).all()
         assert result[0].age == 25  # 应被转换为 int
 
+    def test_storage_bulk_update_validates_before_storing(
+        self, db: Storage, pure_base: Type[PureBaseModel]
+    ) -> None:
+        """Storage.bulk_update 先验证全部行，任一行失败时不修改记录和索引"""
+        class User(pure_base):  # type: ignore[valid-type]
+            __tablename__ = 'users'
+            id = Column(int, primary_key=True)
+            name = Column(str, nullable=False, index=True)
+
+        db.bulk_insert('users', [{'name': 'Alice'}, {'name': 'Bob'}])
+
+        with pytest.raises(ValidationError):
+            db.bulk_update('users', [(1, {'name': 'Alicia'}), (2, {'name': None})])
+        with pytest.raises(RecordNotFoundError):
+            db.bulk_update('users', [(1, {'name': 'Alicia'}), (3, {'name': 'Carol'})])
+
+        assert db.select('users', 1)['name'] == 'Alice'
+        assert Session(db).execute(select(User).where(User.name == 'Alicia')).all() == []
+
+        # 同一主键多次出现时依次生效
+        assert db.bulk_update('users', [(1, {'name': 'A1'}), (1, {'name': 'A2'})]) == 2
+        assert [u.id for u in Session(db).execute(select(User).where(User.name == 'A2')).all()] == [1]
+        assert Session(db).execute(select(User).where(User.name == 'A1')).all() == []
+
     def test_bulk_update_index_maintained(self, db: Storage, pure_base: Type[PureBaseModel]) -> None:
         """索引正确维护（old/new 值变化）"""
         class User(pure_base):  # type: ignore[valid-type]
@@ -394,6 +471,60 @@ class TestSessionBulkUpdate:
         assert result[0].age == 25
         assert result[0].email == 'new@test.com'
 
+    def test_bulk_update_tracked_writes_dirty_fields_only(self, db: Storage, pure_base: Type[PureBaseModel]) -> None:
+        """会话跟踪的实例只写入修改过的字段，且不再留在待更新列表中"""
+        class User(pure_base):  # type: ignore[valid-type]
+            __tablename__ = 'users'
+            id = Column(int, primary_key=True)
+            name = Column(str)
+            age = Column(int)
+
+        session = Session(db)
+        users = [User(name='Alice', age=20), User(name='Bob', age=30)]
+        session.bulk_insert(users)
+
+        # 绕过会话直接修改存储，未修改的字段不应被实例旧值覆盖
+        db.update('users', users[0].id, {'age': 99})
+
+        users[0].name = 'Alice_new'
+        assert session._dirty_objects == [users[0]]
+        session.bulk_update(users)
+        assert session._dirty_objects == []
+
+        assert db.select('users', users[0].id) == {'id': 1, 'name': 'Alice_new', 'age': 99}
+
+        # 未被跟踪的实例写入全部字段
+        detached = User(id=2, name='Bobby', age=31)
+        session.bulk_update([detached])
+        assert db.select('users', 2) == {'id': 2, 'name': 'Bobby', 'age': 31}
+
+    def test_bulk_update_tracked_writes_mutable_columns(self, tmp_path: Path) -> None:
+        """原生 SQL 模式下 list 列的原地修改随其他字段的修改一并写入"""
+        db = Storage(file_path=str(tmp_path / 'bulk_update.sqlite'), engine='sqlite')
+        Base: Type[PureBaseModel] = declarative_base(db)
+
+        class User(Base):
+            __tablename__ = 'users'
+            id = Column(int, primary_key=True)
+            name = Column(str)
+            tags = Column(list)
+
+        session = Session(db)
+        user = User(name='a', tags=[1])
+        session.add(user)
+        session.commit()
+
+        user.tags.append(2)
+        user.name = 'b'
+        session.bulk_update([user])
+        session.commit()
+
+        assert db.select('users', user.id)['tags'] == [1, 2]
+        assert db.select('users', user.id)['name'] == 'b'
+
+        session.close()
+        db.close()
+
 
 # ============== C. CRUDBaseModel.bulk_insert / bulk_update ==============
 
@@ -439,6 +570,33 @@ class TestCRUDBulkOperations:
         assert alice is not None
         assert alice.age == 21
 
+    def test_crud_bulk_create(self, db: Storage, crud_base: Type[CRUDBaseModel]) -> None:
+        """Active Record 模式从字典批量创建"""
+        class User(crud_base):  # type: ignore[valid-type]
+            __tablename__ = 'users'
+            id = Column(int, primary_key=True)
+            name = Column(str)
+            status = Column(str, default='active')
+
+        users = User.bulk_create([{'name': 'Alice'}, {'name': 'Bob', 'status': 'banned'}])
+
+        assert [u.id for u in users] == [1, 2]
+        assert all(u._loaded_from_db for u in users)
+        assert User.get(1).status == 'active'
+        assert User.get(2).status == 'banned'
+
+    def test_crud_bulk_create_validates_rows(self, db: Storage, crud_base: Type[CRUDBaseModel]) -> None:
+        """任一行验证失败时不写入任何记录"""
+        class User(crud_base):  # type: ignore[valid-type]
+            __tablename__ = 'users'
+            id = Column(int, primary_key=True)
+            name = Column(str, nullable=False)
+
+        with pytest.raises(ValidationError):
+            User.bulk_create([{'name': 'Alice'}, {}])
+
+        assert db.count_rows('users') == 0
+
 
 # ============== D. 事件 ==============
 
@@ -622,8 +780,8 @@ class TestBulkEdgeCases:
         assert pks[0] == 1
         assert pks[-1] == 1000
 
-        result = session.execute(select(User)).all()
-        assert len(result) == 1000
+        # 只核对行数，不必把 1000 行实例化为模型对象
+        assert db.count_rows('users') == 1000
 
     def test_bulk_insert_with_none_values(self, db: Storage, pure_base: Type[PureBaseModel]) -> None:
         """包含 None 值"""
@@ -8,7 +8,7 @@ Column.name 与属性名映射的全面测试
 """
 
 from pathlib import Path
-from typing import Type
+from typing import Callable, Generator, Tuple, Type
 
 import pytest
 
@@ -16,87 +16,143 @@ from pytuck import Storage, Session, Column, PureBaseModel, CRUDBaseModel, decla
 from pytuck import select, insert, update, delete
 
 
-class TestStatementAPIColumnNameMapping:
-    """Statement API (insert/update/delete) 的 Column.name 映射"""
+# (共享数据库, Session 模式 User 模型, Active Record 模式 Member 模型)
+SharedModels = Tuple[Storage, Type[PureBaseModel], Type[CRUDBaseModel]]
+# 写入路径：(共享模型, 是否改名) -> 存储表名
+WritePath = Callable[[SharedModels, bool], str]
 
-    def test_insert_statement_with_column_name(self, tmp_path: Path) -> None:
-        """insert(Model).values() 使用 Column.name 正确写入"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
 
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            user_name = Column(str, name='User Name')  # 属性名与列名不同
+@pytest.fixture
+def db() -> Generator[Storage, None, None]:
+    """内存数据库（不涉及持久化的测试使用，测试结束后关闭）"""
+    storage = Storage(in_memory=True)
+    yield storage
+    storage.close()
 
-        session = Session(db)
 
-        # 通过 Statement API 插入
-        session.execute(insert(User).values(id=1, user_name='Alice'))
-        session.commit()
+@pytest.fixture(scope='module')
+def shared_models() -> Generator[SharedModels, None, None]:
+    """
+    整个模块共享的内存数据库与模型
 
-        # 验证数据正确写入（直接查询存储层）
-        records = db.query('users', [])
-        assert len(records) == 1
-        assert records[0]['User Name'] == 'Alice'  # 存储使用 Column.name
+    属性名与 Column.name 不同的标准模型只声明一次：
+    - users 表：Session / Statement API 测试使用
+    - members 表：Active Record 测试使用
+    """
+    db = Storage(in_memory=True)
+    Base: Type[PureBaseModel] = declarative_base(db)
+    CRUDBase: Type[CRUDBaseModel] = declarative_base(db, crud=True)
 
-        session.close()
-        db.close()
+    class User(Base):
+        __tablename__ = 'users'
+        id = Column(int, primary_key=True)
+        user_name = Column(str, name='User Name')  # 属性名与列名不同
+        status = Column(str, name='Status Code')
 
-    def test_update_statement_with_column_name(self, tmp_path: Path) -> None:
-        """update(Model).values() 使用 Column.name 正确更新"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
+    class Member(CRUDBase):
+        __tablename__ = 'members'
+        id = Column(int, primary_key=True)
+        user_name = Column(str, name='User Name')
 
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            user_name = Column(str, name='User Name')
+    yield db, User, Member
+    db.close()
 
-        session = Session(db)
 
-        # 插入初始数据
-        session.execute(insert(User).values(id=1, user_name='Alice'))
-        session.commit()
+@pytest.fixture
+def shared(shared_models: SharedModels) -> Generator[SharedModels, None, None]:
+    """共享模型，测试结束后清空 users / members 表，保证测试间隔离"""
+    yield shared_models
+    db, User, Member = shared_models
+    session = Session(db)
+    session.execute(delete(User))
+    session.execute(delete(Member))
+    session.close()
+
+
+# ---------- 写入路径 ----------
+# 每个函数通过一种 API 写入 user_name='Alice'，rename=True 时再改为 'Bob'，返回存储表名
+
 
-        # 通过 Statement API 更新
+def _write_via_statement(shared: SharedModels, rename: bool) -> str:
+    """insert(Model).values() / update(Model).values()"""
+    db, User, _ = shared
+    session = Session(db)
+    session.execute(insert(User).values(id=1, user_name='Alice'))
+    if rename:
         session.execute(update(User).where(User.id == 1).values(user_name='Bob'))
-        session.commit()
+    session.close()
+    return 'users'
+
+
+def _write_via_session_add(shared: SharedModels, rename: bool) -> str:
+    """Session.add() + flush，修改属性后再 flush"""
+    db, User, _ = shared
+    session = Session(db)
+    user = User(user_name='Alice')
+    session.add(user)
+    session.flush()
+    if rename:
+        user.user_name = 'Bob'
+        session.flush()
+    session.close()
+    return 'users'
 
-        # 验证更新成功
-        records = db.query('users', [])
-        assert records[0]['User Name'] == 'Bob'
 
-        session.close()
-        db.close()
+def _write_via_crud(shared: SharedModels, rename: bool) -> str:
+    """CRUDBaseModel.create() / save()"""
+    _, _, Member = shared
+    member = Member.create(user_name='Alice')
+    if rename:
+        member.user_name = 'Bob'
+        member.save()
+    return 'members'
 
-    def test_update_statement_by_condition_with_column_name(self, tmp_path: Path) -> None:
-        """update(Model).where(条件).values() 按条件更新时正确映射"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
 
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            user_name = Column(str, name='User Name')
-            status = Column(str, name='Status Code')
+WRITE_PATHS = [
+    pytest.param(_write_via_statement, id='statement'),
+    pytest.param(_write_via_session_add, id='session_add'),
+    pytest.param(_write_via_crud, id='crud'),
+]
+
+
+class TestWritePathColumnNameMapping:
+    """各写入路径（Statement API / Session.add / Active Record）的 Column.name 映射"""
+
+    @pytest.mark.parametrize('write', WRITE_PATHS)
+    def test_insert_uses_column_name(self, shared: SharedModels, write: WritePath) -> None:
+        """插入时存储层使用 Column.name"""
+        table_name = write(shared, False)
+        records = shared[0].query(table_name, [])
+        assert [r['User Name'] for r in records] == ['Alice']
+
+    @pytest.mark.parametrize('write', WRITE_PATHS)
+    def test_update_uses_column_name(self, shared: SharedModels, write: WritePath) -> None:
+        """更新时存储层使用 Column.name"""
+        table_name = write(shared, True)
+        records = shared[0].query(table_name, [])
+        assert [r['User Name'] for r in records] == ['Bob']
+
+
+class TestStatementAPIColumnNameMapping:
+    """Statement API (update/delete/select) 的 Column.name 映射"""
+
+    def test_update_statement_by_condition_with_column_name(self, shared: SharedModels) -> None:
+        """update(Model).where(条件).values() 按条件更新时正确映射"""
+        db, User, _ = shared
 
         session = Session(db)
 
-        # 插入多条数据
-        session.execute(insert(User).values(id=1, user_name='Alice', status='active'))
-        session.execute(insert(User).values(id=2, user_name='Bob', status='active'))
-        session.execute(insert(User).values(id=3, user_name='Charlie', status='inactive'))
-        session.commit()
+        # 插入多条数据（executemany）
+        session.execute(insert(User), [
+            {'id': 1, 'user_name': 'Alice', 'status': 'active'},
+            {'id': 2, 'user_name': 'Bob', 'status': 'active'},
+            {'id': 3, 'user_name': 'Charlie', 'status': 'inactive'},
+        ])
 
         # 按条件更新
         count = session.execute(
             update(User).where(User.status == 'active').values(status='updated')
         ).rowcount()
-        session.commit()
 
         assert count == 2
 
@@ -106,29 +162,18 @@ class TestStatementAPIColumnNameMapping:
         assert updated_count == 2
 
         session.close()
-        db.close()
 
-    def test_delete_statement_with_column_name(self, tmp_path: Path) -> None:
+    def test_delete_statement_with_column_name(self, shared: SharedModels) -> None:
         """delete(Model).where() 使用 Column.name 正确匹配"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            user_name = Column(str, name='User Name')
+        db, User, _ = shared
 
         session = Session(db)
 
         # 插入数据
-        session.execute(insert(User).values(id=1, user_name='Alice'))
-        session.execute(insert(User).values(id=2, user_name='Bob'))
-        session.commit()
+        session.execute(insert(User), [{'id': 1, 'user_name': 'Alice'}, {'id': 2, 'user_name': 'Bob'}])
 
         # 通过 Statement API 删除
         count = session.execute(delete(User).where(User.user_name == 'Alice')).rowcount()
-        session.commit()
 
         assert count == 1
 
@@ -138,25 +183,15 @@ class TestStatementAPIColumnNameMapping:
         assert records[0]['User Name'] == 'Bob'
 
         session.close()
-        db.close()
 
-    def test_select_statement_with_column_name(self, tmp_path: Path) -> None:
+    def test_select_statement_with_column_name(self, shared: SharedModels) -> None:
         """select(Model).where() 使用 Column.name 正确查询"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            user_name = Column(str, name='User Name')
+        db, User, _ = shared
 
         session = Session(db)
 
         # 插入数据
-        session.execute(insert(User).values(id=1, user_name='Alice'))
-        session.execute(insert(User).values(id=2, user_name='Bob'))
-        session.commit()
+        session.execute(insert(User), [{'id': 1, 'user_name': 'Alice'}, {'id': 2, 'user_name': 'Bob'}])
 
         # 通过 Statement API 查询
         result = session.execute(select(User).where(User.user_name == 'Alice'))
@@ -166,7 +201,6 @@ class TestStatementAPIColumnNameMapping:
         assert users[0].user_name == 'Alice'
 
         session.close()
-        db.close()
 
 
 class TestColumnNamePersistenceRoundTrip:
@@ -254,10 +288,8 @@ class TestColumnNamePersistenceRoundTrip:
         session2.close()
         db2.close()
 
-    def test_multiple_columns_with_custom_names(self, tmp_path: Path) -> None:
+    def test_multiple_columns_with_custom_names(self, db: Storage) -> None:
         """多个列都有自定义 Column.name"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
         Base: Type[PureBaseModel] = declarative_base(db)
 
         class Product(Base):
@@ -276,16 +308,15 @@ class TestColumnNamePersistenceRoundTrip:
             unit_price=9.99,
             stock_qty=100
         ))
-        session.commit()
 
         # 验证存储层使用 Column.name
-        records = db.query('products', [])
-        assert 'Product ID' in records[0]
-        assert 'Product Name' in records[0]
-        assert 'Unit Price' in records[0]
-        assert 'Stock Quantity' in records[0]
-        assert records[0]['Product Name'] == 'Widget'
-        assert records[0]['Unit Price'] == 9.99
+        record = db.select('products', 1)
+        assert 'Product ID' in record
+        assert 'Product Name' in record
+        assert 'Unit Price' in record
+        assert 'Stock Quantity' in record
+        assert record['Product Name'] == 'Widget'
+        assert record['Unit Price'] == 9.99
 
         # 验证读取使用属性名
         user = session.get(Product, 1)
@@ -295,16 +326,13 @@ class TestColumnNamePersistenceRoundTrip:
         assert user.stock_qty == 100
 
         session.close()
-        db.close()
 
 
 class TestColumnNameEdgeCases:
     """Column.name 边界情况"""
 
-    def test_column_name_with_spaces(self, tmp_path: Path) -> None:
+    def test_column_name_with_spaces(self, db: Storage) -> None:
         """Column.name 包含空格"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
         Base: Type[PureBaseModel] = declarative_base(db)
 
         class User(Base):
@@ -316,7 +344,6 @@ class TestColumnNameEdgeCases:
         session = Session(db)
 
         session.execute(insert(User).values(id=1, first_name='John', last_name='Doe'))
-        session.commit()
 
         user = session.get(User, 1)
         assert user is not None
@@ -324,12 +351,9 @@ class TestColumnNameEdgeCases:
         assert user.last_name == 'Doe'
 
         session.close()
-        db.close()
 
-    def test_column_name_with_special_chars(self, tmp_path: Path) -> None:
+    def test_column_name_with_special_chars(self, db: Storage) -> None:
         """Column.name 包含特殊字符（中文、标点等）"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
         Base: Type[PureBaseModel] = declarative_base(db)
 
         class User(Base):
@@ -341,12 +365,11 @@ class TestColumnNameEdgeCases:
         session = Session(db)
 
         session.execute(insert(User).values(id=1, user_name='张三', email='test@example.com'))
-        session.commit()
 
         # 验证存储层使用中文列名
-        records = db.query('users', [])
-        assert '用户名' in records[0]
-        assert '电子邮箱@地址' in records[0]
+        record = db.select('users', 1)
+        assert '用户名' in record
+        assert '电子邮箱@地址' in record
 
         # 验证读取正常
         user = session.get(User, 1)
@@ -355,12 +378,9 @@ class TestColumnNameEdgeCases:
         assert user.email == 'test@example.com'
 
         session.close()
-        db.close()
 
-    def test_column_name_none_uses_attr_name(self, tmp_path: Path) -> None:
+    def test_column_name_none_uses_attr_name(self, db: Storage) -> None:
         """Column.name 为 None 时使用属性名"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
         Base: Type[PureBaseModel] = declarative_base(db)
 
         class User(Base):
@@ -371,183 +391,54 @@ class TestColumnNameEdgeCases:
         session = Session(db)
 
         session.execute(insert(User).values(id=1, username='alice'))
-        session.commit()
 
         # 验证存储层使用属性名作为列名
-        records = db.query('users', [])
-        assert 'username' in records[0]
-        assert records[0]['username'] == 'alice'
+        record = db.select('users', 1)
+        assert 'username' in record
+        assert record['username'] == 'alice'
 
         session.close()
-        db.close()
 
 
 class TestCRUDBaseModelColumnNameMapping:
     """Active Record 模式的 Column.name 映射"""
 
-    def test_create_with_column_name(self, tmp_path: Path) -> None:
-        """CRUDBaseModel.create() 使用 Column.name 正确写入"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            user_name = Column(str, name='User Name')
-
-        user = User.create(user_name='Alice')
-
-        # 验证存储层使用 Column.name
-        records = db.query('users', [])
-        assert records[0]['User Name'] == 'Alice'
-
-        db.close()
-
-    def test_save_with_column_name(self, tmp_path: Path) -> None:
-        """CRUDBaseModel.save() 使用 Column.name 正确更新"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            user_name = Column(str, name='User Name')
-
-        user = User.create(user_name='Alice')
-        user.user_name = 'Bob'
-        user.save()
-
-        # 验证更新成功
-        records = db.query('users', [])
-        assert records[0]['User Name'] == 'Bob'
-
-        db.close()
-
-    def test_get_with_column_name(self, tmp_path: Path) -> None:
+    def test_get_with_column_name(self, shared: SharedModels) -> None:
         """CRUDBaseModel.get() 使用 Column.name 正确读取"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
+        db, _, User = shared
 
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            user_name = Column(str, name='User Name')
-
-        User.create(user_name='Alice')
+        created = User.create(user_name='Alice')
 
-        user = User.get(1)
+        user = User.get(created.id)
         assert user is not None
         assert user.user_name == 'Alice'
 
-        db.close()
-
-    def test_filter_with_column_name(self, tmp_path: Path) -> None:
+    def test_filter_with_column_name(self, shared: SharedModels) -> None:
         """CRUDBaseModel.filter() 使用 Column.name 正确查询"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
+        db, _, User = shared
 
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            user_name = Column(str, name='User Name')
-
-        User.create(user_name='Alice')
-        User.create(user_name='Bob')
+        User.bulk_create([{'user_name': 'Alice'}, {'user_name': 'Bob'}])
 
         users = User.filter(User.user_name == 'Alice').all()
         assert len(users) == 1
         assert users[0].user_name == 'Alice'
 
-        db.close()
-
-    def test_filter_by_with_column_name(self, tmp_path: Path) -> None:
+    def test_filter_by_with_column_name(self, shared: SharedModels) -> None:
         """CRUDBaseModel.filter_by() 使用 Column.name 正确查询"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[CRUDBaseModel] = declarative_base(db, crud=True)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            user_name = Column(str, name='User Name')
+        db, _, User = shared
 
-        User.create(user_name='Alice')
-        User.create(user_name='Bob')
+        User.bulk_create([{'user_name': 'Alice'}, {'user_name': 'Bob'}])
 
         users = User.filter_by(user_name='Alice').all()
         assert len(users) == 1
         assert users[0].user_name == 'Alice'
 
-        db.close()
-
-
-class TestSessionAddColumnNameMapping:
-    """Session.add() 的 Column.name 映射"""
-
-    def test_session_add_with_column_name(self, tmp_path: Path) -> None:
-        """Session.add() + flush 使用 Column.name 正确写入"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            user_name = Column(str, name='User Name')
-
-        session = Session(db)
-
-        user = User(user_name='Alice')
-        session.add(user)
-        session.flush()
-
-        # 验证存储层使用 Column.name
-        records = db.query('users', [])
-        assert records[0]['User Name'] == 'Alice'
-
-        session.close()
-        db.close()
-
-    def test_session_add_update_with_column_name(self, tmp_path: Path) -> None:
-        """Session.add() 后更新属性，再 flush"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
-        Base: Type[PureBaseModel] = declarative_base(db)
-
-        class User(Base):
-            __tablename__ = 'users'
-            id = Column(int, primary_key=True)
-            user_name = Column(str, name='User Name')
-
-        session = Session(db)
-
-        user = User(user_name='Alice')
-        session.add(user)
-        session.flush()
-
-        # 更新后再 flush
-        user.user_name = 'Bob'
-        session.flush()
-
-        # 验证更新成功
-        records = db.query('users', [])
-        assert records[0]['User Name'] == 'Bob'
-
-        session.close()
-        db.close()
-
 
 class TestPrimaryKeyColumnNameMapping:
     """主键列的 Column.name 映射"""
 
-    def test_pk_with_custom_column_name(self, tmp_path: Path) -> None:
+    def test_pk_with_custom_column_name(self, db: Storage) -> None:
         """主键列使用自定义 Column.name"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
         Base: Type[PureBaseModel] = declarative_base(db)
 
         class User(Base):
@@ -558,12 +449,11 @@ class TestPrimaryKeyColumnNameMapping:
         session = Session(db)
 
         session.execute(insert(User).values(user_id=1, user_name='Alice'))
-        session.commit()
 
         # 验证存储层使用 Column.name
-        records = db.query('users', [])
-        assert 'User ID' in records[0]
-        assert records[0]['User ID'] == 1
+        record = db.select('users', 1)
+        assert 'User ID' in record
+        assert record['User ID'] == 1
 
         # 验证 Session.get() 正常工作
         user = session.get(User, 1)
@@ -572,12 +462,9 @@ class TestPrimaryKeyColumnNameMapping:
         assert user.user_name == 'Alice'
 
         session.close()
-        db.close()
 
-    def test_update_by_pk_with_custom_column_name(self, tmp_path: Path) -> None:
+    def test_update_by_pk_with_custom_column_name(self, db: Storage) -> None:
         """通过自定义 Column.name 的主键更新"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
         Base: Type[PureBaseModel] = declarative_base(db)
 
         class User(Base):
@@ -588,11 +475,9 @@ class TestPrimaryKeyColumnNameMapping:
         session = Session(db)
 
         session.execute(insert(User).values(user_id=1, user_name='Alice'))
-        session.commit()
 
         # 通过主键条件更新
         session.execute(update(User).where(User.user_id == 1).values(user_name='Bob'))
-        session.commit()
 
         # 验证更新成功
         user = session.get(User, 1)
@@ -600,12 +485,9 @@ class TestPrimaryKeyColumnNameMapping:
         assert user.user_name == 'Bob'
 
         session.close()
-        db.close()
 
-    def test_delete_by_pk_with_custom_column_name(self, tmp_path: Path) -> None:
+    def test_delete_by_pk_with_custom_column_name(self, db: Storage) -> None:
         """通过自定义 Column.name 的主键删除"""
-        db_file = tmp_path / 'test.db'
-        db = Storage(file_path=str(db_file), engine='binary')
         Base: Type[PureBaseModel] = declarative_base(db)
 
         class User(Base):
@@ -615,13 +497,13 @@ class TestPrimaryKeyColumnNameMapping:
 
         session = Session(db)
 
-        session.execute(insert(User).values(user_id=1, user_name='Alice'))
-        session.execute(insert(User).values(user_id=2, user_name='Bob'))
-        session.commit()
+        session.execute(insert(User), [
+            {'user_id': 1, 'user_name': 'Alice'},
+            {'user_id': 2, 'user_name': 'Bob'},
+        ])
 
         # 通过主键条件删除
         count = session.execute(delete(User).where(User.user_id == 1)).rowcount()
-        session.commit()
 
         assert count == 1
 
@@ -632,4 +514,3 @@ class TestPrimaryKeyColumnNameMapping:
         assert users[0].user_name == 'Bob'
 
         session.close()
-        db.close()
@@ -104,6 +104,47 @@ class TestStorageConfiguration:
         assert db.auto_flush is False
         db.close()
 
+    def test_batch_schema_flushes_once(self, tmp_path, monkeypatch):
+        """batch_schema() 内声明多个模型只写盘一次"""
+        db_path = tmp_path / "test.json"
+        db = Storage(file_path=str(db_path), engine='json', auto_flush=True)
+
+        saves = []
+        original_save = db.backend.save
+        monkeypatch.setattr(db.backend, 'save', lambda tables: (saves.append(1), original_save(tables)))
+
+        Base: Type[PureBaseModel] = declarative_base(db)
+
+        with db.batch_schema():
+            class User(Base):
+                __tablename__ = 'users'
+                id = Column(int, primary_key=True)
+
+            class Order(Base):
+                __tablename__ = 'orders'
+                id = Column(int, primary_key=True)
+
+            assert saves == []
+
+        assert len(saves) == 1
+        assert set(db.tables) == {'users', 'orders'}
+        assert db.auto_flush is True
+        db.close()
+
+    def test_batch_schema_error_skips_flush(self, tmp_path):
+        """batch_schema() 异常退出时不写盘，并恢复 auto_flush"""
+        db_path = tmp_path / "test.json"
+        db = Storage(file_path=str(db_path), engine='json', auto_flush=True)
+
+        with pytest.raises(RuntimeError):
+            with db.batch_schema():
+                db.create_table('users', [Column(int, primary_key=True, name='id')])
+                raise RuntimeError("boom")
+
+        assert not db_path.exists()
+        assert db.auto_flush is True
+        db.close()
+
 
 class TestSessionConfiguration:
     """Session 配置测试"""
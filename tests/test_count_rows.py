@@ -189,3 +189,34 @@ class TestCountRows:
         assert db.count_rows('products') == 5
 
         db.close()
+
+
+class TestCountWithConditions:
+    """测试 Storage.count 条件计数"""
+
+    @pytest.mark.parametrize('use_native_sql', [True, False])
+    def test_count_with_conditions(self, tmp_path: Path, use_native_sql: bool) -> None:
+        """条件计数与 query 结果数一致，limit 作为计数上限"""
+        from pytuck.query import Condition, CompositeCondition
+
+        db_file = tmp_path / 'test_count.sqlite'
+        options = SqliteBackendOptions(use_native_sql=use_native_sql)
+        db = Storage(file_path=str(db_file), engine='sqlite', backend_options=options)
+        Base: Type[PureBaseModel] = declarative_base(db)
+
+        class User(Base):
+            __tablename__ = 'users'
+            id = Column(int, primary_key=True)
+            age = Column(int, index='sorted')
+
+        for i in range(10):
+            db.insert('users', {'age': i})
+
+        assert db.count('users', []) == 10
+        assert db.count('users', [Condition('age', '>=', 5)]) == 5
+        assert db.count('users', [Condition('age', '>=', 5)], limit=2) == 2
+        assert db.count('users', [Condition('age', '>=', 5)], limit=0) == 0
+        either = CompositeCondition('OR', [Condition('age', '=', 1), Condition('age', '=', 8)])
+        assert db.count('users', [either]) == 2
+
+        db.close()
@@ -11,8 +11,10 @@ Pytuck 多存储引擎测试
 """
 
 import os
+import re
 import sys
 import unittest
+import zipfile
 from typing import Type, Dict, Any
 
 # 添加项目根目录到路径
@@ -260,6 +262,41 @@ class TestExcelEngine(BaseEngineTest):
     engine_name = 'excel'
     file_extension = 'xlsx'
 
+    def _rewrite_dimensions(self, replacement: str) -> None:
+        """改写所有工作表的 <dimension> 元素，模拟其他工具生成的文件"""
+        with zipfile.ZipFile(self.db_file) as zf:
+            entries = [(info, zf.read(info.filename)) for info in zf.infolist()]
+        with zipfile.ZipFile(self.db_file, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for info, data in entries:
+                if info.filename.startswith('xl/worksheets/sheet'):
+                    # dimension 按 schema 位于 sheetPr 之后
+                    data = re.sub(rb'<dimension ref="[^"]*"\s*/>', b'', data)
+                    data = data.replace(b'</sheetPr>', b'</sheetPr>' + replacement.encode(), 1)
+                zf.writestr(info, data)
+
+    def _assert_reload_ignores_dimensions(self, replacement: str) -> None:
+        for i in range(5):
+            self.session.execute(insert(self.Student).values(name=f'S{i}', age=20 + i, active=True))
+        self.session.commit()
+        self.db.flush()
+
+        self._rewrite_dimensions(replacement)
+
+        db2 = Storage(file_path=self.db_file, engine=self.engine_name)
+        try:
+            self.assertEqual(db2.count_rows('students'), 5)
+            self.assertEqual(db2.select('students', 5)['name'], 'S4')
+        finally:
+            db2.close()
+
+    def test_load_ignores_wrong_dimension(self) -> None:
+        """工作表记录的 dimension 错误时仍读取全部行"""
+        self._assert_reload_ignores_dimensions('<dimension ref="A1"/>')
+
+    def test_load_ignores_missing_dimension(self) -> None:
+        """工作表缺少 dimension 时仍读取全部行"""
+        self._assert_reload_ignores_dimensions('')
+
 
 @unittest.skipUnless(is_engine_available('xml'), "XML engine not available (install pytuck[xml])")
 class TestXMLEngine(BaseEngineTest):
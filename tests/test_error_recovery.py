@@ -284,6 +284,81 @@ class TestStorageRecovery:
         session2.close()
         db2.close()
 
+    # binary 引擎首次 flush 后写入即落 WAL，reload 会回放，故只测整文件保存的引擎
+    @pytest.mark.parametrize('engine', ['json', 'csv'])
+    def test_reload_discards_unflushed_changes(self, tmp_path, engine):
+        """reload() 从磁盘重新加载，丢弃未 flush 的修改"""
+        db_path = tmp_path / f"test.{engine}"
+        db = Storage(file_path=str(db_path), engine=engine)
+
+        Base: Type[PureBaseModel] = declarative_base(db)
+
+        class User(Base):
+            __tablename__ = 'users'
+            id = Column(int, primary_key=True)
+            name = Column(str)
+
+        session = Session(db)
+        session.execute(insert(User).values(id=1, name='Alice'))
+        session.commit()
+        db.flush()
+
+        session.execute(insert(User).values(id=2, name='Bob'))
+        session.commit()
+        assert db.count_rows('users') == 2
+
+        db.reload()
+
+        # 已注册的模型类无需重新声明
+        users = Session(db).execute(select(User)).all()
+        assert [u.name for u in users] == ['Alice']
+
+        db.close()
+
+    @pytest.mark.parametrize('engine', ['binary', 'json', 'csv'])
+    def test_readonly_reopen_skips_save(self, tmp_path, engine):
+        """只读打开后 commit/close 不会重写文件"""
+        db_path = tmp_path / f"test.{engine}"
+        db = Storage(file_path=str(db_path), engine=engine)
+
+        Base: Type[PureBaseModel] = declarative_base(db)
+
+        class User(Base):
+            __tablename__ = 'users'
+            id = Column(int, primary_key=True)
+            name = Column(str)
+
+        Session(db).execute(insert(User).values(id=1, name='Alice'))
+        db.close()
+
+        db2 = Storage(file_path=str(db_path), engine=engine, auto_flush=True)
+        saves = []
+        db2.backend.save = lambda tables: saves.append(tables)
+
+        Base2: Type[PureBaseModel] = declarative_base(db2)
+
+        class User2(Base2):
+            __tablename__ = 'users'
+            id = Column(int, primary_key=True)
+            name = Column(str)
+
+        session = Session(db2)
+        assert len(session.execute(select(User2)).all()) == 1
+        session.commit()
+        db2.close()
+
+        assert saves == []
+
+    def test_reload_in_transaction_raises(self, tmp_path):
+        """事务中调用 reload() 抛出 TransactionError"""
+        db = Storage(file_path=str(tmp_path / "test.db"))
+
+        with pytest.raises(TransactionError):
+            with db.transaction():
+                db.reload()
+
+        db.close()
+
 
 class TestSessionRecovery:
     """Session 恢复测试"""
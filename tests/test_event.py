@@ -299,6 +299,26 @@ class TestRemoveListener:
         # 不应抛出异常
         event.remove(User, 'before_insert', handler)
 
+    def test_remove_during_bulk_dispatch(self, session_setup: Any) -> None:
+        """回调中移除自身不影响本次分发的后续监听器"""
+        db, User, session = session_setup
+        called: List[str] = []
+
+        def once(instances: List[Any]) -> None:
+            called.append('once')
+            event.remove(User, 'before_bulk_insert', once)
+
+        def always(instances: List[Any]) -> None:
+            called.append('always')
+
+        event.listen(User, 'before_bulk_insert', once)
+        event.listen(User, 'before_bulk_insert', always)
+
+        session.bulk_insert([User(name='Alice', age=25)])
+        session.bulk_insert([User(name='Bob', age=30)])
+
+        assert called == ['once', 'always', 'always']
+
 
 # ============================================================================
 # Storage 级事件
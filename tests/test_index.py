@@ -138,6 +138,14 @@ class TestHashIndex:
         assert idx.lookup("Alice") == {1, 3}
         assert idx.lookup("Bob") == {2}
 
+    def test_bulk_insert(self) -> None:
+        """批量插入与逐条插入结果一致，None 值不索引"""
+        idx = HashIndex("name")
+        idx.bulk_insert([("Alice", 1), ("Bob", 2), (None, 3), ("Alice", 4)])
+        assert idx.lookup("Alice") == {1, 4}
+        assert idx.lookup("Bob") == {2}
+        assert len(idx) == 3
+
     def test_supports_range_query_false(self) -> None:
         """HashIndex 不支持范围查询"""
         idx = HashIndex("age")
@@ -186,6 +194,21 @@ class TestSortedIndex:
         assert idx.sorted_values.count(80) == 1
         assert len(idx) == 2
 
+    def test_bulk_insert_merges_into_sorted_values(self) -> None:
+        """批量插入的新值与已有值合并后整体有序，已有值只追加 pk"""
+        idx = SortedIndex("score")
+        idx.insert(50, 1)
+        idx.insert(20, 2)
+        idx.bulk_insert([(90, 3), (10, 4), (50, 5), (None, 6), (70, 7), (10, 8)])
+        assert idx.sorted_values == [10, 20, 50, 70, 90]
+        assert idx.lookup(10) == {4, 8}
+        assert idx.lookup(50) == {1, 5}
+        assert len(idx) == 7
+
+        # 只有一个新值时同样保持有序
+        idx.bulk_insert([(30, 9)])
+        assert idx.sorted_values == [10, 20, 30, 50, 70, 90]
+
     def test_remove_cleans_sorted_list(self) -> None:
         """删除最后 pk 后从 sorted_values 移除"""
         idx = SortedIndex("score")
@@ -205,6 +228,19 @@ class TestSortedIndex:
         assert idx.lookup(80) == {2}
         assert 80 in idx.sorted_values
 
+    def test_bulk_remove_filters_emptied_values(self) -> None:
+        """批量删除后变空的值从有序列表移除，仍有 pk 的值保留"""
+        idx = SortedIndex("score")
+        idx.bulk_insert([(10, 1), (20, 2), (20, 3), (30, 4), (40, 5)])
+        idx.bulk_remove([(10, 1), (20, 2), (40, 5), (99, 6)])
+        assert idx.sorted_values == [20, 30]
+        assert idx.lookup(20) == {3}
+        assert len(idx) == 2
+
+        # 只有一个值变空时同样正确移除
+        idx.bulk_remove([(30, 4)])
+        assert idx.sorted_values == [20]
+
     def test_remove_nonexistent(self) -> None:
         """删除不存在的不报错"""
         idx = SortedIndex("score")
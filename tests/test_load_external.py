@@ -5,8 +5,9 @@
 """
 
 import tempfile
+from datetime import datetime
 from pathlib import Path
-from typing import Type
+from typing import Any, Dict, List, Tuple, Type
 import pytest
 
 from pytuck import Storage, declarative_base, Column
@@ -15,6 +16,65 @@ from pytuck.tools import load_table
 from pytuck.common.exceptions import ValidationError
 
 
+# Excel 模板：文件名 -> [(工作表名, 行列表)]，第一个工作表为默认工作表
+XLSX_TEMPLATES: Dict[str, List[Tuple[str, List[List[Any]]]]] = {
+    'users': [('Sheet', [
+        ['id', 'name', 'age'],
+        [1, 'Alice', 20],
+        [2, 'Bob', 25],
+    ])],
+    'multi_sheet': [
+        ('Sheet1', [['id', 'value'], [1, 'first']]),
+        ('Sheet2', [['id', 'value'], [2, 'second']]),
+    ],
+    'empty_sheet': [('Sheet1', [])],
+    'typed': [('Sheet', [
+        ['id', 'score', 'created'],
+        [1, 95.5, datetime(2024, 1, 15, 10, 30, 0)],
+    ])],
+    'column_name': [('Sheet', [
+        ['ID', 'Name', 'Age', 'Level Name'],  # 表头使用 Column.name 定义的名称
+        [1, 'Alice', 20, 'Beginner'],
+        [2, 'Bob', 25, 'Expert'],
+    ])],
+    'inventory': [('Sheet', [
+        ['id', 'item', 'quantity'],
+        [1, 'Widget', 100],
+        [2, 'Gadget', 50],
+        [3, 'Gizmo', 75],
+    ])],
+}
+
+
+def _write_xlsx(file_path: Path, sheets: List[Tuple[str, List[List[Any]]]]) -> None:
+    """按 [(工作表名, 行列表)] 写出 Excel 文件（write_only 模式，逐行流式写入）"""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    for title, rows in sheets:
+        ws = wb.create_sheet(title)
+        for row in rows:
+            ws.append(row)
+    wb.save(str(file_path))
+
+
+@pytest.fixture(scope='session')
+def xlsx_templates(tmp_path_factory: pytest.TempPathFactory) -> Dict[str, Path]:
+    """
+    整个测试会话只生成一次的 Excel 文件（未安装 openpyxl 时跳过）
+
+    load_table 只读取文件，测试可直接共用这些路径。
+    """
+    pytest.importorskip('openpyxl')
+
+    template_dir = tmp_path_factory.mktemp('xlsx')
+    paths: Dict[str, Path] = {}
+    for name, sheets in XLSX_TEMPLATES.items():
+        paths[name] = template_dir / f'{name}.xlsx'
+        _write_xlsx(paths[name], sheets)
+    return paths
+
+
 class TestLoadTableCSV:
     """测试 CSV 文件加载"""
 
@@ -205,30 +265,9 @@ class TestLoadTableCSV:
 class TestLoadTableExcel:
     """测试 Excel 文件加载"""
 
-    @pytest.fixture
-    def has_openpyxl(self) -> bool:
-        """检查是否安装了 openpyxl"""
-        try:
-            import openpyxl
-            return True
-        except ImportError:
-            return False
-
-    def test_load_basic_excel(self, tmp_path: Path, has_openpyxl: bool) -> None:
+    def test_load_basic_excel(self, xlsx_templates: Dict[str, Path]) -> None:
         """测试基本 Excel 加载"""
-        if not has_openpyxl:
-            pytest.skip("openpyxl not installed")
-
-        from openpyxl import Workbook
-
-        # 创建测试 Excel 文件
-        xlsx_file = tmp_path / "users.xlsx"
-        wb = Workbook()
-        ws = wb.active
-        ws.append(['id', 'name', 'age'])
-        ws.append([1, 'Alice', 20])
-        ws.append([2, 'Bob', 25])
-        wb.save(str(xlsx_file))
+        xlsx_file = xlsx_templates['users']
 
         # 创建模型
         db = Storage(in_memory=True)
@@ -249,29 +288,10 @@ class TestLoadTableExcel:
         assert users[0].name == 'Alice'
         assert users[0].age == 20
 
-    def test_load_specific_sheet(self, tmp_path: Path, has_openpyxl: bool) -> None:
+    def test_load_specific_sheet(self, xlsx_templates: Dict[str, Path]) -> None:
         """测试加载指定工作表"""
-        if not has_openpyxl:
-            pytest.skip("openpyxl not installed")
-
-        from openpyxl import Workbook
-
-        # 创建测试 Excel 文件（多个工作表）
-        xlsx_file = tmp_path / "data.xlsx"
-        wb = Workbook()
-
-        # 第一个工作表
-        ws1 = wb.active
-        ws1.title = 'Sheet1'
-        ws1.append(['id', 'value'])
-        ws1.append([1, 'first'])
-
-        # 第二个工作表
-        ws2 = wb.create_sheet('Sheet2')
-        ws2.append(['id', 'value'])
-        ws2.append([2, 'second'])
-
-        wb.save(str(xlsx_file))
+        # 多个工作表的 Excel 文件
+        xlsx_file = xlsx_templates['multi_sheet']
 
         # 创建模型
         db = Storage(in_memory=True)
@@ -289,17 +309,9 @@ class TestLoadTableExcel:
         assert data[0].id == 2
         assert data[0].value == 'second'
 
-    def test_sheet_not_found(self, tmp_path: Path, has_openpyxl: bool) -> None:
+    def test_sheet_not_found(self, xlsx_templates: Dict[str, Path]) -> None:
         """测试指定的工作表不存在"""
-        if not has_openpyxl:
-            pytest.skip("openpyxl not installed")
-
-        from openpyxl import Workbook
-
-        xlsx_file = tmp_path / "data.xlsx"
-        wb = Workbook()
-        wb.active.title = 'Sheet1'
-        wb.save(str(xlsx_file))
+        xlsx_file = xlsx_templates['empty_sheet']
 
         db = Storage(in_memory=True)
         Base: Type[PureBaseModel] = declarative_base(db)
@@ -313,20 +325,9 @@ class TestLoadTableExcel:
 
         assert "not found" in str(exc_info.value)
 
-    def test_excel_type_conversion(self, tmp_path: Path, has_openpyxl: bool) -> None:
+    def test_excel_type_conversion(self, xlsx_templates: Dict[str, Path]) -> None:
         """测试 Excel 原生类型转换"""
-        if not has_openpyxl:
-            pytest.skip("openpyxl not installed")
-
-        from openpyxl import Workbook
-        from datetime import datetime
-
-        xlsx_file = tmp_path / "data.xlsx"
-        wb = Workbook()
-        ws = wb.active
-        ws.append(['id', 'score', 'created'])
-        ws.append([1, 95.5, datetime(2024, 1, 15, 10, 30, 0)])
-        wb.save(str(xlsx_file))
+        xlsx_file = xlsx_templates['typed']
 
         db = Storage(in_memory=True)
         Base: Type[PureBaseModel] = declarative_base(db)
@@ -381,30 +382,10 @@ class TestLoadTableColumnName:
         assert users[1].user_age == 25
         assert users[1].level_name == 'Expert'
 
-    @pytest.fixture
-    def has_openpyxl(self) -> bool:
-        """检查是否安装了 openpyxl"""
-        try:
-            import openpyxl
-            return True
-        except ImportError:
-            return False
-
-    def test_excel_with_column_name(self, tmp_path: Path, has_openpyxl: bool) -> None:
+    def test_excel_with_column_name(self, xlsx_templates: Dict[str, Path]) -> None:
         """测试 Excel 文件使用 Column.name 作为表头"""
-        if not has_openpyxl:
-            pytest.skip("openpyxl not installed")
-
-        from openpyxl import Workbook
-
-        xlsx_file = tmp_path / "users.xlsx"
-        wb = Workbook()
-        ws = wb.active
         # 表头使用 Column.name 定义的名称
-        ws.append(['ID', 'Name', 'Age', 'Level Name'])
-        ws.append([1, 'Alice', 20, 'Beginner'])
-        ws.append([2, 'Bob', 25, 'Expert'])
-        wb.save(str(xlsx_file))
+        xlsx_file = xlsx_templates['column_name']
 
         db = Storage(in_memory=True)
         Base: Type[PureBaseModel] = declarative_base(db)
@@ -608,32 +589,11 @@ class TestLoadTableImport:
         assert db_employees[1].emp_id == 102
         assert db_employees[1].full_name == 'Jane Smith'
 
-    @pytest.fixture
-    def has_openpyxl(self) -> bool:
-        """检查是否安装了 openpyxl"""
-        try:
-            import openpyxl
-            return True
-        except ImportError:
-            return False
-
-    def test_import_excel_to_json_backend(self, tmp_path: Path, has_openpyxl: bool) -> None:
+    def test_import_excel_to_json_backend(self, tmp_path: Path, xlsx_templates: Dict[str, Path]) -> None:
         """测试将 Excel 数据导入到 JSON 后端"""
-        if not has_openpyxl:
-            pytest.skip("openpyxl not installed")
-
-        from openpyxl import Workbook
         from pytuck import Session, select
 
-        # 创建 Excel 文件
-        xlsx_file = tmp_path / "inventory.xlsx"
-        wb = Workbook()
-        ws = wb.active
-        ws.append(['id', 'item', 'quantity'])
-        ws.append([1, 'Widget', 100])
-        ws.append([2, 'Gadget', 50])
-        ws.append([3, 'Gizmo', 75])
-        wb.save(str(xlsx_file))
+        xlsx_file = xlsx_templates['inventory']
 
         # 创建 JSON 后端数据库
         json_file = tmp_path / "inventory.json"
@@ -252,7 +252,7 @@ class TestMigrateSqliteNativeWithTypes:
 
         # 3. 验证 JSON 数据
         db_json = Storage(file_path=str(json_file), engine='json')
-        record = list(db_json.tables['typed'].data.values())[0]
+        record = db_json.tables['typed'].data[1]  # 自增主键
 
         assert record['name'] == 'Alice'
         assert record['score'] == 95.5
@@ -8,6 +8,7 @@ SQLite 原生 SQL 模式专项测试
 - 原生模式与兼容模式行为一致性
 - Schema-only 加载验证
 - 多列排序
+- executemany 批量插入
 """
 
 from datetime import datetime, date, timedelta
@@ -21,6 +22,7 @@ from pytuck import (
     PureBaseModel, declarative_base,
     select, insert, update, delete
 )
+from pytuck.common.exceptions import ConfigurationError, ValidationError
 from pytuck.common.options import SqliteBackendOptions
 
 
@@ -51,6 +53,26 @@ class TestNativeSqlModeDefault:
 
         db.close()
 
+    def test_pragma_options_applied(self, tmp_path: Path) -> None:
+        """journal_mode / synchronous 选项在连接时以 PRAGMA 生效"""
+        db_file = tmp_path / 'test_pragma.sqlite'
+        options = SqliteBackendOptions(journal_mode='memory', synchronous='OFF')
+        db = Storage(file_path=str(db_file), engine='sqlite', backend_options=options)
+
+        connector = db.backend.get_connector()
+        assert connector.execute('PRAGMA journal_mode').fetchone()[0] == 'memory'
+        assert connector.execute('PRAGMA synchronous').fetchone()[0] == 0
+
+        db.close()
+
+    def test_invalid_pragma_option_raises(self, tmp_path: Path) -> None:
+        """不在白名单内的 PRAGMA 取值抛出 ConfigurationError"""
+        db_file = tmp_path / 'test_bad_pragma.sqlite'
+        options = SqliteBackendOptions(journal_mode='MEMORY; DROP TABLE x')
+
+        with pytest.raises(ConfigurationError):
+            Storage(file_path=str(db_file), engine='sqlite', backend_options=options)
+
 
 class TestNativeSqlAllTypes:
     """测试全部 10 种类型在原生 SQL 模式下的 CRUD"""
@@ -504,3 +526,88 @@ class TestNativeSqlMultiColumnOrderBy:
 
         session.close()
         db.close()
+
+
+class TestNativeSqlInsertMany:
+    """测试原生 SQL 模式下的 executemany 插入"""
+
+    def test_insert_many_mixed_columns(self, tmp_path: Path) -> None:
+        """不同列组合的行都能插入，且 next_id 跟随最大主键"""
+        db_file = tmp_path / 'test_insert_many.sqlite'
+        db = Storage(file_path=str(db_file), engine='sqlite')
+        Base: Type[PureBaseModel] = declarative_base(db)
+
+        class Item(Base):
+            __tablename__ = 'items'
+            id = Column(int, primary_key=True)
+            name = Column(str, name='Item Name')
+            price = Column(float, nullable=True)
+
+        session = Session(db)
+        result = session.execute(insert(Item), [
+            {'name': 'a', 'price': 1.5},
+            {'name': 'b'},
+            {'id': 10, 'name': 'c', 'price': 3.0},
+        ])
+        assert result.rowcount() == 3
+        assert db.get_table('items').next_id == 11
+
+        session.execute(insert(Item).values(name='d'))
+        session.commit()
+
+        items = session.execute(select(Item).order_by('id')).all()
+        assert [(i.id, i.name, i.price) for i in items] == [
+            (1, 'a', 1.5), (2, 'b', None), (10, 'c', 3.0), (11, 'd', None)
+        ]
+
+        session.close()
+        db.close()
+
+    def test_insert_many_keeps_row_order(self, tmp_path: Path) -> None:
+        """列组合交替出现时，主键仍按给定顺序分配，与内存模式一致"""
+        db_file = tmp_path / 'test_insert_many_order.sqlite'
+        db = Storage(file_path=str(db_file), engine='sqlite')
+        Base: Type[PureBaseModel] = declarative_base(db)
+
+        class Item(Base):
+            __tablename__ = 'items'
+            id = Column(int, primary_key=True)
+            name = Column(str)
+            price = Column(float, nullable=True)
+
+        session = Session(db)
+        session.execute(insert(Item), [
+            {'name': 'a', 'price': 1.5},
+            {'name': 'b'},
+            {'name': 'c', 'price': 3.0},
+            {'name': 'd'},
+        ])
+        session.commit()
+
+        items = session.execute(select(Item).order_by('id')).all()
+        assert [(i.id, i.name, i.price) for i in items] == [
+            (1, 'a', 1.5), (2, 'b', None), (3, 'c', 3.0), (4, 'd', None)
+        ]
+
+        session.close()
+        db.close()
+
+    def test_insert_many_validates_before_inserting(self, tmp_path: Path) -> None:
+        """任一行验证失败时不插入任何行"""
+        db_file = tmp_path / 'test_insert_many_invalid.sqlite'
+        db = Storage(file_path=str(db_file), engine='sqlite')
+        Base: Type[PureBaseModel] = declarative_base(db)
+
+        class Item(Base):
+            __tablename__ = 'items'
+            id = Column(int, primary_key=True)
+            qty = Column(int)
+
+        session = Session(db)
+        with pytest.raises(ValidationError):
+            session.execute(insert(Item), [{'qty': 1}, {'qty': 'not a number'}])
+
+        assert session.execute(select(Item)).all() == []
+
+        session.close()
+        db.close()
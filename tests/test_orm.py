@@ -200,6 +200,47 @@ class TestDeclarativeBase(unittest.TestCase):
         # 即使有 id 列，如果没有 primary_key=True，也是无主键模型
         self.assertIsNone(TestModel.__primary_key__)
 
+    def test_reflect_from_persisted_schema(self):
+        """测试重新打开数据库后从已持久化的表结构反射模型"""
+        Base = declarative_base(self.db)
+
+        class User(Base):
+            __tablename__ = 'reflect_users'
+            id = Column(int, primary_key=True)
+            name = Column(str, nullable=False, index=True)
+            lv = Column(str, name='level')
+
+        session = Session(self.db)
+        session.execute(insert(User).values(name='Alice', lv='admin'))
+        session.commit()
+        self.db.close()
+
+        self.db = Storage(file_path=self.db_path)
+        Base2 = declarative_base(self.db, crud=True)
+        Reflected = Base2.reflect('reflect_users')
+
+        self.assertTrue(issubclass(Reflected, Base2))
+        self.assertEqual(Reflected.__primary_key__, 'id')
+        self.assertEqual(set(Reflected.__columns__), {'id', 'name', 'level'})
+        self.assertFalse(Reflected.__columns__['name'].nullable)
+
+        alice = Reflected.get(1)
+        self.assertEqual(alice.name, 'Alice')
+        self.assertEqual(alice.level, 'admin')
+
+        # 已注册的模型直接复用，不重复构建
+        self.assertIs(Base2.reflect('reflect_users'), Reflected)
+
+    def test_reflect_errors(self):
+        """测试反射不存在的表或未绑定 Storage 的基类时报错"""
+        from pytuck.common.exceptions import TableNotFoundError
+
+        Base = declarative_base(self.db)
+        with self.assertRaises(TableNotFoundError):
+            Base.reflect('missing_table')
+        with self.assertRaises(SchemaError):
+            PureBaseModel.reflect('missing_table')
+
 
 class TestPureBaseModel(unittest.TestCase):
     """PureBaseModel 测试"""
@@ -770,6 +811,33 @@ class TestColumnNameMapping(unittest.TestCase):
         # 测试不存在的列名
         self.assertIsNone(User._column_to_attr_name('nonexistent'))
 
+    def test_column_name_mapping_per_model(self):
+        """测试列名映射在模型定义时按模型各自计算"""
+        Base = declarative_base(self.db)
+
+        class User(Base):
+            __tablename__ = 'users_mapping_a'
+            id = Column(int, primary_key=True)
+            lv = Column(str, name='level')
+
+        class Player(Base):
+            __tablename__ = 'users_mapping_b'
+            id = Column(int, primary_key=True)
+            rank = Column(str, name='level')
+
+        self.assertEqual(User.__column_names__, {'id': 'id', 'lv': 'level'})
+        self.assertEqual(Player.__column_attrs__, {'id': 'id', 'level': 'rank'})
+        self.assertEqual(User._column_to_attr_name('level'), 'lv')
+        self.assertEqual(Base.__column_attrs__, {})
+        self.assertTrue(User.__has_custom_column_names__)
+
+        class Plain(Base):
+            __tablename__ = 'users_mapping_plain'
+            id = Column(int, primary_key=True)
+            name = Column(str, name='name')
+
+        self.assertFalse(Plain.__has_custom_column_names__)
+
     def test_session_query_with_column_name(self):
         """测试 session.query() 正确使用 Column.name 映射"""
         Base = declarative_base(self.db)
@@ -462,6 +462,70 @@ class TestQueryChaining:
         session.close()
         db.close()
 
+    def test_chained_filters_evaluate_equality_first(self, tmp_path):
+        """链式条件按选择性评估：等值条件先短路，不再评估其后的 != 条件"""
+        db = Storage(file_path=str(tmp_path / "test.db"))
+
+        Base: Type[PureBaseModel] = declarative_base(db)
+
+        class User(Base):
+            __tablename__ = 'users'
+            id = Column(int, primary_key=True)
+            name = Column(str)
+            age = Column(int)
+
+        class CountingValue:
+            """记录 != 比较次数的比较值"""
+            calls = 0
+
+            def __ne__(self, other):
+                CountingValue.calls += 1
+                return True
+
+        session = Session(db)
+        for i in range(10):
+            session.execute(insert(User).values(id=i + 1, name=f'User{i}', age=20 + i))
+        session.commit()
+
+        users = session.execute(
+            select(User).where(User.age != CountingValue()).where(User.name == 'User3')
+        ).all()
+
+        assert [u.name for u in users] == ['User3']
+        # 只有通过等值条件的那一条记录才会评估 != 条件
+        assert CountingValue.calls == 1
+
+        session.close()
+        db.close()
+
+    def test_reexecute_statement_reuses_condition(self, tmp_path):
+        """同一语句重复执行时复用已编译的条件，结果随数据变化"""
+        db = Storage(file_path=str(tmp_path / "test.db"))
+
+        Base: Type[PureBaseModel] = declarative_base(db)
+
+        class User(Base):
+            __tablename__ = 'users'
+            id = Column(int, primary_key=True)
+            age = Column(int)
+
+        session = Session(db)
+        session.execute(insert(User), [{'age': 20}, {'age': 30}])
+        session.commit()
+
+        expr = User.age >= 25
+        assert expr.to_condition() is expr.to_condition()
+
+        stmt = select(User).where(expr)
+        assert len(session.execute(stmt).all()) == 1
+
+        session.execute(insert(User).values(age=40))
+        session.commit()
+        assert len(session.execute(stmt).all()) == 2
+
+        session.close()
+        db.close()
+
 
 class TestComplexQueries:
     """复杂查询测试"""
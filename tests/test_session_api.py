@@ -22,7 +22,7 @@ from pytuck import (
     declarative_base, PureBaseModel,
     select, insert, update, delete,
 )
-from pytuck.common.exceptions import QueryError
+from pytuck.common.exceptions import QueryError, ValidationError
 
 
 class TestSessionAPI(unittest.TestCase):
@@ -76,6 +76,43 @@ class TestSessionAPI(unittest.TestCase):
         users = result.all()
         self.assertEqual(len(users), 3)
 
+    def test_insert_many_params(self) -> None:
+        """测试以多行参数执行同一 INSERT 语句"""
+        data = [
+            {'name': 'Alice', 'age': 20},
+            {'name': 'Bob', 'age': 25, 'email': 'bob@example.com'},
+            {'name': 'Charlie'},
+        ]
+
+        result = self.session.execute(insert(self.User).values(age=30), data)
+        self.session.commit()
+
+        self.assertEqual(result.rowcount(), 3)
+        self.assertIsNone(result.inserted_primary_key)
+
+        users = self.session.execute(select(self.User).order_by('id')).all()
+        self.assertEqual([u.name for u in users], ['Alice', 'Bob', 'Charlie'])
+        # 行参数覆盖 values() 中的公共值
+        self.assertEqual([u.age for u in users], [20, 25, 30])
+        self.assertEqual(users[1].email, 'bob@example.com')
+
+    def test_insert_many_params_all_or_nothing(self) -> None:
+        """测试多行参数中任一行验证失败时不插入任何行"""
+        data = [
+            {'name': 'Alice', 'age': 20},
+            {'name': None, 'age': 25},
+        ]
+
+        with self.assertRaises(ValidationError):
+            self.session.execute(insert(self.User), data)
+
+        self.assertEqual(self.db.count_rows('users'), 0)
+
+    def test_insert_many_params_rejected_for_select(self) -> None:
+        """测试非 INSERT 语句不接受多行参数"""
+        with self.assertRaises(QueryError):
+            self.session.execute(select(self.User), [{'name': 'Alice'}])
+
     def test_select_all(self) -> None:
         """测试查询所有记录"""
         # 插入数据
@@ -291,6 +291,24 @@ class TestValidationInInsertUpdate(unittest.TestCase):
         self.assertEqual(user.name, '123')
         self.assertEqual(user.age, 30)
 
+    def test_default_value_conversion(self) -> None:
+        """测试默认值与列类型不一致时仍经过验证转换"""
+        Base: Type[PureBaseModel] = declarative_base(self.db)
+
+        class Item(Base):
+            __tablename__ = 'items'
+            id = Column(int, primary_key=True)
+            qty = Column(int, default='3')
+            label = Column(str, default='none')
+            flag = Column(int, default=True)
+
+        with self.assertRaises(ValidationError):
+            Item()
+
+        item = Item(flag=0)
+        self.assertEqual(item.qty, 3)
+        self.assertEqual(item.label, 'none')
+
 
 class TestBoolConversionEdgeCases(unittest.TestCase):
     """布尔值转换边界测试"""